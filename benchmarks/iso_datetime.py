@@ -0,0 +1,42 @@
+"""
+Measures ISO-8601 parsers against a corpus of timestamp shapes seen in event payloads.
+
+    python -m benchmarks.iso_datetime [--number N]
+"""
+import argparse
+import timeit
+
+from gata.iso_datetime import parse_iso_date_string
+from gata.iso_datetime import parse_iso_datetime_string
+from gata.iso_datetime import parse_iso_duration_string
+from gata.iso_datetime import parse_iso_time_string
+
+CORPUS = {
+    parse_iso_datetime_string: [
+        "2016-09-18T17:34:02",
+        "2016-09-18T17:34:02Z",
+        "2016-09-18T17:34:02.124Z",
+        "2016-09-18T17:34:02.124567+02:00",
+        "2016-09-18 17:34:02-05:30",
+        "2016-09-18T17:34:02.1234567Z",
+        "20160918T173402Z",
+    ],
+    parse_iso_date_string: ["2016-09-18", "20160918"],
+    parse_iso_time_string: ["17:34:02", "17:34:02.124Z", "17:34:02.5+02:00", "173402"],
+    parse_iso_duration_string: ["P1W", "PT2M30S", "P1W2DT3H4M5.5S"],
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for parse, values in CORPUS.items():
+        for value in values:
+            seconds = timeit.timeit(lambda: parse(value), number=args.number)
+            print(f"{parse.__name__:<28} {value:<36} {seconds / args.number * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,17 @@
+from .bulk import deserialise_many
+from .csv_support import read_csv
+from .csv_support import write_csv
 from .dataclass import Dataclass
 from .dataclasses import Field
 from .dataclasses import asdict
 from .dataclasses import dataclass
+from .dataclasses import diff
+from .dataclasses import dump
+from .dataclasses import dumps
 from .dataclasses import field
+from .dataclasses import replace
 from .dataclasses import validate_dataclass
+from .profile import Profile
 from .stringformat import StringFormat
 from .types import Type
 from .validator import Validator
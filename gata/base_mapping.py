@@ -1,16 +1,27 @@
 from abc import ABC
 from typing import Any
+from typing import ClassVar
 from typing import Dict
+from typing import FrozenSet
 from typing import Optional
 from typing import Union
 
+from .profile import Profile
+
 
 class Mapping(ABC):
+    # profiles in which values are serialised as they are, class variables are left alone by `__init__`
+    native_profiles: ClassVar[FrozenSet[Profile]] = frozenset()
+    # type of validated values, unions dispatch values of exactly this type to the mapping first
+    python_type: ClassVar[Optional[type]] = None
+
     def __init__(self, **kwargs):
         if not hasattr(self, "__annotations__"):
             return
 
         for property_name, property_type in self.__annotations__.items():
+            if getattr(property_type, "__origin__", None) is ClassVar:
+                continue
             if property_name in kwargs:
                 setattr(self, property_name, kwargs[property_name])
                 continue
@@ -24,3 +35,10 @@ class Mapping(ABC):
 
     def deserialise(self, value: Any) -> Any:
         return value
+
+
+def serialisation_profile(mapping: Any) -> Optional[Profile]:
+    if isinstance(mapping, dict):
+        return mapping.get("$profile")
+
+    return None
@@ -5,6 +5,7 @@ from typing import Union
 
 from .base_mapping import Mapping
 from .errors import FormatValidationError
+from .profile import Profile
 from .stringformat import StringFormat
 
 BSON_SUPPORT = True
@@ -24,7 +25,13 @@ if BSON_SUPPORT:
         except Exception:
             raise FormatValidationError(expected_format=StringFormat.OBJECT_ID)
 
+    def to_decimal128(value: Any) -> bson.Decimal128:
+        return bson.Decimal128(value)
+
     class ObjectIdMapping(Mapping):
+        native_profiles = frozenset([Profile.PYTHON, Profile.BSON])
+        python_type = bson.ObjectId
+
         def validate(self, value: Any) -> Any:
             return validate_object_id(value)
 
@@ -0,0 +1,92 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Type
+
+from gata import numpy_support
+from .dataclasses import Projection
+from .dataclasses import _dataclass_construct
+from .mapping import DateMapping
+from .mapping import DateTimeMapping
+from .mapping import TimeMapping
+from .mapping import TimedeltaMapping
+from .mapping import non_optional_mapping
+from .utils import is_gataclass
+
+__all__ = ["deserialise_many"]
+
+# columns with fewer distinct values are parsed one by one, numpy does not pay off for them
+NUMPY_THRESHOLD = 64
+
+_TEMPORAL_MAPPINGS = (DateMapping, DateTimeMapping, TimeMapping, TimedeltaMapping)
+
+ColumnParser = Callable[[List[str]], Dict[str, Any]]
+
+
+def deserialise_many(
+    cls: Type[Any], items: Iterable[Dict[str, Any]], fields: Projection = None, exclude: Projection = None
+) -> List[Any]:
+    """
+    Builds dataclass instances from many mappings at once. Date, datetime, time and duration strings are parsed
+    column-wise: each distinct string is parsed once and columns of canonical naive datetimes and dates are
+    parsed with numpy when it is installed. Invalid strings are left for the regular validation, which reports them.
+    """
+    if not is_gataclass(cls) or not hasattr(cls, "deserialise"):
+        raise TypeError(f"deserialise_many() should be called with gata dataclass, {cls!r} passed instead")
+
+    records = [dict(item) for item in items]
+    for name, parse_column in _column_parsers(cls):
+        column = [record[name] for record in records if record.get(name).__class__ is str]
+        if not column:
+            continue
+        parsed = parse_column(column)
+        for record in records:
+            value = record.get(name)
+            if value.__class__ is str and value in parsed:
+                record[name] = parsed[value]
+
+    return [_dataclass_construct(cls, record, fields, exclude) for record in records]
+
+
+def _column_parsers(cls: Any) -> List[Tuple[str, ColumnParser]]:
+    if "__gata_column_parsers__" not in cls.__dict__:
+        parsers = []
+        for name, field in cls.__gata_schema__:
+            if field._deserialiser is not None or field._validator is not None:
+                continue
+            mapping = non_optional_mapping(field._type)
+            if isinstance(mapping, _TEMPORAL_MAPPINGS):
+                parsers.append((name, _column_parser(mapping)))
+        setattr(cls, "__gata_column_parsers__", parsers)
+
+    return cls.__dict__["__gata_column_parsers__"]
+
+
+def _column_parser(mapping: Any) -> ColumnParser:
+    parse = mapping.parser
+    numpy_parse: Any = None
+    if numpy_support.NUMPY_SUPPORT and isinstance(mapping, DateTimeMapping):
+        numpy_parse = numpy_support.parse_datetime_column
+    elif numpy_support.NUMPY_SUPPORT and isinstance(mapping, DateMapping):
+        numpy_parse = numpy_support.parse_date_column
+
+    def parse_column(values: List[str]) -> Dict[str, Any]:
+        unique = list(dict.fromkeys(values))
+        if numpy_parse is not None and len(unique) >= NUMPY_THRESHOLD:
+            results = numpy_parse(unique)
+            if results is not None:
+                return dict(zip(unique, results))
+
+        parsed = {}
+        for value in unique:
+            try:
+                parsed[value] = parse(value)
+            except ValueError:
+                pass
+
+        return parsed
+
+    return parse_column
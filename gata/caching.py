@@ -0,0 +1,202 @@
+from copy import copy
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .errors import ValidationError
+from .iso_datetime import parse_iso_date_string
+from .iso_datetime import parse_iso_datetime_string
+from .iso_datetime import parse_iso_duration_string
+from .iso_datetime import parse_iso_time_string
+from .iso_datetime import timedelta_to_iso_string
+
+__all__ = [
+    "CacheStats",
+    "CachedFunction",
+    "CachedValidator",
+    "cache_stats",
+    "clear_caches",
+    "configure_caches",
+    "get_cache",
+    "validation_cache",
+]
+
+DEFAULT_CACHE_SIZE = 4096
+
+# `None` follows global configuration, `True` enables cache of default size, number sets the size, `False` disables it
+CacheOption = Optional[Union[bool, int]]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class CachedFunction:
+    """
+    Calls single argument function through bounded LRU cache, function is called directly when cache size is 0
+    or when value is not an instance of exactly `value_type`. Offset sensitive functions are cached per value
+    and its utc offset, because aware datetimes and times representing the same instant are equal even
+    if their offsets differ.
+    """
+
+    def __init__(
+        self, function: Callable[[Any], Any], maxsize: int = 0, value_type: type = str, offset_sensitive: bool = False
+    ):
+        self.function = function
+        self.value_type: Any = value_type
+        self.offset_sensitive = offset_sensitive
+        self.maxsize = 0
+        self._call: Callable[..., Any] = function
+        self.resize(maxsize)
+
+    def __call__(self, value: Any) -> Any:
+        if not self.maxsize or value.__class__ is not self.value_type:
+            return self.function(value)
+        if self.offset_sensitive:
+            return self._call(value, value.utcoffset())
+
+        return self._call(value)
+
+    def resize(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        if not maxsize:
+            self._call = self.function
+        elif self.offset_sensitive:
+            self._call = lru_cache(maxsize)(_ignore_offset(self.function))
+        else:
+            self._call = lru_cache(maxsize)(self.function)
+
+    def cache_info(self) -> CacheStats:
+        if not self.maxsize:
+            return CacheStats(0, 0, 0, 0)
+
+        return CacheStats(*self._call.cache_info())  # type: ignore
+
+    def cache_clear(self) -> None:
+        if self.maxsize:
+            self._call.cache_clear()  # type: ignore
+
+
+class CachedValidator(CachedFunction):
+    """
+    Memoises outcomes of pure validation function for values of exactly one of `value_types`, including validation
+    errors which are raised again as copies. Values are cached by type as well, so `1` and `True` do not share
+    the outcome.
+    """
+
+    def __init__(self, function: Callable[[Any], Any], maxsize: int = 0, value_types: Iterable[type] = (str,)):
+        self.value_types = frozenset(value_types)
+        super().__init__(function, maxsize)
+
+    def __call__(self, value: Any) -> Any:
+        if not self.maxsize or value.__class__ not in self.value_types:
+            return self.function(value)
+        result, error = self._call(value)
+        if error is not None:
+            raise copy(error)
+
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        if maxsize:
+            self._call = lru_cache(maxsize, typed=True)(_outcome(self.function))
+        else:
+            self._call = self.function
+
+
+def _outcome(function: Callable[[Any], Any]) -> Callable[[Any], Tuple[Any, Optional[ValidationError]]]:
+    def call(value: Any) -> Tuple[Any, Optional[ValidationError]]:
+        try:
+            return function(value), None
+        except ValidationError as error:
+            return None, error
+
+    return call
+
+
+def _ignore_offset(function: Callable[[Any], Any]) -> Callable[[Any, Any], Any]:
+    def call(value: Any, offset: Any) -> Any:
+        return function(value)
+
+    return call
+
+
+def _isoformat(value: Any) -> str:
+    return value.isoformat()
+
+
+_FUNCTIONS: Dict[str, Callable[[int], CachedFunction]] = {
+    "parse_date": lambda maxsize: CachedFunction(parse_iso_date_string, maxsize),
+    "parse_datetime": lambda maxsize: CachedFunction(parse_iso_datetime_string, maxsize),
+    "parse_time": lambda maxsize: CachedFunction(parse_iso_time_string, maxsize),
+    "parse_duration": lambda maxsize: CachedFunction(parse_iso_duration_string, maxsize),
+    "format_date": lambda maxsize: CachedFunction(_isoformat, maxsize, date),
+    "format_datetime": lambda maxsize: CachedFunction(_isoformat, maxsize, datetime, offset_sensitive=True),
+    "format_time": lambda maxsize: CachedFunction(_isoformat, maxsize, time, offset_sensitive=True),
+    "format_duration": lambda maxsize: CachedFunction(timedelta_to_iso_string, maxsize, timedelta),
+}
+
+# caches used by fields which do not set `cache` option, disabled until `configure_caches` is called
+_GLOBAL_CACHES: Dict[str, CachedFunction] = {name: factory(0) for name, factory in _FUNCTIONS.items()}
+
+
+def configure_caches(maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+    """
+    Sets size of global parse and format caches, 0 disables them. Resizing clears cached values and statistics.
+    """
+    for cache in _GLOBAL_CACHES.values():
+        cache.resize(maxsize)
+
+
+def get_cache(name: str, option: CacheOption = None) -> CachedFunction:
+    if name not in _FUNCTIONS:
+        raise ValueError(f"unknown cache {name}, available caches: {', '.join(_FUNCTIONS)}")
+    if option is None:
+        return _GLOBAL_CACHES[name]
+    if option is True:
+        return _FUNCTIONS[name](DEFAULT_CACHE_SIZE)
+
+    return _FUNCTIONS[name](int(option))
+
+
+def validation_cache(
+    function: Callable[[Any], Any], option: CacheOption = None, value_types: Iterable[type] = (str,)
+) -> CachedValidator:
+    """
+    Validation caches are kept per field and enabled only by its `cache` option, validators are not affected
+    by `configure_caches`.
+    """
+    if option is None or option is False:
+        return CachedValidator(function, 0, value_types)
+    if option is True:
+        return CachedValidator(function, DEFAULT_CACHE_SIZE, value_types)
+
+    return CachedValidator(function, int(option), value_types)
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    return {name: cache.cache_info() for name, cache in _GLOBAL_CACHES.items()}
+
+
+def clear_caches() -> None:
+    for cache in _GLOBAL_CACHES.values():
+        cache.cache_clear()
@@ -0,0 +1,314 @@
+import csv
+import json
+import os
+from itertools import chain
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from .dataclasses import _dataclass_construct
+from .dataclasses import build_schema
+from .errors import RowError
+from .errors import ValidationError
+from .mapping import BooleanMapping
+from .mapping import DictMapping
+from .mapping import EnumTypeMapping
+from .mapping import FloatMapping
+from .mapping import FrozenSetMapping
+from .mapping import GataclassMapping
+from .mapping import IntegerMapping
+from .mapping import ListMapping
+from .mapping import Mapping
+from .mapping import NoneMapping
+from .mapping import SetMapping
+from .mapping import StringMapping
+from .mapping import TupleMapping
+from .mapping import TypedDictMapping
+from .mapping import UnionMapping
+from .mapping import non_optional_mapping
+from .schema import Field
+from .utils import is_gataclass
+from .validators import FALSY_EXPRESSION
+from .validators import TRUTHY_EXPRESSION
+
+__all__ = ["read_csv", "write_csv"]
+
+BUFFER_SIZE = 1024 * 1024
+
+CsvSource = Union[str, os.PathLike, IO[str]]
+
+_ITERABLE_MAPPINGS = (ListMapping, SetMapping, FrozenSetMapping)
+# values of these mappings are written to and read from a single cell as json documents
+_JSON_MAPPINGS = (GataclassMapping, TupleMapping, DictMapping, TypedDictMapping)
+
+
+class _Column:
+    def __init__(self, path: Tuple[str, ...], field: Field, list_delimiter: str, required_parents: int):
+        self.name = ".".join(path)
+        self.path = path
+        self.parents = path[:-1]
+        self.key = path[-1]
+        self.field = field
+        # number of leading parents which are not optional, they are created for empty values of the column
+        self.required_parents = required_parents
+        self.from_text = _text_reader(field, list_delimiter)
+        self.empty = _empty_reader(field)
+        self.to_text = _text_writer(field, list_delimiter)
+
+
+def read_csv(
+    cls: Type[Any], source: CsvSource, list_delimiter: str = "|", encoding: str = "utf8", **fmtparams: Any
+) -> Iterator[Any]:
+    """
+    Streams instances of the dataclass from csv file or path, first row has to contain column names.
+    Nested dataclasses are read from dotted columns (eg. `artist.name`), lists from cells joined with
+    `list_delimiter`, unknown columns are ignored. Rows failing validation raise `RowError` with line number.
+    """
+    if not is_gataclass(cls) or not hasattr(cls, "deserialise"):
+        raise TypeError(f"read_csv() should be called with gata dataclass, {cls!r} passed instead")
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", newline="", encoding=encoding, buffering=BUFFER_SIZE) as fp:
+            yield from read_csv(cls, fp, list_delimiter, encoding, **fmtparams)
+        return
+
+    columns = {column.name: column for column in _columns(cls, list_delimiter)}
+    reader = csv.reader(source, **fmtparams)
+    header = next(reader, None)
+    if header is None:
+        return
+    row_columns = [columns.get(name) for name in header]
+
+    for record in reader:
+        row: Dict[str, Any] = {}
+        empty_columns = []
+        for column, text in zip(row_columns, record):
+            if column is None:
+                continue
+            if text == "":
+                if column.empty is not None:
+                    empty_columns.append(column)
+                continue
+            value = column.from_text(text)
+            if value is None:
+                continue
+            target = row
+            for part in column.parents:
+                target = target[part] if part in target else target.setdefault(part, {})
+            target[column.key] = value
+        # empty values are set once it is known which optional nested objects are present in the row
+        for column in empty_columns:
+            _set_empty_value(row, column)
+        try:
+            yield _dataclass_construct(cls, row)
+        except ValidationError as error:
+            raise RowError(reader.line_num, error) from error
+
+
+def _set_empty_value(row: Dict[str, Any], column: _Column) -> None:
+    target = row
+    for index, part in enumerate(column.parents):
+        if part not in target:
+            if index >= column.required_parents:
+                return
+            target[part] = {}
+        target = target[part]
+    target[column.key] = column.empty()  # type: ignore
+
+
+def write_csv(
+    items: Iterable[Any],
+    destination: CsvSource,
+    cls: Optional[Type[Any]] = None,
+    list_delimiter: str = "|",
+    encoding: str = "utf8",
+    **fmtparams: Any,
+) -> None:
+    """
+    Writes dataclasses into csv file or path using the same layout `read_csv` accepts. When `cls` is not passed
+    class of the first item is used.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "w", newline="", encoding=encoding, buffering=BUFFER_SIZE) as fp:
+            write_csv(items, fp, cls, list_delimiter, encoding, **fmtparams)
+        return None
+
+    items = iter(items)
+    if cls is None:
+        first = next(items, None)
+        if first is None:
+            return None
+        cls = first.__class__
+        items = chain([first], items)
+
+    columns = _columns(cls, list_delimiter)
+    writer = csv.writer(destination, **fmtparams)
+    writer.writerow([column.name for column in columns])
+    writer.writerows([_column_text(item, column) for column in columns] for item in items)
+
+
+def _column_text(item: Any, column: _Column) -> str:
+    value = item
+    for part in column.path:
+        value = getattr(value, part)
+        if value is None:
+            return ""
+
+    return column.to_text(value)
+
+
+def _columns(cls: Type[Any], list_delimiter: str) -> List[_Column]:
+    cache_key = f"__gata_csv_columns_{list_delimiter}__"
+    if cache_key not in cls.__dict__:
+        schema = cls.__gata_schema__ if is_gataclass(cls) else build_schema(cls)
+        setattr(cls, cache_key, _build_columns(schema, (), list_delimiter, [cls]))
+
+    return cls.__dict__[cache_key]
+
+
+def _build_columns(
+    schema: Any, prefix: Tuple[str, ...], list_delimiter: str, parents: List[Any], required_parents: int = 0
+) -> List[_Column]:
+    columns = []
+    for name, field in schema:
+        nested = _nested_dataclass(field)
+        if nested is not None and nested not in parents:
+            path = prefix + (name,)
+            required = len(path) if required_parents == len(prefix) and not field.is_optional else required_parents
+            columns.extend(_build_columns(nested.__gata_schema__, path, list_delimiter, parents + [nested], required))
+        else:
+            columns.append(_Column(prefix + (name,), field, list_delimiter, required_parents))
+
+    return columns
+
+
+def _nested_dataclass(field: Field) -> Any:
+    if field._serialiser is not None or field._deserialiser is not None:
+        return None
+    mapping = non_optional_mapping(field._type)
+    if isinstance(mapping, GataclassMapping):
+        return mapping.dataclass
+
+    return None
+
+
+def _text_reader(field: Field, list_delimiter: str) -> Callable[[str], Any]:
+    mapping = non_optional_mapping(field._type)
+    if field._deserialiser is not None:
+        convert: Callable[[str], Any] = _identity
+    elif isinstance(mapping, _ITERABLE_MAPPINGS) and not _is_json_column(mapping):
+        item_convert = _scalar_reader(mapping.items[0] if mapping.items else None)
+
+        def convert(text: str) -> Any:
+            return [item_convert(item) for item in text.split(list_delimiter)]
+
+    elif _is_json_column(mapping):
+        convert = json.loads
+    else:
+        convert = _scalar_reader(mapping)
+
+    return convert
+
+
+def _empty_reader(field: Field) -> Optional[Callable[[], Any]]:
+    """
+    Empty cells of required strings and lists are read as empty values, otherwise they are missing.
+    """
+    if field.is_optional:
+        return None
+    mapping = non_optional_mapping(field._type)
+    if isinstance(mapping, StringMapping):
+        return str
+    if isinstance(mapping, _ITERABLE_MAPPINGS):
+        return list
+
+    return None
+
+
+def _scalar_reader(mapping: Optional[Mapping]) -> Callable[[str], Any]:
+    if isinstance(mapping, IntegerMapping) or getattr(mapping, "epoch", None):
+        return _parse_number(int)
+    if isinstance(mapping, FloatMapping):
+        return _parse_number(float)
+    if isinstance(mapping, BooleanMapping):
+        return _parse_boolean
+    if isinstance(mapping, EnumTypeMapping):
+        values = {str(member.value): member.value for member in mapping.enum_type}
+        return lambda text: values.get(text, text)
+    if isinstance(mapping, UnionMapping):
+        readers = [_scalar_reader(item) for item in mapping.items if not isinstance(item, NoneMapping)]
+        return lambda text: next((value for value in (read(text) for read in readers) if value is not text), text)
+
+    return _identity
+
+
+def _parse_number(number_type: Callable[[str], Any]) -> Callable[[str], Any]:
+    def parse(text: str) -> Any:
+        try:
+            return number_type(text)
+        except ValueError:
+            # invalid value is left for validation to report
+            return text
+
+    return parse
+
+
+def _parse_boolean(text: str) -> Any:
+    value = text.strip().lower()
+    if value in TRUTHY_EXPRESSION:
+        return True
+    if value in FALSY_EXPRESSION:
+        return False
+
+    return text
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+def _text_writer(field: Field, list_delimiter: str) -> Callable[[Any], str]:
+    mapping = non_optional_mapping(field._type)
+    if field._serialiser is None and isinstance(mapping, _ITERABLE_MAPPINGS) and not _is_json_column(mapping):
+        item_mapping = mapping.items[0] if mapping.items else None
+
+        def write(value: Any) -> str:
+            if item_mapping is None:
+                return list_delimiter.join(_scalar_text(item) for item in value)
+            return list_delimiter.join(_scalar_text(item_mapping.serialise(item)) for item in value)
+
+        return write
+
+    if field._serialiser is None and _is_json_column(mapping):
+        return lambda value: json.dumps(field.serialise(value))
+
+    return lambda value: _scalar_text(field.serialise(value))
+
+
+def _scalar_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+
+    return str(value)
+
+
+def _is_json_column(mapping: Mapping) -> bool:
+    if isinstance(mapping, _JSON_MAPPINGS):
+        return True
+    if isinstance(mapping, _ITERABLE_MAPPINGS) and mapping.items:
+        return isinstance(non_optional_mapping(mapping.items[0]), _JSON_MAPPINGS + _ITERABLE_MAPPINGS)
+
+    return False
@@ -1,22 +1,47 @@
 from typing import Any
 from typing import Dict
 from typing import ItemsView
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
 
+from .dataclasses import JsonBackendOption
+from .dataclasses import ProfileOption
+from .dataclasses import Projection
 from .dataclasses import _dataclass_method_deserialise
 from .dataclasses import _dataclass_method_eq
+from .dataclasses import _dataclass_method_from_json
+from .dataclasses import _dataclass_method_from_msgpack
 from .dataclasses import _dataclass_method_frozen_getattr
 from .dataclasses import _dataclass_method_frozen_setattr
 from .dataclasses import _dataclass_method_init
+from .dataclasses import _dataclass_method_reduce_ex
 from .dataclasses import _dataclass_method_repr
 from .dataclasses import _dataclass_method_serialise
+from .dataclasses import _dataclass_method_to_json
+from .dataclasses import _dataclass_method_to_msgpack
 from .dataclasses import _dataclass_method_validate
 from .dataclasses import build_schema
+from .dataclasses import make_lazy
+from .dataclasses import make_memoised
+from .dataclasses import make_tagged
+from .dataclasses import make_tracked
+from .json_support import JsonInput
+from .msgpack_support import MsgpackInput
 from .schema import Schema
 
+if TYPE_CHECKING:
+    from typing_extensions import SupportsIndex
+
 
 class Dataclass:
     __frozen__: bool = False
     __validate__: bool = True
+    __lazy__: bool = False
+    __track_changes__: bool = False
+    __memoise__: bool = False
+    __gata_custom_init__: bool = False
     __gata_schema__: Schema
     __frozen_dict__: Dict[str, Any]
 
@@ -24,8 +49,12 @@ class Dataclass:
     def __init_subclass__(cls, **kwargs):
         cls.__frozen__ = kwargs.get("frozen", False)
         cls.__validate__ = kwargs.get("validate", True)
+        cls.__lazy__ = kwargs.get("lazy", False)
+        cls.__track_changes__ = kwargs.get("track_changes", False)
+        cls.__memoise__ = kwargs.get("memoise", False)
         cls.__gata_schema__ = build_schema(cls)
         cls.__class_name__ = cls.__qualname__
+        cls.__gata_custom_init__ = cls.__init__ is not Dataclass.__init__
 
         if kwargs.get("repr", True):
             setattr(cls, "__repr__", _dataclass_method_repr)
@@ -38,20 +67,62 @@ class Dataclass:
             setattr(cls, "__setattr__", _dataclass_method_frozen_setattr)
             setattr(cls, "__getattr__", _dataclass_method_frozen_getattr)
 
+        if cls.__lazy__:
+            make_lazy(cls)
+
+        if cls.__track_changes__:
+            make_tracked(cls)
+
+        if cls.__memoise__:
+            make_memoised(cls)
+
+        make_tagged(cls, kwargs.get("discriminator"), kwargs.get("tag"))
+
     def __init__(self, *args, **kwargs):
         new_args = (self, *args)
         _dataclass_method_init(*new_args, **kwargs)
 
-    def serialise(self, **mapping) -> Dict[str, Any]:
-        return _dataclass_method_serialise(self, **mapping)
+    def serialise(
+        self, fields: Projection = None, exclude: Projection = None, profile: ProfileOption = None, **mapping
+    ) -> Dict[str, Any]:
+        return _dataclass_method_serialise(self, fields, exclude, profile, **mapping)
+
+    def to_json(self, binary: bool = False, backend: JsonBackendOption = None) -> Union[str, bytes]:
+        return _dataclass_method_to_json(self, binary, backend)
+
+    def to_msgpack(self, backend: Optional[str] = None) -> bytes:
+        return _dataclass_method_to_msgpack(self, backend)
 
     @classmethod
     def validate(cls, data: Dict[str, Any]) -> None:
         _dataclass_method_validate(cls, value=data)  # type: ignore
 
     @classmethod
-    def deserialise(cls, value: Dict[str, Any]) -> "Dataclass":
-        return _dataclass_method_deserialise(cls, value=value)
+    def deserialise(cls, value: Dict[str, Any], fields: Projection = None, exclude: Projection = None) -> "Dataclass":
+        return _dataclass_method_deserialise(cls, value, fields, exclude)
+
+    @classmethod
+    def from_json(
+        cls,
+        data: JsonInput,
+        fields: Projection = None,
+        exclude: Projection = None,
+        backend: JsonBackendOption = None,
+    ) -> "Dataclass":
+        return _dataclass_method_from_json(cls, data, fields, exclude, backend)
+
+    @classmethod
+    def from_msgpack(
+        cls,
+        data: MsgpackInput,
+        fields: Projection = None,
+        exclude: Projection = None,
+        backend: Optional[str] = None,
+    ) -> "Dataclass":
+        return _dataclass_method_from_msgpack(cls, data, fields, exclude, backend)
+
+    def __reduce_ex__(self, protocol: "SupportsIndex") -> Tuple[Any, ...]:
+        return _dataclass_method_reduce_ex(self, protocol)
 
     def __iter__(self) -> ItemsView[str, Any]:  # type: ignore
         for key, value in self.serialise().items():
@@ -2,6 +2,8 @@ import datetime
 import ipaddress
 import uuid
 from abc import ABC
+from collections import abc
+from copy import copy
 from dataclasses import Field as DataclassesField
 from decimal import Decimal
 from enum import Enum
@@ -11,17 +13,31 @@ from typing import AnyStr
 from typing import ByteString
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import IO
 from typing import ItemsView
+from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Pattern
+from typing import Set
 from typing import Tuple
 from typing import Type
+from typing import TYPE_CHECKING
+from typing import TypeVar
 from typing import Union
+from typing import get_type_hints
+
+from typing_extensions import Literal
 
 from gata import bson_support
+from gata import json_support
+from gata import msgpack_support
+from .caching import CacheOption
 from .errors import FieldError
+from .errors import TypeValidationError
 from .errors import ValidationError
 from .mapping import AnyTypeMapping
 from .mapping import BooleanMapping
@@ -30,13 +46,16 @@ from .mapping import CustomTypeMapping
 from .mapping import DateMapping
 from .mapping import DateTimeMapping
 from .mapping import DecimalMapping
+from .mapping import DictMapping
 from .mapping import EnumTypeMapping
 from .mapping import FloatMapping
+from .mapping import FrozenSetMapping
 from .mapping import GataclassMapping
 from .mapping import IntegerMapping
 from .mapping import Ipv4AddressMapping
 from .mapping import Ipv6AddressMapping
 from .mapping import ListMapping
+from .mapping import LiteralMapping
 from .mapping import NoneMapping
 from .mapping import RegexPatternMapping
 from .mapping import SetMapping
@@ -44,15 +63,36 @@ from .mapping import StringMapping
 from .mapping import TimeMapping
 from .mapping import TimedeltaMapping
 from .mapping import TupleMapping
+from .mapping import TypedDictMapping
 from .mapping import UUIDMapping
 from .mapping import UnionMapping
+from .mapping import non_optional_mapping
+from .profile import Profile
 from .schema import Field
 from .schema import Schema
 from .schema import UNDEFINED
 from .stringformat import StringFormat
+from .tagging import tagged_class
+from .tagging import validate_tag
 from .types import Type as CustomType
 from .utils import NoneType
 from .utils import is_dataclass_like
+from .utils import is_gataclass
+from .utils import is_typed_dict
+
+
+try:
+    from pickle import PickleBuffer
+except ImportError:  # python < 3.8
+    PickleBuffer = None  # type: ignore
+
+if TYPE_CHECKING:
+    from typing_extensions import SupportsIndex
+
+Projection = Optional[Union[Iterable[str], Dict[str, Any]]]
+JsonBackendOption = Optional[Union[str, json_support.JsonBackend]]
+ProfileOption = Optional[Union[str, Profile]]
+T = TypeVar("T")
 
 
 class Dataclass(ABC):  # pragma: no cover
@@ -60,12 +100,45 @@ class Dataclass(ABC):  # pragma: no cover
     __frozen_dict__: Dict[str, Any]
     __frozen__: bool
     __validate__: bool
+    __lazy__: bool
+    __track_changes__: bool
+    __memoise__: bool
+    __gata_custom_init__: bool
+    __gata_value_fields__: FrozenSet[str]
     __class_name__: str
 
     def __init__(self, *args, **kwargs):
         ...
 
-    def serialise(self, **mapping) -> Dict[str, Any]:
+    def serialise(
+        self, fields: Projection = None, exclude: Projection = None, profile: ProfileOption = None, **mapping
+    ) -> Dict[str, Any]:
+        ...
+
+    def to_json(self, binary: bool = False, backend: JsonBackendOption = None) -> Union[str, bytes]:
+        ...
+
+    @classmethod
+    def from_json(
+        cls,
+        data: json_support.JsonInput,
+        fields: Projection = None,
+        exclude: Projection = None,
+        backend: JsonBackendOption = None,
+    ) -> "Dataclass":
+        ...
+
+    def to_msgpack(self, backend: Optional[str] = None) -> bytes:
+        ...
+
+    @classmethod
+    def from_msgpack(
+        cls,
+        data: msgpack_support.MsgpackInput,
+        fields: Projection = None,
+        exclude: Projection = None,
+        backend: Optional[str] = None,
+    ) -> "Dataclass":
         ...
 
     @classmethod
@@ -73,7 +146,7 @@ class Dataclass(ABC):  # pragma: no cover
         ...
 
     @classmethod
-    def deserialise(cls, value: Dict[str, Any]) -> "Dataclass":
+    def deserialise(cls, value: Dict[str, Any], fields: Projection = None, exclude: Projection = None) -> "Dataclass":
         ...
 
     def __iter__(self) -> ItemsView[str, Any]:
@@ -83,26 +156,354 @@ class Dataclass(ABC):  # pragma: no cover
         ...
 
 
-def asdict(obj: Any, mapping: Dict[str, Union[bool, str, dict]] = {}) -> Dict[str, Any]:
+def asdict(
+    obj: Any,
+    mapping: Dict[str, Union[bool, str, dict]] = {},
+    fields: Projection = None,
+    exclude: Projection = None,
+    profile: ProfileOption = None,
+) -> Dict[str, Any]:
     if not hasattr(obj.__class__, "__gata_schema__"):
         setattr(obj.__class__, "__gata_schema__", build_schema(obj.__class__))
 
-    return _dataclass_method_serialise(obj, **mapping)
+    return _dataclass_method_serialise(obj, fields, exclude, profile, **mapping)
+
+
+def _parse_projection(selection: Projection) -> Optional[Dict[str, Any]]:
+    """
+    Turns list of dotted field paths, eg. `["artist.name", "song_list.title"]` into a tree
+    `{"artist": {"name": True}, "song_list": {"title": True}}`, where `True` selects the whole field.
+    """
+    if selection is None or isinstance(selection, dict):
+        return selection
+
+    tree: Dict[str, Any] = {}
+    for path in selection:
+        node = tree
+        *parents, leaf = path.split(".")
+        for part in parents:
+            if node.get(part) is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = True
+
+    return tree
+
+
+def _is_selected(name: str, fields: Optional[Dict[str, Any]], exclude: Optional[Dict[str, Any]]) -> bool:
+    if fields is not None and name not in fields:
+        return False
+    if exclude is not None and exclude.get(name) is True:
+        return False
+
+    return True
+
+
+def _nested_projection(
+    name: str, fields: Optional[Dict[str, Any]], exclude: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    projection = {}
+    if fields is not None and isinstance(fields[name], dict):
+        projection["fields"] = fields[name]
+    if exclude is not None and isinstance(exclude.get(name), dict):
+        projection["exclude"] = exclude[name]
+
+    return projection
+
+
+def _mapped_field_name(mapping: Dict[str, Any], serialised_name: str) -> str:
+    for name, item_key in mapping.items():
+        if name[0] == "$":
+            continue
+        if item_key == serialised_name or isinstance(item_key, dict) and item_key.get("$self") == serialised_name:
+            return name
+
+    return serialised_name
+
+
+_REPLACED_STATE = frozenset(["__gata_raw__"])
+
+
+def replace(obj: T, **changes: Any) -> T:
+    """
+    Creates new instance of the same dataclass with passed fields replaced. Unchanged field values are shared
+    with the original instance, only passed values are deserialised (and validated when dataclass validates).
+    """
+    if not is_gataclass(obj) or not hasattr(obj, "deserialise"):
+        raise TypeError(f"replace() should be called on gata dataclass instances, {obj!r} passed instead")
+
+    cls: Any = obj.__class__
+    schema = cls.__gata_schema__
+    new_obj = cls.__new__(cls)
+    # only field values and raw input of lazy fields are carried over, memoised and cached serialised values
+    # describe the original instance, tracked state is copied below
+    for key, value in obj.__dict__.items():
+        if key in schema or key in _REPLACED_STATE:
+            new_obj.__dict__[key] = value
+
+    for property_name, property_value in changes.items():
+        if property_name not in schema:
+            raise TypeError(f"{cls.__class_name__} has no field {property_name!r}")
+
+        field_schema = schema[property_name]
+        if field_schema.read_only:
+            raise ValueError(f"field {property_name!r} is read only and cannot be replaced")
+
+        if property_value is None and field_schema.is_optional:
+            pass
+        elif cls.__validate__:
+            try:
+                property_value = field_schema.validate(property_value)
+            except ValidationError as error:
+                raise FieldError(property_name, error) from error
+        else:
+            property_value = field_schema.deserialise(property_value)
+        new_obj.__dict__[property_name] = property_value
+
+    if "__gata_dirty__" in obj.__dict__:
+        new_obj.__dict__["__gata_dirty__"] = set(obj.__dict__["__gata_dirty__"])
+        new_obj.__dict__["__gata_serialised__"] = {
+            key: value for key, value in obj.__dict__["__gata_serialised__"].items() if key not in changes
+        }
+        if not cls.__validate__:
+            new_obj.__dict__["__gata_dirty__"].update(changes)
+
+    new_obj.__post_init__()
+
+    if cls.__frozen__:
+        _freeze_object(new_obj)
+
+    return new_obj
+
+
+def diff(a: Any, b: Any, serialise: bool = False) -> Dict[str, Any]:
+    """
+    Lists fields which differ between two instances of the same dataclass, only fields with enabled `compare`
+    are taken into account. Nested dataclasses and lists of the same length are compared item by item.
+
+    By default flat dict of dotted field paths and pairs of differing values is returned, eg.
+    `{"artist.name": ("Old Name", "New Name")}`. When `serialise` is set, serialised values of `b` are returned
+    instead in a form that can be used as a partial update, nested dataclasses are represented by their own delta
+    and changed lists are serialised as a whole.
+    """
+    if not _is_same_dataclass(a, b):
+        raise TypeError(f"diff() should be called on instances of the same gata dataclass, got {a!r} and {b!r}")
+
+    if serialise:
+        return _serialised_delta(a, b)
+
+    result: Dict[str, Any] = {}
+    _collect_diff(a, b, "", result)
+
+    return result
+
+
+def _is_same_dataclass(a: Any, b: Any) -> bool:
+    return a.__class__ is b.__class__ and is_gataclass(a)
+
+
+def _collect_diff(a: Any, b: Any, prefix: str, result: Dict[str, Any]) -> None:
+    for name, field_schema in a.__gata_schema__:
+        if not field_schema.compare:
+            continue
+        a_value = getattr(a, name)
+        b_value = getattr(b, name)
+        if a_value is not b_value:
+            _collect_value_diff(a_value, b_value, prefix + name, result)
+
+
+def _collect_value_diff(a_value: Any, b_value: Any, path: str, result: Dict[str, Any]) -> None:
+    if _is_same_dataclass(a_value, b_value):
+        _collect_diff(a_value, b_value, path + ".", result)
+    elif isinstance(a_value, list) and isinstance(b_value, list) and len(a_value) == len(b_value):
+        for index, (a_item, b_item) in enumerate(zip(a_value, b_value)):
+            if a_item is not b_item:
+                _collect_value_diff(a_item, b_item, f"{path}.{index}", result)
+    elif a_value != b_value:
+        result[path] = (a_value, b_value)
+
+
+def _serialised_delta(a: Any, b: Any) -> Dict[str, Any]:
+    delta: Dict[str, Any] = {}
+    for name, field_schema in b.__gata_schema__:
+        if not field_schema.compare or field_schema.write_only:
+            continue
+        a_value = getattr(a, name)
+        b_value = getattr(b, name)
+        if a_value is b_value:
+            continue
+        if _is_same_dataclass(a_value, b_value):
+            nested_delta = _serialised_delta(a_value, b_value)
+            if nested_delta:
+                delta[name] = nested_delta
+        elif a_value != b_value:
+            delta[name] = None if b_value is None else field_schema.serialise(b_value)
+
+    return delta
+
+
+def dumps(obj: Any, binary: bool = False, backend: JsonBackendOption = None) -> Union[str, bytes]:
+    """
+    Encodes dataclass, or list and dict containing dataclasses, into json without building intermediate serialised
+    dict. Values which are json native are handed to the backend as they are, nested dataclasses are walked by
+    the backend itself. Returns str, or utf8 encoded bytes when `binary` is set.
+    """
+    data = json_support.get_backend(backend).dumps(obj, _json_default)
+
+    return data if binary else data.decode("utf8")
+
+
+def dump(obj: Any, fp: IO, backend: JsonBackendOption = None) -> None:
+    """
+    Encodes dataclass into json and writes it to text or binary file-like object.
+    """
+    json_support.get_backend(backend).dump(obj, fp, _json_default)
+
+
+def _json_default(value: Any) -> Any:
+    if not _is_encodable_dataclass(value):
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    return _encodable_fields(value, "json", _JSON_NATIVE_MAPPINGS)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if not _is_encodable_dataclass(value):
+        return msgpack_support.encode_ext(value)
+
+    return _encodable_fields(value, "msgpack", _MSGPACK_NATIVE_MAPPINGS)
+
+
+def _is_encodable_dataclass(value: Any) -> bool:
+    if is_gataclass(value):
+        return True
+    if hasattr(value, "__dataclass_fields__"):
+        setattr(value.__class__, "__gata_schema__", build_schema(value.__class__))
+        return True
+
+    return False
+
+
+def _encodable_fields(obj: Any, encoding: str, native_mappings: Tuple[type, ...]) -> Dict[str, Any]:
+    """
+    Returns shallow dict of fields, values which the encoder handles natively are not converted and nested
+    dataclasses are left for the encoder to walk.
+    """
+    cls = obj.__class__
+    plans = cls.__dict__.get("__gata_encoder_plans__")
+    if plans is None:
+        plans = {}
+        setattr(cls, "__gata_encoder_plans__", plans)
+    if encoding not in plans:
+        plans[encoding] = _build_encoder_plan(cls, native_mappings)
+    plan = plans[encoding]
+    if plan is None:
+        return obj.serialise()
+    if getattr(cls, "__memoise__", False):
+        return _memoised_serialise(obj)
+
+    result: Dict[str, Any] = {}
+    cache = obj.__dict__.get("__gata_serialised__")
+    for key, field_schema, native in plan:
+        if cache is not None and key in cache:
+            result[key] = cache[key]
+            continue
+        value = getattr(obj, key)
+        if native is True or (native is list and value.__class__ is list):
+            result[key] = value
+            continue
+        result[key] = field_schema.serialise(value)
+
+    return result
+
+
+_JSON_NATIVE_MAPPINGS: Tuple[type, ...] = (
+    AnyTypeMapping,
+    BooleanMapping,
+    FloatMapping,
+    GataclassMapping,
+    IntegerMapping,
+    NoneMapping,
+    StringMapping,
+)
+
+_MSGPACK_NATIVE_MAPPINGS: Tuple[type, ...] = _JSON_NATIVE_MAPPINGS + (
+    BytesMapping,
+    DateMapping,
+    DateTimeMapping,
+    DecimalMapping,
+    Ipv4AddressMapping,
+    Ipv6AddressMapping,
+    TimeMapping,
+    TimedeltaMapping,
+    UUIDMapping,
+)
+
+
+def _build_encoder_plan(cls: Any, native_mappings: Tuple[type, ...]) -> Optional[List[Tuple[str, Field, Any]]]:
+    """
+    Lists serialisable fields of the class together with information whether their values can be handed
+    to the encoder as they are. None is returned for classes with custom `serialise` method.
+    """
+    for base in cls.__mro__:
+        if "serialise" in base.__dict__:
+            if base.__dict__["serialise"] not in (_dataclass_method_serialise, _dataclass_method_memoised_serialise):
+                if base.__module__ != "gata.dataclass":
+                    return None
+            break
+
+    plan = []
+    for key, field_schema in cls.__gata_schema__:
+        if field_schema.write_only:
+            continue
+        native: Any = False
+        mapping = field_schema._type
+        if field_schema._serialiser is None and _is_native_mapping(mapping, native_mappings):
+            native = True
+        elif field_schema._serialiser is None and mapping.__class__ is ListMapping:
+            item = mapping.items[0] if mapping.items else None
+            if item is None or _is_native_mapping(item, native_mappings):
+                native = list
+        plan.append((key, field_schema, native))
+
+    return plan
+
+
+def _is_native_mapping(mapping: Any, native_mappings: Tuple[type, ...]) -> bool:
+    if mapping.__class__ is UnionMapping:
+        return all(_is_native_mapping(item, native_mappings) for item in mapping.items)
+    if mapping.__class__ is DictMapping:
+        return _is_native_mapping(mapping.key_type, native_mappings) and _is_native_mapping(
+            mapping.value_type, native_mappings
+        )
+
+    # values serialised as epoch numbers have to go through the mapping
+    return mapping.__class__ in native_mappings and not getattr(mapping, "epoch", None)
 
 
 def _freeze_object(self: "Dataclass") -> None:
     frozen_dict = {}
     for property_name, property_schema in self.__gata_schema__:
+        if self.__lazy__ and property_name not in self.__dict__:
+            continue
         property_value = getattr(self, property_name)
         frozen_dict[property_name] = property_value
     self.__frozen_dict__ = frozen_dict
 
 
-def validate_dataclass(obj: object) -> None:
-    schema = build_schema(obj.__class__)
+def validate_dataclass(obj: Any) -> None:
+    schema = obj.__class__.__gata_schema__ if is_gataclass(obj) else build_schema(obj.__class__)
+    validate_tag(obj.__class__, obj)
+    tracked = getattr(obj, "__track_changes__", False)
+    # fields which were not modified since last successful validation can be skipped, unless their value
+    # can change in place (lists, dicts, mutable dataclasses), see `make_tracked`
+    dirty = obj.__dict__.get("__gata_dirty__") if tracked else None
     for field_name, field_schema in schema:
         if field_schema.read_only:
             continue
+        if dirty is not None and field_name not in dirty and field_name in obj.__gata_value_fields__:
+            continue
         value = getattr(obj, field_name, None)
         if field_schema.is_optional and value is None:
             continue
@@ -111,15 +512,43 @@ def validate_dataclass(obj: object) -> None:
         except ValidationError as error:
             raise FieldError(field_name, error) from error
 
+    if tracked:
+        _mark_clean(obj)
+
+
+def _dataclass_method_serialise(
+    self, fields: Projection = None, exclude: Projection = None, profile: ProfileOption = None, **mapping
+) -> Dict[str, Any]:
+    # nested projections and profile are passed down through mapping, see `_serialise_projected_field`
+    fields = _parse_projection(mapping.pop("$fields", fields))
+    exclude = _parse_projection(mapping.pop("$exclude", exclude))
+    profile = _parse_profile(mapping.pop("$profile", profile))
+    if fields is None and "$item" in mapping:
+        # only a single field is picked from the serialised item, there is no point in serialising the others
+        fields = {_mapped_field_name(mapping, mapping["$item"]): True}  # type: ignore
 
-def _dataclass_method_serialise(self, **mapping) -> Dict[str, Any]:
-    serialised = {}
+    serialised: Dict[str, Any] = {}
+    cache = self.__dict__.get("__gata_serialised__")
     for key, schema in self.__gata_schema__:
         if schema.write_only:
             continue
+        if (fields is not None or exclude is not None) and not _is_selected(key, fields, exclude):
+            continue
+        projection = _nested_projection(key, fields, exclude) if fields or exclude else {}
+        if profile is not None:
+            projection["profile"] = profile
+        if projection:
+            _serialise_projected_field(serialised, key, getattr(self, key), schema, mapping, projection)
+            continue
+        # cached containers are copied both ways, so modifying the result does not change later results
+        if cache is not None and key in cache and key not in mapping:
+            serialised[key] = _copy_serialised(cache[key])
+            continue
         value = getattr(self, key)
         if key not in mapping:
             serialised[key] = schema.serialise(value)
+            if cache is not None and key in self.__gata_value_fields__:
+                cache[key] = _copy_serialised(serialised[key])
             continue
 
         serialise_mapped_field(serialised, key, value, schema, mapping)
@@ -127,7 +556,138 @@ def _dataclass_method_serialise(self, **mapping) -> Dict[str, Any]:
     return serialised
 
 
+def _dataclass_method_memoised_serialise(
+    self, fields: Projection = None, exclude: Projection = None, profile: ProfileOption = None, **mapping
+) -> Dict[str, Any]:
+    if fields is not None or exclude is not None or profile is not None or mapping:
+        return _dataclass_method_serialise(self, fields, exclude, profile, **mapping)
+
+    return _copy_serialised(_memoised_serialise(self))
+
+
+def _memoised_serialise(self: "Dataclass") -> Dict[str, Any]:
+    """
+    Returns cached serialised form of frozen instance, the result is shared and must not be modified.
+    """
+    memo = self.__dict__.get("__gata_memo__")
+    if memo is not None:
+        return memo
+
+    memo = _dataclass_method_serialise(self)
+    if "__frozen_dict__" in self.__dict__:  # instance can still change in __post_init__ before it gets frozen
+        self.__dict__["__gata_memo__"] = memo
+
+    return memo
+
+
+def _copy_serialised(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_serialised(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_serialised(item) for item in value]
+
+    return value
+
+
+def _parse_profile(profile: ProfileOption) -> Optional[Profile]:
+    if profile is None:
+        return None
+    profile = Profile(profile)
+
+    # json is the default target every mapping serialises to
+    return None if profile is Profile.JSON else profile
+
+
+def _serialise_projected_field(
+    result: Dict[str, Any],
+    key: str,
+    value: Any,
+    schema_field: Field,
+    mapping: Dict[str, Any],
+    projection: Dict[str, Any],
+) -> None:
+    item_key = mapping[key] if key in mapping else True
+    if item_key is False:
+        return None
+    if isinstance(item_key, str):
+        item_key = {"$self": item_key}
+    elif not isinstance(item_key, dict):
+        item_key = {}
+
+    item_key = {**item_key, **{f"${name}": selection for name, selection in projection.items()}}
+    serialise_mapped_field(result, key, value, schema_field, {key: item_key})
+
+
+def _dataclass_method_to_json(self: Any, binary: bool = False, backend: JsonBackendOption = None) -> Union[str, bytes]:
+    return dumps(self, binary, backend)
+
+
+def _dataclass_method_from_json(
+    cls: Any,
+    data: json_support.JsonInput,
+    fields: Projection = None,
+    exclude: Projection = None,
+    backend: JsonBackendOption = None,
+) -> Any:
+    value = json_support.get_backend(backend).loads(data)
+    if not isinstance(value, dict):
+        raise TypeValidationError(expected_type=dict)
+
+    # parsed payload is owned by the instance, so it goes directly through deserialisation without copying kwargs
+    return _dataclass_construct(cls, value, fields, exclude)
+
+
+def _dataclass_method_to_msgpack(self: Any, backend: Optional[str] = None) -> bytes:
+    return msgpack_support.get_backend(backend).packb(self, _msgpack_default)
+
+
+def _dataclass_method_from_msgpack(
+    cls: Any,
+    data: msgpack_support.MsgpackInput,
+    fields: Projection = None,
+    exclude: Projection = None,
+    backend: Optional[str] = None,
+) -> Any:
+    value = msgpack_support.get_backend(backend).unpackb(data)
+    if not isinstance(value, dict):
+        raise TypeValidationError(expected_type=dict)
+
+    return _dataclass_construct(cls, value, fields, exclude)
+
+
+def _dataclass_method_reduce_ex(self: Any, protocol: "SupportsIndex") -> Tuple[Any, ...]:
+    schema = self.__gata_schema__
+    values = tuple(getattr(self, name) for name, _ in schema)
+    if int(protocol) >= 5 and PickleBuffer is not None:
+        # binary values can be passed out-of-band without being copied into the pickle stream
+        values = tuple(PickleBuffer(value) if type(value) in (bytes, bytearray) else value for value in values)
+    # attributes which are not fields (e.g. set in custom `__init__`) are carried over, gata's own state is rebuilt
+    state = {
+        key: value
+        for key, value in self.__dict__.items()
+        if key not in schema and not key.startswith("__gata_") and key != "__frozen_dict__"
+    }
+
+    return _dataclass_unpickle, (self.__class__, values, state)
+
+
+def _dataclass_unpickle(cls: Any, values: Tuple[Any, ...], state: Optional[Dict[str, Any]] = None) -> Any:
+    restored = {}
+    for (name, _), value in zip(cls.__gata_schema__, values):
+        if type(value) is memoryview or (PickleBuffer is not None and type(value) is PickleBuffer):
+            # out-of-band buffer, read-only buffers were created from bytes
+            view = memoryview(value)
+            value = bytes(view) if view.readonly else bytearray(view)
+        restored[name] = value
+    if state:
+        restored.update(state)
+
+    return _dataclass_restore(cls, restored)
+
+
 def _dataclass_method_validate(cls: "Dataclass", value: Dict[str, Any]) -> None:
+    validate_tag(cls, value)
     for field_name, field_schema in cls.__gata_schema__:
         field_value = value[field_name] if field_name in value else None
 
@@ -169,14 +729,14 @@ def _dataclass_method_eq(self: "Dataclass", other: "Dataclass") -> bool:
 
 
 def _dataclass_method_frozen_setattr(self: "Dataclass", name: str, value: Any) -> None:
-    if not self.__frozen_dict__:
+    if "__frozen_dict__" not in self.__dict__:
         self.__dict__[name] = value
         return None
     raise TypeError(f"cannot modify attribute {name} of {self}, the dataclass is marked as frozen")
 
 
 def _dataclass_method_frozen_getattr(self: "Dataclass", name: str) -> Any:
-    if not self.__frozen_dict__:
+    if "__frozen_dict__" not in self.__dict__:
         return self.__dict__.get(name)
 
     if name in self.__frozen_dict__:
@@ -185,7 +745,7 @@ def _dataclass_method_frozen_getattr(self: "Dataclass", name: str) -> Any:
     if name[0:2] == "__" and name[-2:] == "__":
         return super(self.__class__, self).__getattribute__(name)
 
-    raise TypeError(f"cannot get non existing attribute {name} of {self}, the dataclass is marked as frozen")
+    raise AttributeError(f"cannot get non existing attribute {name} of {self}, the dataclass is marked as frozen")
 
 
 def _deserialise_field_from_hash(property_name: str, property_descriptor: Field, object_hash: Dict[str, Any]) -> Any:
@@ -197,46 +757,150 @@ def _deserialise_field_from_hash(property_name: str, property_descriptor: Field,
     return value
 
 
-def _dataclass_method_deserialise(cls, value: Dict[str, Any]):
+def _deserialise_field(cls: Any, property_name: str, field_schema: Field, value: Dict[str, Any]) -> Any:
+    if cls.__validate__:
+        property_value = value[property_name] if property_name in value else None
+
+        if (field_schema.is_optional or field_schema.read_only) and property_value is None:
+            property_value = field_schema.default
+            return None if property_value is UNDEFINED else property_value
+
+        try:
+            return field_schema.validate(property_value)
+        except ValidationError as error:
+            raise FieldError(property_name, error) from error
+
+    if field_schema.read_only:
+        property_value = field_schema.default
+        return None if property_value is UNDEFINED else property_value
+
+    return _deserialise_field_from_hash(property_name, field_schema, value)
+
+
+def _deserialise_projected_field(
+    cls: Any, property_name: str, field_schema: Field, value: Dict[str, Any], projection: Dict[str, Any]
+) -> Any:
+    property_value = value[property_name] if property_name in value else None
+    field_type = non_optional_mapping(field_schema._type)
+    item_type = field_type
+    optional_items = False
+    if isinstance(field_type, ListMapping) and field_type.items:
+        item_type = non_optional_mapping(field_type.items[0])
+        optional_items = item_type is not field_type.items[0]
+
+    if (
+        property_value is None
+        or not isinstance(item_type, GataclassMapping)
+        or field_schema._deserialiser
+        or field_schema._validator
+    ):
+        return _deserialise_field(cls, property_name, field_schema, value)
+
+    try:
+        if item_type is field_type:
+            return _construct_projected(item_type.dataclass, property_value, projection)
+
+        if not isinstance(property_value, list):
+            raise TypeValidationError(expected_type=list)
+        return [
+            None if item is None and optional_items else _construct_projected(item_type.dataclass, item, projection)
+            for item in property_value
+        ]
+    except ValidationError as error:
+        raise FieldError(property_name, error) from error
+
+
+def _construct_projected(cls: Any, value: Any, projection: Dict[str, Any]) -> Any:
+    if isinstance(value, cls):
+        return value
+    if not isinstance(value, dict):
+        raise TypeValidationError(expected_type=dict)
+
+    return _dataclass_construct(cls, value, **projection)
+
+
+def _dataclass_construct(cls: Any, value: Dict[str, Any], fields: Projection = None, exclude: Projection = None):
+    cls = tagged_class(cls, value)
+    if getattr(cls, "__gata_custom_init__", False):
+        # own `__init__` may transform passed values, so parsed payloads go through it like keyword arguments do
+        if fields is not None or exclude is not None:
+            selected_fields = _parse_projection(fields)
+            excluded_fields = _parse_projection(exclude)
+            value = {key: item for key, item in value.items() if _is_selected(key, selected_fields, excluded_fields)}
+        return cls(**value)
+
+    self = _dataclass_method_deserialise(cls, value, fields, exclude)
+    self.__post_init__()
+
+    if self.__frozen__:
+        _freeze_object(self)
+
+    return self
+
+
+def _dataclass_restore(cls: Any, values: Dict[str, Any], post_init: bool = False) -> Any:
+    """
+    Rebuilds instance from field values which were taken from another instance, values are trusted
+    and neither validated nor converted. `__post_init__` is called only when asked for, values of a copied
+    instance were post-initialised already.
+    """
+    self = cls.__new__(cls)
+    self.__dict__.update(values)
+    if cls.__track_changes__:
+        _mark_clean(self)
+    if post_init:
+        self.__post_init__()
+
+    if cls.__frozen__:
+        _freeze_object(self)
+
+    return self
+
+
+def _dataclass_method_deserialise(cls, value: Dict[str, Any], fields: Projection = None, exclude: Projection = None):
     if not isclass(cls):
         self = cls
         cls = self.__class__
     else:
+        cls = tagged_class(cls, value)
         self = cls.__new__(cls)
+    validate_tag(cls, value)
 
-    if cls.__validate__:
+    if cls.__lazy__:
+        # nothing is converted up-front in lazy mode, so projection has nothing to limit
+        self.__dict__["__gata_raw__"] = value
+    elif fields is None and exclude is None:
         for property_name, field_schema in cls.__gata_schema__:
-            property_value = value[property_name] if property_name in value else None
-
-            if field_schema.is_optional or field_schema.read_only:
-                if property_value is not None:
-                    try:
-                        property_value = field_schema.validate(property_value)
-                    except ValidationError as error:
-                        raise FieldError(property_name, error) from error
-                else:
-                    property_value = field_schema.default
-                    if property_value is UNDEFINED:
-                        property_value = None
-            else:
-                try:
-                    property_value = field_schema.validate(property_value)
-                except ValidationError as error:
-                    raise FieldError(property_name, error) from error
-            setattr(self, property_name, property_value)
+            setattr(self, property_name, _deserialise_field(cls, property_name, field_schema, value))
     else:
-        for property_name, property_descriptor in cls.__gata_schema__:  # type: ignore
-            if property_descriptor.read_only:
-                property_value = property_descriptor.default
-                if property_value is UNDEFINED:
-                    property_value = None
-            else:
-                property_value = _deserialise_field_from_hash(property_name, property_descriptor, value)
-            setattr(self, property_name, property_value)
+        _deserialise_projected(self, cls, value, fields, exclude)
+
+    # lazy fields are validated on first access, so lazy instance is clean only after `validate_dataclass`
+    if cls.__track_changes__ and cls.__validate__ and not cls.__lazy__:
+        _mark_clean(self)
 
     return self
 
 
+def _deserialise_projected(
+    self: Any, cls: Any, value: Dict[str, Any], fields: Projection = None, exclude: Projection = None
+) -> None:
+
+    fields = _parse_projection(fields)
+    exclude = _parse_projection(exclude)
+    for property_name, field_schema in cls.__gata_schema__:
+        if not _is_selected(property_name, fields, exclude):
+            property_value = field_schema.default
+            property_value = None if property_value is UNDEFINED else property_value
+        else:
+            projection = _nested_projection(property_name, fields, exclude)
+            if projection:
+                property_value = _deserialise_projected_field(cls, property_name, field_schema, value, projection)
+            else:
+                property_value = _deserialise_field(cls, property_name, field_schema, value)
+        setattr(self, property_name, property_value)
+
+
 def _dataclass_method_init(*args, **kwargs) -> None:
     self: "Dataclass" = args[0]
     init_kwargs = {}
@@ -258,11 +922,150 @@ def _dataclass_method_init(*args, **kwargs) -> None:
         _freeze_object(self)
 
 
-def make_dataclass(_cls: Any, repr: bool = True, eq: bool = True, validate: bool = True, frozen: bool = False,) -> None:
+class LazyField:
+    """
+    Non-data descriptor used by lazy dataclasses, converts and validates field's raw value on the first access
+    and caches the result in instance's `__dict__`, so subsequent reads never reach the descriptor.
+    """
+
+    def __init__(self, name: str, field: Field):
+        self.name = name
+        self.field = field
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if instance is None:
+            return self.field
+
+        raw = instance.__dict__.get("__gata_raw__")
+        if raw is None:
+            value = self.field.default
+            value = None if value is UNDEFINED else value
+        else:
+            value = _deserialise_field(owner, self.name, self.field, raw)
+        instance.__dict__[self.name] = value
+
+        return value
+
+
+_VALUE_MAPPINGS = (
+    BooleanMapping,
+    IntegerMapping,
+    FloatMapping,
+    StringMapping,
+    DecimalMapping,
+    DateMapping,
+    DateTimeMapping,
+    TimeMapping,
+    TimedeltaMapping,
+    UUIDMapping,
+    Ipv4AddressMapping,
+    Ipv6AddressMapping,
+    EnumTypeMapping,
+    NoneMapping,
+    RegexPatternMapping,
+)
+
+
+def _is_value_mapping(mapping: Any) -> bool:
+    """
+    Tells whether values of the mapping are immutable, so their validity and serialised form can only change
+    by assigning new value to the field.
+    """
+    if isinstance(mapping, _VALUE_MAPPINGS):
+        return True
+    if isinstance(mapping, (UnionMapping, TupleMapping, FrozenSetMapping)):
+        return all(_is_value_mapping(item) for item in mapping.items or () if item is not ...)
+    if isinstance(mapping, GataclassMapping):
+        return mapping.dataclass.__frozen__
+
+    return False
+
+
+def _mark_clean(self: "Dataclass") -> None:
+    self.__dict__["__gata_dirty__"] = set()
+    if "__gata_serialised__" not in self.__dict__:
+        self.__dict__["__gata_serialised__"] = {}
+
+
+def _dataclass_method_tracked_setattr(self: "Dataclass", name: str, value: Any) -> None:
+    if name in self.__gata_schema__:
+        dirty = self.__dict__.get("__gata_dirty__")
+        if dirty is not None:
+            dirty.add(name)
+            self.__dict__["__gata_serialised__"].pop(name, None)
+    self.__dict__[name] = value
+
+
+def make_tracked(_cls: Any) -> None:
+    _cls.__gata_value_fields__ = frozenset(
+        [name for name, field_schema in _cls.__gata_schema__ if _is_value_mapping(field_schema._type)]
+    )
+    if not _cls.__frozen__:
+        setattr(_cls, "__setattr__", _dataclass_method_tracked_setattr)
+
+
+def make_memoised(_cls: Any) -> None:
+    if not _cls.__frozen__:
+        raise ValueError(f"{_cls.__qualname__} cannot memoise serialisation, only frozen dataclasses can be memoised")
+    setattr(_cls, "serialise", _dataclass_method_memoised_serialise)
+
+
+def make_lazy(_cls: Any) -> None:
+    for field_name, field_schema in _cls.__gata_schema__:
+        setattr(_cls, field_name, LazyField(field_name, field_schema))
+
+
+def make_tagged(_cls: Any, discriminator: Optional[str] = None, tag: Any = None) -> None:
+    """
+    Declares `discriminator` field of polymorphic base class or registers tagged subclass in the base's table,
+    which is shared by whole hierarchy. Subclass' discriminator field defaults to its tag.
+    """
+    if discriminator is not None:
+        if discriminator not in _cls.__gata_schema__:
+            raise ValueError(f"discriminator {discriminator!r} is not a field of {_cls.__qualname__}")
+        setattr(_cls, "__gata_discriminator__", discriminator)
+        setattr(_cls, "__gata_tags__", {})
+
+    setattr(_cls, "__gata_tag__", tag)
+    if tag is None:
+        return
+
+    tags: Optional[Dict[Any, Any]] = getattr(_cls, "__gata_tags__", None)
+    if tags is None:
+        raise ValueError(f"{_cls.__qualname__} has tag {tag!r}, but none of its bases declares discriminator")
+    if tag in tags:
+        raise ValueError(f"tag {tag!r} of {_cls.__qualname__} is already used by {tags[tag].__qualname__}")
+    tags[tag] = _cls
+
+    name = _cls.__gata_discriminator__
+    tag_field = copy(_cls.__gata_schema__[name])
+    tag_field._default = tag
+    tag_field._default_factory = UNDEFINED
+    tag_field._is_optional = None
+    _cls.__gata_schema__[name] = tag_field
+
+
+def make_dataclass(
+    _cls: Any,
+    repr: bool = True,
+    eq: bool = True,
+    validate: bool = True,
+    frozen: bool = False,
+    lazy: bool = False,
+    track_changes: bool = False,
+    memoise: bool = False,
+    discriminator: Optional[str] = None,
+    tag: Any = None,
+) -> None:
     setattr(_cls, "validate", classmethod(_dataclass_method_validate))
     setattr(_cls, "deserialise", classmethod(_dataclass_method_deserialise))
+    setattr(_cls, "from_json", classmethod(_dataclass_method_from_json))
+    setattr(_cls, "from_msgpack", classmethod(_dataclass_method_from_msgpack))
     setattr(_cls, "serialise", _dataclass_method_serialise)
+    setattr(_cls, "to_json", _dataclass_method_to_json)
+    setattr(_cls, "to_msgpack", _dataclass_method_to_msgpack)
     setattr(_cls, "__iter__", _dataclass_method_iter)
+    setattr(_cls, "__reduce_ex__", _dataclass_method_reduce_ex)
 
     if repr:
         setattr(_cls, "__repr__", _dataclass_method_repr)
@@ -271,6 +1074,7 @@ def make_dataclass(_cls: Any, repr: bool = True, eq: bool = True, validate: bool
         setattr(_cls, "__eq__", _dataclass_method_eq)
 
     __init__ = object.__init__
+    setattr(_cls, "__gata_custom_init__", "__init__" in _cls.__dict__)
     if "__init__" in _cls.__dict__:
         class_init = getattr(_cls, "__init__")
 
@@ -292,16 +1096,39 @@ def make_dataclass(_cls: Any, repr: bool = True, eq: bool = True, validate: bool
         setattr(_cls, "__setattr__", _dataclass_method_frozen_setattr)
         setattr(_cls, "__getattr__", _dataclass_method_frozen_getattr)
 
+    if lazy:
+        make_lazy(_cls)
+
+    if track_changes:
+        make_tracked(_cls)
+
+    if memoise:
+        make_memoised(_cls)
+
+    make_tagged(_cls, discriminator, tag)
+
 
 def _process_class(
-    _cls: Any, init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False, validate=True,
+    _cls: Any,
+    init=True,
+    repr=True,
+    eq=True,
+    order=False,
+    unsafe_hash=False,
+    frozen=False,
+    validate=True,
+    lazy=False,
+    track_changes=False,
+    memoise=False,
+    discriminator=None,
+    tag=None,
 ) -> Type["Dataclass"]:
     if order or unsafe_hash:
         raise NotImplementedError(
             "order and unsafe_hash attributes are not yet supported. If you need those features please use python's dataclasses instead"
         )
 
-    if hasattr(_cls, "__gata_schema__"):
+    if "__gata_schema__" in _cls.__dict__:
         schema = _cls.__gata_schema__  # type: ignore
     else:
         schema = build_schema(_cls)
@@ -314,8 +1141,14 @@ def _process_class(
         {
             "__validate__": validate,
             "__frozen__": frozen,
+            "__lazy__": lazy,
+            "__track_changes__": track_changes,
+            "__memoise__": memoise,
             "__gata_schema__": schema,
             "__class_name__": _cls.__qualname__,
+            # decorated class replaces the original one, so pickle can find it by the same name
+            "__module__": _cls.__module__,
+            "__qualname__": _cls.__qualname__,
         },
     )
 
@@ -328,6 +1161,11 @@ def _process_class(
         eq=(eq and "__eq__" not in _cls.__dict__),
         frozen=frozen,
         validate=validate,
+        lazy=lazy,
+        track_changes=track_changes,
+        memoise=memoise,
+        discriminator=discriminator,
+        tag=tag,
     )
 
     return new_cls
@@ -368,9 +1206,16 @@ def dataclass(
     unsafe_hash=False,
     frozen=False,
     validate=True,
+    lazy=False,
+    track_changes=False,
+    memoise=False,
+    discriminator=None,
+    tag=None,
 ) -> Union[Callable[[Any], Type["Dataclass"]], Type["Dataclass"]]:
     def _dataclass(cls: Any) -> Type[Dataclass]:
-        return _process_class(cls, init, repr, eq, order, unsafe_hash, frozen, validate)
+        return _process_class(
+            cls, init, repr, eq, order, unsafe_hash, frozen, validate, lazy, track_changes, memoise, discriminator, tag
+        )
 
     if _cls is None:
         return _dataclass
@@ -394,6 +1239,10 @@ def field(
     read_only: bool = False,
     write_only: bool = False,
     items: Optional[Dict[str, Any]] = None,
+    cache: CacheOption = None,
+    epoch: Union[bool, str, None] = None,
+    by_name: bool = False,
+    copy: bool = False,
 ) -> Field:
     if hash or metadata:
         raise NotImplementedError(
@@ -414,6 +1263,10 @@ def field(
         read_only=read_only,
         write_only=write_only,
         items=items if items else {},
+        cache=cache,
+        epoch=epoch,
+        by_name=by_name,
+        copy=copy,
     )
 
 
@@ -426,9 +1279,17 @@ SUPPORTED_TYPES = {
     bytearray: BytesMapping,
     list: ListMapping,
     set: SetMapping,
+    frozenset: FrozenSetMapping,
     tuple: TupleMapping,
+    dict: DictMapping,
     NoneType: NoneMapping,  # type: ignore
     List: ListMapping,
+    Set: SetMapping,
+    FrozenSet: FrozenSetMapping,
+    Tuple: TupleMapping,
+    Dict: DictMapping,
+    Mapping: DictMapping,
+    abc.Mapping: DictMapping,
     Union: UnionMapping,
     Decimal: DecimalMapping,
     datetime.date: DateMapping,
@@ -442,6 +1303,7 @@ SUPPORTED_TYPES = {
     Any: AnyTypeMapping,
     ByteString: BytesMapping,
     AnyStr: StringMapping,
+    Literal: LiteralMapping,
 }
 
 if bson_support.BSON_SUPPORT:
@@ -465,34 +1327,66 @@ def map_property_type_to_schema_type(property_type: Any, type_properties: Dict[s
             if issubclass(property_type, CustomType):
                 return CustomTypeMapping(custom_type=property_type)
             if issubclass(property_type, Enum):
-                return EnumTypeMapping(enum_type=property_type)
+                return EnumTypeMapping(
+                    enum_type=property_type, cache=type_properties.get("cache"), by_name=type_properties.get("by_name")
+                )
+            if is_typed_dict(property_type):
+                return map_typed_dict_to_schema_type(property_type)
 
         return AnyTypeMapping()
     if origin_type not in SUPPORTED_TYPES:
         return AnyTypeMapping()
+    if origin_type is Literal:
+        return LiteralMapping(items=list(property_type.__args__))
+
+    item_properties = type_properties["items"] if "items" in type_properties else {}
+    if origin_type is Union and len(property_type.__args__) == 2 and NoneType in property_type.__args__:
+        # `Optional[X]` field behaves like `X` field, so its properties apply to the type
+        item_properties = type_properties
 
     subtypes = []
     for python_subtype in property_type.__args__:
         if python_subtype is ...:
             subtypes.append(...)
             continue
-        subtypes.append(
-            map_property_type_to_schema_type(
-                python_subtype, type_properties["items"] if "items" in type_properties else {},
-            )
-        )
+        subtypes.append(map_property_type_to_schema_type(python_subtype, item_properties))
 
     init_args = {**type_properties, **{"items": subtypes}}
 
     return SUPPORTED_TYPES[origin_type](**init_args)
 
 
+def map_typed_dict_to_schema_type(typed_dict: Any) -> TypedDictMapping:
+    fields = {
+        key: map_property_type_to_schema_type(key_type, {}) for key, key_type in get_type_hints(typed_dict).items()
+    }
+    # `__required_keys__` is missing in typed dicts of older python versions, which have no optional keys but
+    # the ones of non-total typed dicts
+    required_keys = getattr(typed_dict, "__required_keys__", frozenset(fields) if typed_dict.__total__ else ())
+
+    return TypedDictMapping(typed_dict=typed_dict, fields=fields, required_keys=frozenset(required_keys))
+
+
+def _class_annotations(_cls: Any) -> Dict[str, Any]:
+    """
+    Collects annotations of the class and its bases, so subclasses extend schema of their parents.
+    """
+    annotations: Dict[str, Any] = {}
+    for base in reversed(_cls.__mro__):
+        for name, annotation in base.__dict__.get("__annotations__", {}).items():
+            # gata's own class attributes like `__gata_schema__` are not fields
+            if not (name.startswith("__") and name.endswith("__")):
+                annotations[name] = annotation
+
+    return annotations
+
+
 def build_schema(_cls: Any) -> Schema:
     if not is_dataclass_like(_cls):
         raise ValueError(f"passed value {_cls} is not valid dataclass type")
 
     schema = Schema(_cls)
-    for field_name, field_type in _cls.__annotations__.items():
+    for field_name, field_type in _class_annotations(_cls).items():
         field_descriptor = Field()
 
         if hasattr(_cls, field_name):
@@ -516,6 +1410,10 @@ def build_schema(_cls: Any) -> Schema:
             "format": field_descriptor.format,
             "items": field_descriptor.items,
             "pattern": field_descriptor.pattern,
+            "cache": field_descriptor.cache,
+            "epoch": field_descriptor.epoch,
+            "by_name": field_descriptor.by_name,
+            "copy": field_descriptor.copy,
         }
 
         field_descriptor._type = map_property_type_to_schema_type(field_type, field_properties)
@@ -0,0 +1,98 @@
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+__all__ = [
+    "DATETIME_UNITS",
+    "EPOCH",
+    "datetime_to_epoch",
+    "epoch_to_datetime",
+    "epoch_unit",
+    "is_epoch_number",
+    "number_to_timedelta",
+    "ordinal_to_date",
+    "timedelta_to_number",
+]
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# number of microseconds in a unit expressed as a fraction, so conversions can stay in integers
+_MICROSECONDS: Dict[str, Tuple[int, int]] = {
+    "s": (1_000_000, 1),
+    "ms": (1_000, 1),
+    "us": (1, 1),
+    "ns": (1, 1_000),
+}
+_MICROSECOND = timedelta(microseconds=1)
+
+DATETIME_UNITS = tuple(_MICROSECONDS)
+
+Number = Union[int, float]
+
+
+def epoch_unit(option: Union[bool, str, None], default: str, units: Tuple[str, ...]) -> Union[str, None]:
+    """
+    Normalises `epoch` field option, `True` stands for the default unit of the type.
+    """
+    if option is None or option is False:
+        return None
+    if option is True:
+        return default
+    if option not in units:
+        raise ValueError(f"unsupported epoch unit {option!r}, expected one of: {', '.join(units)}")
+
+    return option
+
+
+def is_epoch_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_microseconds(value: Number, unit: str) -> int:
+    numerator, denominator = _MICROSECONDS[unit]
+    if isinstance(value, float):
+        return round(value * numerator / denominator)
+
+    return value * numerator // denominator
+
+
+def _from_microseconds(value: int, unit: str) -> int:
+    numerator, denominator = _MICROSECONDS[unit]
+    return value * denominator // numerator
+
+
+def datetime_to_epoch(value: datetime, unit: str) -> int:
+    """
+    Returns number of units since unix epoch, naive datetimes are treated as utc. Units coarser than
+    microsecond are rounded down.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return _from_microseconds((value - EPOCH) // _MICROSECOND, unit)
+
+
+def epoch_to_datetime(value: Number, unit: str) -> datetime:
+    return EPOCH + timedelta(microseconds=_to_microseconds(value, unit))
+
+
+def timedelta_to_number(value: timedelta, unit: str) -> int:
+    return _from_microseconds(value // _MICROSECOND, unit)
+
+
+def number_to_timedelta(value: Number, unit: str) -> timedelta:
+    return timedelta(microseconds=_to_microseconds(value, unit))
+
+
+def ordinal_to_date(value: Number) -> date:
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"ordinal day {value} is not a whole number")
+        value = int(value)
+
+    return date.fromordinal(value)
@@ -19,6 +19,10 @@ class ValidationError(ValueError):
         return False
 
     def __str__(self) -> str:
+        if not hasattr(self, "message"):
+            # errors raised with explicit description, like `ValidationError("...", code="...")`
+            return super().__str__()
+
         return self.message.format(**self.context)
 
 
@@ -32,6 +36,21 @@ class FormatValidationError(ValidationError):
     message = "Passed value must be valid string format: {expected_format}."
 
 
+class TagValidationError(ValidationError):
+    code = "tag_error"
+    message = "Passed value `{tag}` is not registered type tag."
+
+
+class TagBranchValidationError(TagValidationError):
+    code = "tag_branch_error"
+    message = "Passed value `{tag}` is type tag of `{tagged_class}`, which does not extend `{expected_class}`."
+
+
+class TagMismatchValidationError(TagValidationError):
+    code = "tag_mismatch_error"
+    message = "Passed value `{tag}` does not match type tag `{expected_tag}`."
+
+
 class IterableValidationError(TypeValidationError):
     code = "iterable_error"
     message = "Passed value is not expected iterable type."
@@ -87,6 +106,18 @@ class FieldError(ValidationError):
         return self.message.format(**self.context) + str(self.caused_by)
 
 
+class RowError(ValidationError):
+    code = "row_error"
+    message = "Row error at line {line}: "
+
+    def __init__(self, line: int, caused_by: ValidationError):
+        self.context = {**caused_by.context, "line": line}
+        self.caused_by = caused_by
+
+    def __str__(self) -> str:
+        return self.message.format(**self.context) + str(self.caused_by)
+
+
 class TypeMapError(RuntimeError):
     pass
 
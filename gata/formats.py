@@ -0,0 +1,227 @@
+"""
+Hand-written matchers for string formats. They accept exactly the same strings as `EMAIL_REGEX`, `HOSTNAME_REGEX`,
+`URI_REGEX` and `URL_REGEX` in `gata.validators` (used with `match`, case-insensitive), but run in linear time
+regardless of input. The regular expressions backtrack heavily on long adversarial values.
+"""
+import re
+from typing import Dict
+from typing import Optional
+
+__all__ = ["is_email", "is_hostname", "is_uri", "is_url"]
+
+# non-ascii characters which case-insensitive `[a-z]` matches, depending on python version
+_FOLDED_LETTERS: Dict[str, str] = {
+    character: letter
+    for character, letter in (("İ", "i"), ("ı", "i"), ("ſ", "s"), ("K", "k"))
+    if re.match(f"[{letter}]", character, re.I)
+}
+
+_ASCII_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ" + "".join(_FOLDED_LETTERS)
+_DIGITS = "0123456789"
+
+
+def _deletion_table(characters: str) -> Dict[int, None]:
+    return {ord(character): None for character in characters}
+
+
+# `text.translate(table)` removes allowed characters, so what remains are the characters outside of the set
+_EMAIL_LOCAL = _deletion_table(_ASCII_LETTERS + _DIGITS + ".!#$%&'*+/=?^_`{|}~-")
+_DOMAIN_LABEL = _deletion_table(_ASCII_LETTERS + _DIGITS + "-")
+_URI_SCHEME = _deletion_table(_ASCII_LETTERS + _DIGITS + "+,-.")
+_URL_LABEL = _deletion_table(_ASCII_LETTERS + _DIGITS + "_-")
+_URL_TLD = _deletion_table(_ASCII_LETTERS)
+_FOLD_LETTERS = str.maketrans(_FOLDED_LETTERS)
+
+_URL_SCHEMES = (("https://", 8), ("http://", 7), ("ftp://", 6))
+
+
+def _strip_final_newline(value: str) -> str:
+    # `$` matches also before newline at the end of the string
+    return value[:-1] if value[-1:] == "\n" else value
+
+
+def _whitespace_index(value: str) -> int:
+    """
+    Returns index of the first whitespace character or length of the value when there is none.
+    """
+    parts = value.split(None, 1)
+    if not parts or value[0].isspace():
+        return 0
+
+    return len(parts[0])
+
+
+def _last_whitespace_index(value: str) -> int:
+    parts = value.rsplit(None, 1)
+    if not parts:
+        return len(value) - 1
+    if value[-1].isspace():
+        return len(value) - 1
+
+    return len(value) - len(parts[-1]) - 1
+
+
+def _is_domain(value: str) -> bool:
+    for label in value.split("."):
+        if not label or len(label) > 63 or label[0] == "-" or label[-1] == "-":
+            return False
+        if label.translate(_DOMAIN_LABEL):
+            return False
+
+    return True
+
+
+def _ensure_string(value: str) -> None:
+    if not isinstance(value, str):
+        raise TypeError(f"expected string, {type(value).__name__} passed instead")
+
+
+def is_email(value: str) -> bool:
+    _ensure_string(value)
+    local, at, domain = _strip_final_newline(value).partition("@")
+    if not at or not local or local.translate(_EMAIL_LOCAL):
+        return False
+
+    return _is_domain(domain)
+
+
+def is_hostname(value: str) -> bool:
+    _ensure_string(value)
+
+    return _is_domain(_strip_final_newline(value))
+
+
+def is_uri(value: str) -> bool:
+    _ensure_string(value)
+    value = _strip_final_newline(value)
+    colon = value.find(":")
+    if colon < 1 or value[0] not in _ASCII_LETTERS or value[1:colon].translate(_URI_SCHEME):
+        return False
+    rest = value[colon + 1 :]
+
+    return _whitespace_index(rest) == len(rest)
+
+
+def _has_only(value: str, table: Dict[int, None]) -> bool:
+    # characters ¡-￿ are allowed in url hosts together with ascii ones listed in the table
+    remaining = value.translate(table)
+    return not remaining or ("¡" <= min(remaining) and max(remaining) <= "￿")
+
+
+def _is_url_label(value: str) -> bool:
+    return bool(value) and value[0] != "-" and value[-1] != "-" and "--" not in value and _has_only(value, _URL_LABEL)
+
+
+def _is_url_hostname(value: str) -> bool:
+    labels = value.split(".")
+    if len(labels) < 2 or len(labels[-1]) < 2 or not _has_only(labels[-1], _URL_TLD):
+        return False
+
+    return all(_is_url_label(label) for label in labels[:-1])
+
+
+def _is_octet(value: str, last: bool) -> bool:
+    # first octet: [1-9]\d?|1\d\d|2[01]\d|22[0-3]
+    # middle octets: 1?\d{1,2}|2[0-4]\d|25[0-5]
+    # last octet: [1-9]\d?|1\d\d|2[0-4]\d|25[0-4]
+    length = len(value)
+    if not value.isdecimal() or length > 3:
+        return False
+    if length < 3:
+        return not last or value[0] in "123456789"
+    if value[0] == "1":
+        return True
+    if value[0] != "2":
+        return False
+    if value[1] in "01234":
+        return value[2].isdecimal()
+
+    return value[1] == "5" and value[2] in ("012345" if not last else "01234")
+
+
+def _is_url_ip(value: str) -> bool:
+    octets = value.split(".")
+    if len(octets) != 4:
+        return False
+    first, second, third, fourth = octets
+    if not first or first[0] not in "123456789" or not first.isdecimal() or len(first) > 3:
+        return False
+    if len(first) == 3 and not (
+        first[0] == "1" or (first[0] == "2" and (first[1] in "01" or (first[1] == "2" and first[2] in "0123")))
+    ):
+        return False
+    if not (_is_octet(second, False) and _is_octet(third, False) and _is_octet(fourth, True)):
+        return False
+
+    # private and local networks are excluded
+    if first in ("10", "127"):
+        return False
+    if (first, second) in (("169", "254"), ("192", "168")):
+        return False
+    if first == "172" and len(second) == 2 and second[0] in "123":
+        if second[0] == "1" and second[1] in "6789":
+            return False
+        if second[0] == "2":
+            return False
+        if second[0] == "3" and second[1] in "01":
+            return False
+
+    return True
+
+
+def _is_url_tail(rest: str, position: int, last_whitespace: int) -> bool:
+    # (?::\d{2,5})?(?:\/[^\s]*)?
+    if position < len(rest) and rest[position] == ":":
+        port_end = rest.find("/", position, position + 7)
+        if port_end == -1:
+            port_end = len(rest)
+        if not 2 <= port_end - position - 1 <= 5 or not rest[position + 1 : port_end].isdecimal():
+            return False
+        position = port_end
+    if position == len(rest):
+        return True
+
+    return rest[position] == "/" and last_whitespace < position
+
+
+def _url_host_end(rest: str, start: int) -> Optional[int]:
+    """
+    Host ends before first `:` or `/`, None is returned when `@` comes first as hosts cannot contain it.
+    Search is limited to the next `@`, which keeps total work linear when many `@` are tried as user info ends.
+    """
+    limit = rest.find("@", start)
+    if limit == -1:
+        limit = len(rest)
+    ends = [index for index in (rest.find(":", start, limit), rest.find("/", start, limit)) if index != -1]
+    if ends:
+        return min(ends)
+
+    return limit if limit == len(rest) else None
+
+
+def is_url(value: str) -> bool:
+    _ensure_string(value)
+    value = _strip_final_newline(value)
+    lowered = value[:8].translate(_FOLD_LETTERS).lower()
+    for scheme, length in _URL_SCHEMES:
+        if lowered.startswith(scheme):
+            break
+    else:
+        return False
+
+    rest = value[length:]
+    first_whitespace = _whitespace_index(rest)
+    last_whitespace = _last_whitespace_index(rest)
+
+    # host starts right after the scheme or after any `@` preceded by non-empty user info without whitespace
+    start: Optional[int] = 0
+    while start is not None:
+        end = _url_host_end(rest, start)
+        if end is not None and end > start:
+            host = rest[start:end]
+            if (_is_url_ip(host) or _is_url_hostname(host)) and _is_url_tail(rest, end, last_whitespace):
+                return True
+        at = rest.find("@", max(start, 1), first_whitespace)
+        start = at + 1 if at != -1 else None
+
+    return False
@@ -4,6 +4,9 @@ from datetime import datetime
 from datetime import time
 from datetime import timedelta
 from datetime import timezone
+from functools import lru_cache
+from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 
 __all__ = [
@@ -18,59 +21,99 @@ T = TypeVar("T")
 
 
 ISO_8601_DATETIME_REGEX = re.compile(
-    r"^(\d{4})-?([0-1]\d)-?([0-3]\d)[t\s]?([0-2]\d:?[0-5]\d:?[0-5]\d|23:59:60|235960)(\.\d+)?(z|[+-]\d{2}:\d{2})?$",
+    r"(?P<year>\d{4})-?(?P<month>[0-1]\d)-?(?P<day>[0-3]\d)[t\s]?"
+    r"(?:(?P<hour>[0-2]\d):?(?P<minute>[0-5]\d):?(?P<second>[0-5]\d)|(?P<leap>23:59:60|235960))"
+    r"(?P<fraction>\.\d+)?(?P<offset>z|[+-]\d{2}:\d{2})?",
     re.I,
 )
-ISO_8601_DATE_REGEX = re.compile(r"^(\d{4})-?([0-1]\d)-?([0-3]\d)$", re.I)
+ISO_8601_DATE_REGEX = re.compile(r"(?P<year>\d{4})-?(?P<month>[0-1]\d)-?(?P<day>[0-3]\d)", re.I)
 ISO_8601_TIME_REGEX = re.compile(
-    r"^(?P<time>[0-2]\d:?[0-5]\d:?[0-5]\d|23:59:60|235960)(?P<microseconds>\.\d+)?(?P<tzpart>z|[+-]\d{2}:\d{2})?$",
+    r"(?:(?P<hour>[0-2]\d):?(?P<minute>[0-5]\d):?(?P<second>[0-5]\d)|(?P<leap>23:59:60|235960))"
+    r"(?P<fraction>\.\d+)?(?P<offset>z|[+-]\d{2}:\d{2})?",
     re.I,
 )
 
 ISO_8601_TIME_DURATION_REGEX = re.compile(
-    r"^(?P<sign>-?)P(?=\d|T\d)(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$",
+    r"(?P<sign>-?)P(?=\d|T\d)(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?",
     re.I,
 )
 
+# lengths of `HH:MM:SS`, `HH:MM:SS.fff` and `HH:MM:SS.ffffff` which `fromisoformat` accepts in every python version
+_FAST_TIME_LENGTHS = (8, 12, 15)
 
-def parse_iso_datetime_string(value: str) -> datetime:
 
-    if not ISO_8601_DATETIME_REGEX.match(value):
-        raise ValueError(f"passed value {value!r} is not valid ISO-8601 datetime.")
+@lru_cache(maxsize=128)
+def _parse_offset(value: str) -> timezone:
+    if value in ("z", "Z"):
+        return timezone.utc
+    sign = -1 if value[0] == "-" else 1
+    return timezone(timedelta(hours=int(value[1:3]) * sign, minutes=int(value[4:6]) * sign))
+
+
+def _parse_fraction(value: Optional[str]) -> int:
+    if not value:
+        return 0
+    # digits after microseconds are truncated, same as `datetime.fromisoformat` does
+    return int(value[1:7].ljust(6, "0"))
+
+
+def _split_offset(value: str) -> Tuple[str, Optional[timezone]]:
+    if value[-1:] in ("z", "Z"):
+        return value[:-1], timezone.utc
+    if len(value) > 6 and value[-6] in "+-" and value[-3] == ":":
+        return value[:-6], _parse_offset(value[-6:])
+
+    return value, None
+
+
+def _is_fast_time(value: str) -> bool:
+    return len(value) in _FAST_TIME_LENGTHS and value[2] == ":" and value[5] == ":" and value[8:9] in ("", ".")
 
-    date_parts = ISO_8601_DATETIME_REGEX.findall(value)[0]
-    time_part = date_parts[3]
-    if ":" in time_part:
-        time_part = time_part.split(":")
-    else:
-        time_part = list(map("".join, zip(*[iter(time_part)] * 2)))
-
-    if date_parts[5] and date_parts[5].lower() != "z":
-        sign = 1 if date_parts[5][0] == "+" else -1
-        hours, minutes = date_parts[5][1:].split(":")
-        offset = timezone(timedelta(hours=int(hours) * sign, minutes=int(minutes) * sign))
-    elif date_parts[5] and date_parts[5].lower() == "z":
-        offset = timezone.utc
-    else:
-        offset = None  # type: ignore
 
+def parse_iso_datetime_string(value: str) -> datetime:
+    # canonical `YYYY-MM-DDTHH:MM:SS[.ffffff][offset]` values are parsed by `datetime.fromisoformat`,
+    # other forms accepted by the regex (basic format, other fractions, leap seconds) take the slow path
+    if len(value) >= 19 and value.isascii() and value[4] == "-" and value[7] == "-" and value[10] in "T ":
+        body, offset = _split_offset(value)
+        if _is_fast_time(body[11:]):
+            try:
+                result = datetime.fromisoformat(body)
+            except ValueError:
+                pass
+            else:
+                return result.replace(tzinfo=offset) if offset is not None else result
+
+    match = ISO_8601_DATETIME_REGEX.fullmatch(value)
+    if match is None:
+        raise ValueError(f"passed value {value!r} is not valid ISO-8601 datetime.")
+    if match.group("leap"):
+        raise ValueError(f"passed value {value!r} contains leap second, which is not supported.")
+
+    offset = match.group("offset")
     return datetime(
-        year=int(date_parts[0]),
-        month=int(date_parts[1]),
-        day=int(date_parts[2]),
-        hour=int(time_part[0]),
-        minute=int(time_part[1]),
-        second=int(time_part[2]),
-        tzinfo=offset,
+        int(match.group("year")),
+        int(match.group("month")),
+        int(match.group("day")),
+        int(match.group("hour")),
+        int(match.group("minute")),
+        int(match.group("second")),
+        _parse_fraction(match.group("fraction")),
+        _parse_offset(offset) if offset else None,
     )
 
 
 def parse_iso_date_string(value: str) -> date:
-    if not ISO_8601_DATE_REGEX.match(value):
+    if len(value) == 10 and value.isascii() and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    match = ISO_8601_DATE_REGEX.fullmatch(value)
+    if match is None:
         raise ValueError("Passed value is not valid ISO-8601 date.")
 
-    date_parts = ISO_8601_DATE_REGEX.findall(value)[0]
-    return date(year=int(date_parts[0]), month=int(date_parts[1]), day=int(date_parts[2]))
+    return date(int(match.group("year")), int(match.group("month")), int(match.group("day")))
 
 
 def parse_iso_duration_string(value: str) -> timedelta:
@@ -80,60 +123,46 @@ def parse_iso_duration_string(value: str) -> timedelta:
     :param str value:
     :return dict:
     """
-    if not ISO_8601_TIME_DURATION_REGEX.match(value):
-        raise ValueError(f"Passed value {value} is not valid ISO-8601 duration.")
-
     duration = ISO_8601_TIME_DURATION_REGEX.fullmatch(value)
-    sign = -1 if duration.group("sign") else 1  # type: ignore
+    if duration is None:
+        raise ValueError(f"Passed value {value} is not valid ISO-8601 duration.")
 
-    kwargs = {
-        "weeks": int(duration.group("weeks")) * sign if duration.group("weeks") else 0,  # type: ignore
-        "days": int(duration.group("days")) * sign if duration.group("days") else 0,  # type: ignore
-        "hours": int(duration.group("hours")) * sign if duration.group("hours") else 0,  # type: ignore
-        "minutes": int(duration.group("minutes")) * sign  # type: ignore
-        if duration.group("minutes")  # type: ignore
-        else 0,
-        "seconds": float(duration.group("seconds")) * sign  # type: ignore
-        if duration.group("seconds")  # type: ignore
-        else 0,
-    }
+    sign = -1 if duration.group("sign") else 1
+    weeks, days, hours, minutes, seconds = duration.group("weeks", "days", "hours", "minutes", "seconds")
 
-    return timedelta(**kwargs)  # type: ignore
+    return timedelta(
+        weeks=int(weeks) * sign if weeks else 0,
+        days=int(days) * sign if days else 0,
+        hours=int(hours) * sign if hours else 0,
+        minutes=int(minutes) * sign if minutes else 0,
+        seconds=float(seconds) * sign if seconds else 0,
+    )
 
 
 def parse_iso_time_string(value: str) -> time:
-    if not ISO_8601_TIME_REGEX.match(value):
+    if value.isascii():
+        body, offset = _split_offset(value)
+        if _is_fast_time(body):
+            try:
+                result = time.fromisoformat(body)
+            except ValueError:
+                pass
+            else:
+                return result.replace(tzinfo=offset) if offset is not None else result
+
+    match = ISO_8601_TIME_REGEX.fullmatch(value)
+    if match is None:
         raise ValueError(f"Passed value {value} is not valid ISO-8601 time.")
+    if match.group("leap"):
+        raise ValueError(f"Passed value {value} contains leap second, which is not supported.")
 
-    time_parts = ISO_8601_TIME_REGEX.fullmatch(value)
-    hour_parts = time_parts.group("time")  # type: ignore
-    if ":" in hour_parts:
-        hour_parts = hour_parts.split(":")
-    else:
-        hour_parts = list(map("".join, zip(*[iter(hour_parts)] * 2)))
-
-    microseconds = time_parts.group("microseconds")  # type: ignore
-    if microseconds is not None:
-        microseconds = int(microseconds[1:])
-    else:
-        microseconds = 0
-
-    tz_part = time_parts.group("tzpart")  # type: ignore
-    if tz_part and tz_part.lower() != "z":
-        sign = 1 if tz_part[0] == "+" else -1
-        hours, minutes = tz_part[1:].split(":")
-        offset = timezone(timedelta(hours=int(hours) * sign, minutes=int(minutes) * sign))
-    elif tz_part and tz_part.lower() == "z":
-        offset = timezone.utc
-    else:
-        offset = None  # type: ignore
-
+    offset = match.group("offset")
     return time(
-        hour=int(hour_parts[0]),
-        minute=int(hour_parts[1]),
-        second=int(hour_parts[2]),
-        microsecond=microseconds,
-        tzinfo=offset,
+        int(match.group("hour")),
+        int(match.group("minute")),
+        int(match.group("second")),
+        _parse_fraction(match.group("fraction")),
+        _parse_offset(offset) if offset else None,
     )
 
 
@@ -0,0 +1,107 @@
+import io
+import json
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import IO
+from typing import Optional
+from typing import Union
+
+ORJSON_SUPPORT = True
+
+
+try:
+    import orjson
+except ImportError:
+    ORJSON_SUPPORT = False
+
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+
+class JsonBackend:
+    """
+    Encodes native python values into json, values unknown to the backend are passed to `default` hook.
+    """
+
+    def dumps(self, value: Any, default: Callable[[Any], Any]) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: JsonInput) -> Any:
+        raise NotImplementedError
+
+    def dump(self, value: Any, fp: IO, default: Callable[[Any], Any]) -> None:
+        data = self.dumps(value, default)
+        fp.write(data if is_binary_file(fp) else data.decode("utf8"))
+
+
+class StandardJsonBackend(JsonBackend):
+    def dumps(self, value: Any, default: Callable[[Any], Any]) -> bytes:
+        return json.dumps(value, default=default, ensure_ascii=False, separators=(",", ":")).encode("utf8")
+
+    def dump(self, value: Any, fp: IO, default: Callable[[Any], Any]) -> None:
+        if is_binary_file(fp):
+            fp.write(self.dumps(value, default))
+            return None
+        json.dump(value, fp, default=default, ensure_ascii=False, separators=(",", ":"))
+
+    def loads(self, data: JsonInput) -> Any:
+        if isinstance(data, memoryview):
+            # json module does not accept buffers, decoding is the only copy made
+            data = str(data, "utf8")
+        return json.loads(data)
+
+
+if ORJSON_SUPPORT:
+
+    class OrjsonBackend(JsonBackend):
+        # python's dataclasses and datetimes are passed through and non-str keys are encoded like json module
+        # does, so output does not depend on installed backend
+        options = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+        def dumps(self, value: Any, default: Callable[[Any], Any]) -> bytes:
+            try:
+                return orjson.dumps(value, default=default, option=self.options)
+            except TypeError:
+                # orjson rejects integers wider than 64 bits, json module encodes them (and reports unsupported
+                # values the same way)
+                return _STANDARD_BACKEND.dumps(value, default)
+
+        def loads(self, data: JsonInput) -> Any:
+            return orjson.loads(data)
+
+
+_STANDARD_BACKEND = StandardJsonBackend()
+_BACKENDS: Dict[str, JsonBackend] = {"json": _STANDARD_BACKEND}
+_DEFAULT_BACKEND = "json"
+
+if ORJSON_SUPPORT:
+    _BACKENDS["orjson"] = OrjsonBackend()
+    _DEFAULT_BACKEND = "orjson"
+
+
+def register_backend(name: str, backend: JsonBackend, default: bool = False) -> None:
+    global _DEFAULT_BACKEND
+    _BACKENDS[name] = backend
+    if default:
+        _DEFAULT_BACKEND = name
+
+
+def get_backend(name: Optional[Union[str, JsonBackend]] = None) -> JsonBackend:
+    if isinstance(name, JsonBackend):
+        return name
+    if name is None:
+        name = _DEFAULT_BACKEND
+    if name not in _BACKENDS:
+        raise ValueError(f"unknown json backend {name}, available backends: {', '.join(_BACKENDS)}")
+
+    return _BACKENDS[name]
+
+
+def is_binary_file(fp: IO) -> bool:
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if isinstance(fp, io.TextIOBase):
+        return False
+
+    return "b" in getattr(fp, "mode", "")
@@ -3,31 +3,43 @@ import decimal
 import ipaddress
 import re
 import uuid
+from collections import abc
 from datetime import date
 from datetime import datetime
 from datetime import time
 from datetime import timedelta
 from typing import Any
-from typing import Callable
+from typing import Collection
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Pattern
+from typing import Type
 from typing import TypeVar
 from typing import Union
 
 from gata import bson_support
+from gata import caching
 from .base_mapping import Mapping
+from .base_mapping import serialisation_profile
+from .epoch import DATETIME_UNITS
+from .epoch import datetime_to_epoch
+from .epoch import epoch_to_datetime
+from .epoch import epoch_unit
+from .epoch import is_epoch_number
+from .epoch import number_to_timedelta
+from .epoch import ordinal_to_date
+from .epoch import timedelta_to_number
+from .errors import FieldError
 from .errors import FormatValidationError
+from .errors import TypeValidationError
 from .errors import ValidationError
-from .iso_datetime import parse_iso_date_string
-from .iso_datetime import parse_iso_datetime_string
-from .iso_datetime import parse_iso_duration_string
-from .iso_datetime import parse_iso_time_string
-from .iso_datetime import timedelta_to_iso_string
+from .profile import Profile
 from .stringformat import StringFormat
+from .tagging import tagged_class
 from .validators import TRUTHY_EXPRESSION
-from .validators import validate_any
 from .validators import validate_boolean
 from .validators import validate_bytes
 from .validators import validate_date
@@ -41,6 +53,7 @@ from .validators import validate_hostname
 from .validators import validate_integer
 from .validators import validate_ipv4
 from .validators import validate_ipv6
+from .validators import validate_iterable_items
 from .validators import validate_length
 from .validators import validate_list
 from .validators import validate_multiple_of
@@ -51,7 +64,6 @@ from .validators import validate_semver
 from .validators import validate_set
 from .validators import validate_string
 from .validators import validate_time
-from .validators import validate_tuple
 from .validators import validate_uri
 from .validators import validate_url
 from .validators import validate_uuid
@@ -106,7 +118,11 @@ __all__ = [
     "Ipv6AddressMapping",
     "ListMapping",
     "SetMapping",
+    "FrozenSetMapping",
     "TupleMapping",
+    "DictMapping",
+    "TypedDictMapping",
+    "LiteralMapping",
     "AnyTypeMapping",
 ]
 
@@ -118,6 +134,8 @@ if bson_support.BSON_SUPPORT:
 
 
 class BooleanMapping(Mapping):
+    python_type = bool
+
     def validate(self, value: Any) -> Any:
         return validate_boolean(value)
 
@@ -133,6 +151,9 @@ class BytesMapping(Mapping):
     minimum: int
     maximum: int
 
+    native_profiles = frozenset([Profile.PYTHON, Profile.BSON])
+    python_type = bytes
+
     def validate(self, value: Any) -> Any:
         value = validate_bytes(value)
         validate_range(value, self.minimum, self.maximum)
@@ -156,6 +177,8 @@ class IntegerMapping(Mapping):
     maximum: int
     multiple_of: int
 
+    python_type = int
+
     def validate(self, value: Any) -> Any:
         value = validate_integer(value)
         validate_range(value, self.minimum, self.maximum)
@@ -171,6 +194,8 @@ class FloatMapping(Mapping):
     maximum: float
     multiple_of: float
 
+    python_type = float
+
     def validate(self, value: Any) -> Any:
         value = validate_float(value)
         validate_range(value, self.minimum, self.maximum)
@@ -186,20 +211,30 @@ class StringMapping(Mapping):
     maximum: int
     pattern: Pattern[str]
     format: StringFormat
+    cache: caching.CacheOption
+
+    python_type = str
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if self.pattern and isinstance(self.pattern, str):
             self.pattern = re.compile(f"^{self.pattern}$")
+        self.validator = caching.validation_cache(self._validate_format, self.cache)
 
-    def validate(self, value: Any) -> Any:
-        value = validate_string(value)
-
+    def _validate_format(self, value: str) -> str:
         if self.format:
             _FORMAT_TO_VALIDATOR_MAP[self.format](value)
         if self.pattern and not self.pattern.match(value):
             raise FormatValidationError(expected_format=self.pattern.pattern)
 
+        return value
+
+    def validate(self, value: Any) -> Any:
+        value = validate_string(value)
+
+        if self.format or self.pattern:
+            self.validator(value)
+
         validate_length(value, self.minimum, self.maximum)
 
         return value
@@ -209,12 +244,17 @@ class DecimalMapping(Mapping):
     minimum: decimal.Decimal
     maximum: decimal.Decimal
 
+    native_profiles = frozenset([Profile.PYTHON])
+    python_type = decimal.Decimal
+
     def validate(self, value: Any) -> Any:
         value = validate_decimal(value)
         validate_range(value, self.minimum, self.maximum)
         return value
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
+        if bson_support.BSON_SUPPORT and serialisation_profile(mapping) is Profile.BSON:
+            return bson_support.to_decimal128(value)
         return str(value)
 
     def deserialise(self, value: Any) -> Any:
@@ -224,13 +264,29 @@ class DecimalMapping(Mapping):
 class TimedeltaMapping(Mapping):
     minimum: timedelta
     maximum: timedelta
+    cache: caching.CacheOption
+    epoch: Optional[str]
+
+    native_profiles = frozenset([Profile.PYTHON])
+    python_type = timedelta
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.epoch = epoch_unit(self.epoch, "us", DATETIME_UNITS)
+        self.parser = caching.get_cache("parse_duration", self.cache)
+        self.formatter = caching.get_cache("format_duration", self.cache)
 
     def validate(self, value: Any) -> Any:
-        if not isinstance(value, timedelta):
+        if self.epoch and is_epoch_number(value):
+            try:
+                value = number_to_timedelta(value, self.epoch)
+            except (OverflowError, ValueError):
+                raise TypeValidationError(expected_type=timedelta)
+        elif not isinstance(value, timedelta):
             if not isinstance(value, str):
                 raise ValidationError("Passed value must be valid ISO-8601 duration expression")
             try:
-                value = parse_iso_duration_string(value)
+                value = self.parser(value)
             except ValueError:
                 raise ValidationError("Passed value must be valid ISO-8601 duration expression.")
 
@@ -238,15 +294,28 @@ class TimedeltaMapping(Mapping):
         return value
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
-        return timedelta_to_iso_string(value)
+        if self.epoch:
+            return timedelta_to_number(value, self.epoch)
+        return self.formatter(value)
 
     def deserialise(self, value: Any) -> Any:
-        return parse_iso_duration_string(value)
+        if self.epoch and is_epoch_number(value):
+            return number_to_timedelta(value, self.epoch)
+        return self.parser(value)
 
 
 class UUIDMapping(Mapping):
+    cache: caching.CacheOption
+
+    native_profiles = frozenset([Profile.PYTHON])
+    python_type = uuid.UUID
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.validator = caching.validation_cache(validate_uuid, self.cache)
+
     def validate(self, value: Any) -> Any:
-        return validate_uuid(value)
+        return self.validator(value)
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
         return str(value)
@@ -258,55 +327,115 @@ class UUIDMapping(Mapping):
 class DateMapping(Mapping):
     minimum: date
     maximum: date
+    cache: caching.CacheOption
+    epoch: Optional[str]
+
+    native_profiles = frozenset([Profile.PYTHON])
+    python_type = date
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.epoch = epoch_unit(self.epoch, "ordinal", ("ordinal",))
+        self.parser = caching.get_cache("parse_date", self.cache)
+        self.formatter = caching.get_cache("format_date", self.cache)
 
     def validate(self, value: Any) -> Any:
-        value = validate_date(value)
+        if self.epoch and is_epoch_number(value):
+            try:
+                value = ordinal_to_date(value)
+            except (OverflowError, ValueError):
+                raise TypeValidationError(expected_type=date)
+        else:
+            value = validate_date(value, self.parser)
         validate_range(value, self.minimum, self.maximum)
 
         return value
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
-        return value.isoformat()
+        if self.epoch:
+            return value.toordinal()
+        return self.formatter(value)
 
     def deserialise(self, value: Any) -> date:
-        return parse_iso_date_string(value)
+        if self.epoch and is_epoch_number(value):
+            return ordinal_to_date(value)
+        return self.parser(value)
 
 
 class DateTimeMapping(Mapping):
+    """
+    With `epoch` option (normalised to unit name) datetimes are serialised as numbers since unix epoch. Naive
+    datetimes are treated as utc and numbers are always deserialised into aware utc datetimes, so naive values
+    do not round trip: `deserialise(serialise(value))` equals `value.replace(tzinfo=timezone.utc)`.
+    """
+
     minimum: datetime
     maximum: datetime
+    cache: caching.CacheOption
+    epoch: Optional[str]
+
+    native_profiles = frozenset([Profile.PYTHON, Profile.BSON])
+    python_type = datetime
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.epoch = epoch_unit(self.epoch, "ms", DATETIME_UNITS)
+        self.parser = caching.get_cache("parse_datetime", self.cache)
+        self.formatter = caching.get_cache("format_datetime", self.cache)
 
     def validate(self, value: Any) -> Any:
-        value = validate_datetime(value)
+        if self.epoch and is_epoch_number(value):
+            try:
+                value = epoch_to_datetime(value, self.epoch)
+            except (OverflowError, ValueError):
+                raise TypeValidationError(expected_type=datetime)
+        else:
+            value = validate_datetime(value, self.parser)
         validate_range(value, self.minimum, self.maximum)
 
         return value
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
-        return value.isoformat()
+        if self.epoch:
+            return datetime_to_epoch(value, self.epoch)
+        return self.formatter(value)
 
     def deserialise(self, value: Any) -> datetime:
-        return parse_iso_datetime_string(value)
+        if self.epoch and is_epoch_number(value):
+            return epoch_to_datetime(value, self.epoch)
+        return self.parser(value)
 
 
 class TimeMapping(Mapping):
     minimum: time
     maximum: time
+    cache: caching.CacheOption
+
+    native_profiles = frozenset([Profile.PYTHON])
+    python_type = time
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.parser = caching.get_cache("parse_time", self.cache)
+        self.formatter = caching.get_cache("format_time", self.cache)
 
     def validate(self, value: Any) -> Any:
-        value = validate_time(value)
+        value = validate_time(value, self.parser)
         validate_range(value, self.minimum, self.maximum)
 
         return value
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
-        return value.isoformat()
+        return self.formatter(value)
 
     def deserialise(self, value: Any) -> time:
-        return parse_iso_time_string(value)
+        return self.parser(value)
 
 
 class RegexPatternMapping(Mapping):
+    native_profiles = frozenset([Profile.PYTHON, Profile.BSON])
+    python_type = re.Pattern
+
     def validate(self, value: Any) -> Any:
         return validate_pattern(value)
 
@@ -318,8 +447,17 @@ class RegexPatternMapping(Mapping):
 
 
 class Ipv4AddressMapping(Mapping):
+    cache: caching.CacheOption
+
+    native_profiles = frozenset([Profile.PYTHON])
+    python_type = ipaddress.IPv4Address
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.validator = caching.validation_cache(validate_ipv4, self.cache)
+
     def validate(self, value: Any) -> Any:
-        return validate_ipv4(value)
+        return self.validator(value)
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
         return str(value)
@@ -329,8 +467,17 @@ class Ipv4AddressMapping(Mapping):
 
 
 class Ipv6AddressMapping(Mapping):
+    cache: caching.CacheOption
+
+    native_profiles = frozenset([Profile.PYTHON])
+    python_type = ipaddress.IPv6Address
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.validator = caching.validation_cache(validate_ipv6, self.cache)
+
     def validate(self, value: Any) -> Any:
-        return validate_ipv6(value)
+        return self.validator(value)
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
         return str(value)
@@ -339,12 +486,67 @@ class Ipv6AddressMapping(Mapping):
         return ipaddress.IPv6Address(value)
 
 
+def _identity_type(mapping: Mapping) -> Optional[type]:
+    """
+    Returns type of values which the mapping validates, serialises and deserialises as they are (`object` when
+    every value is accepted), None is returned for mappings which convert or constrain values.
+    """
+    if mapping.__class__ is AnyTypeMapping:
+        return object
+    if mapping.__class__ is StringMapping:
+        if mapping.format or mapping.pattern or mapping.minimum is not None or mapping.maximum is not None:
+            return None
+        return str
+    if mapping.__class__ in (IntegerMapping, FloatMapping):
+        if mapping.multiple_of or mapping.minimum is not None or mapping.maximum is not None:
+            return None
+        return mapping.python_type
+
+    return None
+
+
+def _all_of_type(values: Iterable[Any], value_type: Optional[type]) -> bool:
+    if value_type is object:
+        return True
+    if value_type is None:
+        return False
+    for value in values:
+        if value.__class__ is not value_type:
+            return False
+
+    return True
+
+
+def _is_kept(value: Any, collection_type: Type[Union[list, set, frozenset]], item_identity: Optional[type]) -> bool:
+    return item_identity is not None and value.__class__ is collection_type and _all_of_type(value, item_identity)
+
+
+def _deserialise_items(
+    value: Any, item_type: Mapping, item_identity: Optional[type], collection_type: Type[Union[list, set, frozenset]]
+) -> Any:
+    """
+    Collections of the target type are kept unless some of their items change, other values are converted.
+    """
+    if value.__class__ is collection_type:
+        if item_identity is not None:
+            return value
+        return validate_iterable_items(value, item_type.deserialise)
+    if item_identity is not None:
+        return collection_type(value)
+
+    return collection_type(map(item_type.deserialise, value))
+
+
 def _serialise_iterable(
     value: Any, item_type: Optional[Mapping] = None, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None,
 ) -> List[Any]:
     result: List[Any] = []
     if not value:
         return result
+    if not isinstance(mapping, dict):
+        mapping = None
+    if item_type is not None and serialisation_profile(mapping) in item_type.native_profiles:
+        return list(value)
     for item in value:
         if not mapping:
             result.append(item_type.serialise(item) if item_type else item)
@@ -358,46 +560,73 @@ def _serialise_iterable(
 
 
 class ListMapping(Mapping):
+    """
+    Validated and deserialised lists are returned as they are, unless some of their items change. Items of types
+    which mappings only check (`str`, `int` or `float` without constraints and `Any`) are not passed to the item
+    mapping at all. With `copy` option a new list is returned every time.
+    """
+
     minimum: int
     maximum: int
     items: List[Mapping]
+    copy: bool
+
+    python_type = list
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.item_type: Mapping = self.items[0] if isinstance(self.items, list) and self.items else AnyTypeMapping()
+        self.item_identity = _identity_type(self.item_type)
 
     def validate(self, value: Any) -> Any:
-        value = validate_list(value, self.items[0].validate if self.items else None)
+        result = value
+        if not _is_kept(value, list, self.item_identity):
+            result = validate_list(value, self.item_type.validate)
 
-        validate_length(value, self.minimum, self.maximum)
-        return value
+        validate_length(result, self.minimum, self.maximum)
+        return list(result) if self.copy and result is value else result
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
         return _serialise_iterable(value, self.items[0] if self.items else None, mapping)
 
     def deserialise(self, value: Any) -> Any:
-        result = []
-        for item in value:
-            result.append(self.items[0].deserialise(value=item))
-        return result
+        result = _deserialise_items(value, self.item_type, self.item_identity, list)
+
+        return list(result) if self.copy and result is value else result
 
 
 class SetMapping(Mapping):
+    """
+    Same as `ListMapping`, sets are kept unless some of their items change.
+    """
+
     minimum: int
     maximum: int
     items: Optional[List[Mapping]]
+    copy: bool
+
+    python_type = set
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.item_type: Mapping = self.items[0] if isinstance(self.items, list) and self.items else AnyTypeMapping()
+        self.item_identity = _identity_type(self.item_type)
 
     def validate(self, value: Any) -> Any:
-        value = validate_set(value, self.items[0].validate if self.items else None)
+        result = value
+        if not _is_kept(value, set, self.item_identity):
+            result = validate_set(value, self.item_type.validate)
 
-        validate_length(value, self.minimum, self.maximum)
-        return value
+        validate_length(result, self.minimum, self.maximum)
+        return set(result) if self.copy and result is value else result
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
         return _serialise_iterable(value, self.items[0] if self.items else None, mapping)
 
     def deserialise(self, value: Any) -> Any:
-        if self.items:
-            result = [self.items[0].deserialise(value=item) for item in value]
-        else:
-            result = value
-        return set(result)
+        result = _deserialise_items(value, self.item_type, self.item_identity, set)
+
+        return set(result) if self.copy and result is value else result
 
 
 class FrozenSetMapping(Mapping):
@@ -405,8 +634,16 @@ class FrozenSetMapping(Mapping):
     maximum: int
     items: Optional[List[Mapping]]
 
+    python_type = frozenset
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.item_type: Mapping = self.items[0] if isinstance(self.items, list) and self.items else AnyTypeMapping()
+        self.item_identity = _identity_type(self.item_type)
+
     def validate(self, value: Any) -> Any:
-        value = validate_frozenset(value, self.items[0].validate if self.items else None)
+        if not _is_kept(value, frozenset, self.item_identity):
+            value = validate_frozenset(value, self.item_type.validate)
 
         validate_length(value, self.minimum, self.maximum)
         return value
@@ -415,52 +652,241 @@ class FrozenSetMapping(Mapping):
         return _serialise_iterable(value, self.items[0] if self.items else None, mapping)
 
     def deserialise(self, value: Any) -> Any:
-        if self.items:
-            result = [self.items[0].deserialise(value=item) for item in value]
-        else:
-            result = value
-        return frozenset(result)
+        return _deserialise_items(value, self.item_type, self.item_identity, frozenset)
 
 
 class TupleMapping(Mapping):
+    """
+    Items are validated, serialised and deserialised by the mapping of their position, items past the ellipsis
+    (`Tuple[int, ...]`) use the mapping preceding it. Tuples of fixed length must have an item for every mapping.
+    """
+
     minimum: int
     maximum: int
     items: List[Union[Mapping, Any]]
-    validators: List[Union[Callable, Any]]
+
+    python_type = tuple
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        items = self.items if isinstance(self.items, list) else []
+        self.item_types: List[Mapping] = [item for item in items if item is not ...]
+        self.rest_type: Optional[Mapping] = None
+        if not items:
+            self.rest_type = AnyTypeMapping()
+        elif items[-1] is ...:
+            if not self.item_types:
+                raise TypeError("tuple items cannot consist of ellipsis only")
+            self.rest_type = self.item_types[-1]
+
+    def _item_types(self, length: int) -> List[Mapping]:
+        if self.rest_type is None or length <= len(self.item_types):
+            return self.item_types
+
+        return self.item_types + [self.rest_type] * (length - len(self.item_types))
 
     def validate(self, value: Any) -> Any:
-        if not self.validators:
-            self.validators = [item_type.validate for item_type in self.items if isinstance(item_type, Mapping)]
-            if self.items[-1] is ...:
-                self.validators.append(...)
+        # lists are accepted as well, tuples are serialised into them
+        if not isinstance(value, (tuple, list)):
+            raise TypeValidationError(expected_type=tuple)
+        if self.rest_type is None:
+            validate_length(value, len(self.item_types), len(self.item_types))
 
-        return validate_tuple(value, self.validators)
+        value = tuple([item_type.validate(item) for item_type, item in zip(self._item_types(len(value)), value)])
+        validate_length(value, self.minimum, self.maximum)
+        return value
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
-        return value
+        profile = serialisation_profile(mapping)
+        if not isinstance(mapping, dict):
+            mapping = None
+
+        return [
+            item if profile in item_type.native_profiles else item_type.serialise(item, mapping)
+            for item_type, item in zip(self._item_types(len(value)), value)
+        ]
 
     def deserialise(self, value: Any) -> Any:
-        return value
+        return tuple([item_type.deserialise(item) for item_type, item in zip(self._item_types(len(value)), value)])
+
+
+class DictMapping(Mapping):
+    """
+    Keys and values go through their mappings item by item, unless the mappings only check type of values
+    (`str`, `int` or `float` without constraints and `Any`). Dicts of such keys and values are type-checked
+    and returned as they are, so large dicts are not copied. With `copy` option a new dict is returned every time.
+    """
+
+    minimum: int
+    maximum: int
+    items: List[Mapping]
+    copy: bool
+
+    python_type = dict
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        key_type, value_type = self.items if isinstance(self.items, list) and len(self.items) == 2 else (None, None)
+        self.key_type: Mapping = key_type or AnyTypeMapping()
+        self.value_type: Mapping = value_type or AnyTypeMapping()
+        self.key_identity = _identity_type(self.key_type)
+        self.value_identity = _identity_type(self.value_type)
+
+    def validate(self, value: Any) -> Any:
+        if not isinstance(value, abc.Mapping):
+            raise TypeValidationError(expected_type=dict)
+        result = value
+        if (
+            value.__class__ is not dict
+            or not _all_of_type(value, self.key_identity)
+            or not _all_of_type(value.values(), self.value_identity)
+        ):
+            result = {self.key_type.validate(key): self.value_type.validate(item) for key, item in value.items()}
+
+        validate_length(result, self.minimum, self.maximum)
+        return dict(result) if self.copy and result is value else result
+
+    def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
+        profile = serialisation_profile(mapping)
+        keys_kept = self.key_identity is not None or profile in self.key_type.native_profiles
+        values_kept = self.value_identity is not None or profile in self.value_type.native_profiles
+        if keys_kept and values_kept:
+            return value
+        if not isinstance(mapping, dict):
+            mapping = None
+
+        return {self.key_type.serialise(key): self.value_type.serialise(item, mapping) for key, item in value.items()}
+
+    def deserialise(self, value: Any) -> Any:
+        if self.key_identity is not None and self.value_identity is not None:
+            return dict(value) if self.copy else value
+
+        return {self.key_type.deserialise(key): self.value_type.deserialise(item) for key, item in value.items()}
+
+
+class TypedDictMapping(Mapping):
+    """
+    Values of declared keys go through their mappings, undeclared keys are kept as they are. Dict is copied
+    only when some of its values are converted.
+    """
+
+    typed_dict: Any
+    fields: Dict[str, Mapping]
+    required_keys: FrozenSet[str]
+
+    python_type = dict
+
+    def validate(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise TypeValidationError(expected_type=dict)
+        result = value
+        for key, item_type in self.fields.items():
+            if key not in value and key not in self.required_keys:
+                continue
+            item = value.get(key)
+            try:
+                validated = item_type.validate(item)
+            except ValidationError as error:
+                raise FieldError(key, error) from error
+            if validated is not item and key in value:
+                if result is value:
+                    result = dict(value)
+                result[key] = validated
+
+        return result
+
+    def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
+        profile = serialisation_profile(mapping)
+        result = value
+        for key, item_type in self.fields.items():
+            if key not in value or profile in item_type.native_profiles:
+                continue
+            item = value[key]
+            serialised = item_type.serialise(item, mapping)
+            if serialised is not item:
+                if result is value:
+                    result = dict(value)
+                result[key] = serialised
+
+        return result
+
+    def deserialise(self, value: Any) -> Any:
+        result = value
+        for key, item_type in self.fields.items():
+            if key not in value:
+                continue
+            item = value[key]
+            deserialised = item_type.deserialise(item)
+            if deserialised is not item:
+                if result is value:
+                    result = dict(value)
+                result[key] = deserialised
+
+        return result
 
 
 class UnionMapping(Mapping):
+    """
+    Values are dispatched by their exact type: member mapping of that type is tried first and the remaining
+    members follow in declared order. Dispatch order is computed once per type of value.
+    """
+
     items: List[Mapping]
-    validators: List[Callable]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.dispatch: Dict[type, List[Mapping]] = {}
+
+    def _members(self, value_type: type) -> List[Mapping]:
+        if value_type not in self.dispatch:
+            owners = [item for item in self.items if item.python_type is value_type]
+            self.dispatch[value_type] = owners + [item for item in self.items if item not in owners]
+
+        return self.dispatch[value_type]
+
+    def _serialising_member(self, value: Any) -> Optional[Mapping]:
+        members = self._members(type(value))
+        if members and members[0].python_type is type(value):
+            return members[0]
+        for item in self.items:
+            if item.python_type is not None and isinstance(value, item.python_type):
+                return item
+
+        return None
 
     def validate(self, value: Any) -> Any:
-        if not self.validators:
-            self.validators = [item_type.validate for item_type in self.items]
+        for item in self._members(type(value)):
+            try:
+                return item.validate(value)
+            except ValueError:
+                continue
 
-        return validate_any(value, self.validators)
+        raise ValidationError("Value could not be validated", code="any_error")
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
-        return value
+        item = self._serialising_member(value)
+        if item is None or serialisation_profile(mapping) in item.native_profiles:
+            return value
+
+        return item.serialise(value, mapping)
 
     def deserialise(self, value: Any) -> Any:
+        members = self._members(type(value))
+        if members and members[0].python_type is type(value) and isinstance(members[0], _LEAF_MAPPINGS):
+            # scalar value of member's type is already deserialised, containers still convert their items
+            return value
+        for item in members:
+            try:
+                return item.deserialise(value)
+            except (TypeError, ValueError):
+                continue
+
         return value
 
 
 class NoneMapping(Mapping):
+    python_type = type(None)
+
     def validate(self, value: Any) -> Any:
         return validate_none(value)
 
@@ -471,28 +897,55 @@ class NoneMapping(Mapping):
         return None
 
 
+_LEAF_MAPPINGS = (
+    BooleanMapping,
+    BytesMapping,
+    IntegerMapping,
+    FloatMapping,
+    StringMapping,
+    DecimalMapping,
+    TimedeltaMapping,
+    UUIDMapping,
+    DateMapping,
+    DateTimeMapping,
+    TimeMapping,
+    RegexPatternMapping,
+    Ipv4AddressMapping,
+    Ipv6AddressMapping,
+    NoneMapping,
+)
+
+
 class GataclassMapping(Mapping):
     dataclass: Any
 
+    @property
+    def python_type(self) -> Any:  # type: ignore
+        return self.dataclass
+
     def validate(self, value: Any) -> Any:
         if isinstance(value, self.dataclass):
             return value
-        return self.dataclass(**value)
+        return tagged_class(self.dataclass, value)(**value)
 
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
-        if mapping:
+        if mapping and isinstance(mapping, dict):
             return value.serialise(**mapping)
         return value.serialise()
 
     def deserialise(self, value: Any) -> Any:
         if isinstance(value, self.dataclass):
             return value
-        return self.dataclass(**value)
+        return tagged_class(self.dataclass, value)(**value)
 
 
 class CustomTypeMapping(Mapping):
     custom_type: Any
 
+    @property
+    def python_type(self) -> Any:  # type: ignore
+        return self.custom_type
+
     def validate(self, value: Any) -> Any:
         value = self.custom_type(value)
         value.validate()
@@ -507,17 +960,99 @@ class CustomTypeMapping(Mapping):
 
 
 class EnumTypeMapping(Mapping):
+    """
+    Members are looked up in tables built once per mapping, values which are not found (including unhashable ones)
+    go through the enum class itself, so `_missing_` hooks keep working. With `by_name` option member names
+    are accepted too, regardless of their case.
+    """
+
     enum_type: Any
+    cache: caching.CacheOption
+    by_name: bool
+
+    native_profiles = frozenset([Profile.PYTHON])
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.members: Dict[Any, Any] = {}
+        self.names: Dict[str, Any] = {}
+        for name, member in self.enum_type.__members__.items():
+            self.members[member] = member
+            try:
+                self.members.setdefault(member.value, member)
+            except TypeError:
+                pass
+            if self.by_name:
+                self.names.setdefault(name.casefold(), member)
+        self.validator = caching.validation_cache(self._validate_enum, self.cache, (str, int))
+
+    @property
+    def python_type(self) -> Any:  # type: ignore
+        return self.enum_type
+
+    def _member(self, value: Any) -> Any:
+        try:
+            member = self.members.get(value)
+        except TypeError:
+            return None
+        if member is None and self.names and value.__class__ is str:
+            return self.names.get(value.casefold())
+
+        return member
+
+    def _validate_enum(self, value: Any) -> Any:
+        member = self._member(value)
+        if member is not None:
+            return member
 
-    def validate(self, value: Any) -> Any:
         return validate_enum(value, self.enum_type)
 
+    def validate(self, value: Any) -> Any:
+        return self.validator(value)
+
     def serialise(self, value: Any, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
         return value.value
 
     def deserialise(self, value: Any) -> Any:
+        member = self._member(value)
+        if member is not None:
+            return member
+
         return self.enum_type(value)
 
 
+class LiteralMapping(Mapping):
+    items: List[Any]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # literals are keyed by their type as well, otherwise `True` and `1.0` would pass for `Literal[1]`
+        try:
+            self.values: Collection[Any] = frozenset((type(item), item) for item in self.items)
+        except TypeError:
+            self.values = tuple((type(item), item) for item in self.items)
+
+    def validate(self, value: Any) -> Any:
+        try:
+            if (type(value), value) in self.values:
+                return value
+        except TypeError:
+            pass
+
+        raise ValidationError("passed value must be within listed literals", code="literal_error")
+
+
 class AnyTypeMapping(Mapping):
     pass
+
+
+def non_optional_mapping(mapping: Mapping) -> Mapping:
+    """
+    Returns mapping of the only type allowed by `Optional`, other mappings are returned as they are.
+    """
+    if isinstance(mapping, UnionMapping):
+        items = [item for item in mapping.items if not isinstance(item, NoneMapping)]
+        if len(items) == 1:
+            return items[0]
+
+    return mapping
@@ -0,0 +1,388 @@
+import ipaddress
+import struct
+import uuid
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+from decimal import Decimal
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+MSGPACK_SUPPORT = True
+
+
+try:
+    import msgpack
+except ImportError:
+    MSGPACK_SUPPORT = False
+
+
+MsgpackInput = Union[bytes, bytearray, memoryview]
+
+
+class ExtType(NamedTuple):
+    code: int
+    data: bytes
+
+
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_TIME = 3
+EXT_TIMEDELTA = 4
+EXT_UUID = 5
+EXT_DECIMAL = 6
+EXT_IPV4 = 7
+EXT_IPV6 = 8
+
+# utc offset stored for naive datetime and time values
+_NAIVE = -(2 ** 31)
+_EPOCH = datetime(1970, 1, 1)
+_DATETIME_STRUCT = struct.Struct(">qIi")
+_TIME_STRUCT = struct.Struct(">qi")
+_TIMEDELTA_STRUCT = struct.Struct(">iII")
+
+
+def encode_ext(value: Any) -> ExtType:
+    """
+    Encodes datetime, date, time, timedelta, UUID, Decimal and ip address values into compact extension types.
+    Timezones are stored as fixed utc offsets.
+    """
+    if isinstance(value, datetime):
+        delta = value.replace(tzinfo=None) - _EPOCH
+        return ExtType(
+            EXT_DATETIME,
+            _DATETIME_STRUCT.pack(delta.days * 86400 + delta.seconds, delta.microseconds, _utc_offset(value)),
+        )
+    if isinstance(value, date):
+        return ExtType(EXT_DATE, struct.pack(">i", value.toordinal()))
+    if isinstance(value, time):
+        microseconds = ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+        return ExtType(EXT_TIME, _TIME_STRUCT.pack(microseconds, _utc_offset(value)))
+    if isinstance(value, timedelta):
+        return ExtType(EXT_TIMEDELTA, _TIMEDELTA_STRUCT.pack(value.days, value.seconds, value.microseconds))
+    if isinstance(value, uuid.UUID):
+        return ExtType(EXT_UUID, value.bytes)
+    if isinstance(value, Decimal):
+        return ExtType(EXT_DECIMAL, str(value).encode("ascii"))
+    if isinstance(value, ipaddress.IPv4Address):
+        return ExtType(EXT_IPV4, value.packed)
+    if isinstance(value, ipaddress.IPv6Address):
+        return ExtType(EXT_IPV6, value.packed)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+
+def decode_ext(code: int, data: bytes) -> Any:
+    if code == EXT_DATETIME:
+        seconds, microseconds, offset = _DATETIME_STRUCT.unpack(data)
+        value = _EPOCH + timedelta(seconds=seconds, microseconds=microseconds)
+        return value if offset == _NAIVE else value.replace(tzinfo=_timezone(offset))
+    if code == EXT_DATE:
+        return date.fromordinal(struct.unpack(">i", data)[0])
+    if code == EXT_TIME:
+        microseconds, offset = _TIME_STRUCT.unpack(data)
+        seconds, microseconds = divmod(microseconds, 1000000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return time(hours, minutes, seconds, microseconds, None if offset == _NAIVE else _timezone(offset))
+    if code == EXT_TIMEDELTA:
+        days, seconds, microseconds = _TIMEDELTA_STRUCT.unpack(data)
+        return timedelta(days=days, seconds=seconds, microseconds=microseconds)
+    if code == EXT_UUID:
+        return uuid.UUID(bytes=bytes(data))
+    if code == EXT_DECIMAL:
+        return Decimal(bytes(data).decode("ascii"))
+    if code == EXT_IPV4:
+        return ipaddress.IPv4Address(bytes(data))
+    if code == EXT_IPV6:
+        return ipaddress.IPv6Address(bytes(data))
+
+    return ExtType(code, bytes(data))
+
+
+def _utc_offset(value: Union[datetime, time]) -> int:
+    offset = value.utcoffset()
+    if offset is None:
+        return _NAIVE
+
+    return offset.days * 86400 + offset.seconds
+
+
+_TIMEZONES: Dict[int, timezone] = {0: timezone.utc}
+
+
+def _timezone(offset: int) -> timezone:
+    if offset not in _TIMEZONES:
+        _TIMEZONES[offset] = timezone(timedelta(seconds=offset))
+
+    return _TIMEZONES[offset]
+
+
+class _Packer:
+    def __init__(self, default: Optional[Callable[[Any], Any]] = None):
+        self.default = default
+        self.buffer: List[bytes] = []
+
+    def pack(self, value: Any) -> None:
+        write = self.buffer.append
+        value_type = type(value)
+        if value is None:
+            write(b"\xc0")
+        elif value is True:
+            write(b"\xc3")
+        elif value is False:
+            write(b"\xc2")
+        elif value_type is int:
+            self.pack_int(value)
+        elif value_type is str:
+            data = value.encode("utf8")
+            length = len(data)
+            if length < 32:
+                write(bytes((0xA0 | length,)))
+            elif length < 0x100:
+                write(struct.pack(">BB", 0xD9, length))
+            elif length < 0x10000:
+                write(struct.pack(">BH", 0xDA, length))
+            else:
+                write(struct.pack(">BI", 0xDB, length))
+            write(data)
+        elif value_type is float:
+            write(struct.pack(">Bd", 0xCB, value))
+        elif value_type is dict:
+            self.pack_map_header(len(value))
+            for key, item in value.items():
+                self.pack(key)
+                self.pack(item)
+        elif value_type is list or value_type is tuple:
+            self.pack_array_header(len(value))
+            for item in value:
+                self.pack(item)
+        elif value_type is bytes or value_type is bytearray or value_type is memoryview:
+            length = len(value)
+            if length < 0x100:
+                write(struct.pack(">BB", 0xC4, length))
+            elif length < 0x10000:
+                write(struct.pack(">BH", 0xC5, length))
+            else:
+                write(struct.pack(">BI", 0xC6, length))
+            write(bytes(value))
+        elif value_type is ExtType:
+            self.pack_ext(value)
+        else:
+            self.pack(self.convert(value))
+
+    def convert(self, value: Any) -> Any:
+        # subclasses of native types, eg. str based enums, are packed as their base type
+        for native_type, to_native in _NATIVE_CONVERTERS:
+            if isinstance(value, native_type):
+                return to_native(value)
+        if self.default is not None:
+            return self.default(value)
+
+        raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+    def pack_int(self, value: int) -> None:
+        write = self.buffer.append
+        if 0 <= value < 0x80:
+            write(bytes((value,)))
+        elif -0x20 <= value < 0:
+            write(struct.pack(">b", value))
+        elif 0 <= value < 0x100:
+            write(struct.pack(">BB", 0xCC, value))
+        elif 0 <= value < 0x10000:
+            write(struct.pack(">BH", 0xCD, value))
+        elif 0 <= value < 0x100000000:
+            write(struct.pack(">BI", 0xCE, value))
+        elif 0 <= value < 0x10000000000000000:
+            write(struct.pack(">BQ", 0xCF, value))
+        elif -0x80 <= value < 0:
+            write(struct.pack(">Bb", 0xD0, value))
+        elif -0x8000 <= value < 0:
+            write(struct.pack(">Bh", 0xD1, value))
+        elif -0x80000000 <= value < 0:
+            write(struct.pack(">Bi", 0xD2, value))
+        elif -0x8000000000000000 <= value < 0:
+            write(struct.pack(">Bq", 0xD3, value))
+        else:
+            raise OverflowError("Integer value out of MessagePack range")
+
+    def pack_map_header(self, length: int) -> None:
+        if length < 16:
+            self.buffer.append(bytes((0x80 | length,)))
+        elif length < 0x10000:
+            self.buffer.append(struct.pack(">BH", 0xDE, length))
+        else:
+            self.buffer.append(struct.pack(">BI", 0xDF, length))
+
+    def pack_array_header(self, length: int) -> None:
+        if length < 16:
+            self.buffer.append(bytes((0x90 | length,)))
+        elif length < 0x10000:
+            self.buffer.append(struct.pack(">BH", 0xDC, length))
+        else:
+            self.buffer.append(struct.pack(">BI", 0xDD, length))
+
+    def pack_ext(self, value: ExtType) -> None:
+        length = len(value.data)
+        if length in _FIXEXT_HEADERS:
+            self.buffer.append(struct.pack(">Bb", _FIXEXT_HEADERS[length], value.code))
+        elif length < 0x100:
+            self.buffer.append(struct.pack(">BBb", 0xC7, length, value.code))
+        elif length < 0x10000:
+            self.buffer.append(struct.pack(">BHb", 0xC8, length, value.code))
+        else:
+            self.buffer.append(struct.pack(">BIb", 0xC9, length, value.code))
+        self.buffer.append(value.data)
+
+
+_NATIVE_CONVERTERS: Tuple[Tuple[type, Callable[[Any], Any]], ...] = (
+    (int, int),
+    (float, float),
+    (str, str.__str__),
+    (bytes, bytes),
+    (dict, dict),
+    (list, list),
+    (tuple, list),
+)
+_FIXEXT_HEADERS = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}
+
+
+class _Unpacker:
+    def __init__(self, data: MsgpackInput, ext_hook: Callable[[int, bytes], Any]):
+        self.data = memoryview(data)
+        self.offset = 0
+        self.ext_hook = ext_hook
+
+    def read(self, size: int) -> memoryview:
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.data):
+            raise ValueError("Unexpected end of MessagePack data")
+        return self.data[start : self.offset]
+
+    def read_struct(self, fmt: str, size: int) -> Any:
+        return struct.unpack_from(fmt, self.read(size))[0]
+
+    def unpack(self) -> Any:
+        header = self.read(1)[0]
+        if header < 0x80:
+            return header
+        if header >= 0xE0:
+            return header - 0x100
+        if 0xA0 <= header <= 0xBF:
+            return str(self.read(header & 0x1F), "utf8")
+        if 0x90 <= header <= 0x9F:
+            return self.unpack_array(header & 0x0F)
+        if 0x80 <= header <= 0x8F:
+            return self.unpack_map(header & 0x0F)
+        if header in _SIMPLE_VALUES:
+            return _SIMPLE_VALUES[header]
+        if header in _NUMBER_FORMATS:
+            fmt, size = _NUMBER_FORMATS[header]
+            return self.read_struct(fmt, size)
+        if header in _STR_LENGTHS:
+            return str(self.read(self.read_struct(*_STR_LENGTHS[header])), "utf8")
+        if header in _BIN_LENGTHS:
+            return bytes(self.read(self.read_struct(*_BIN_LENGTHS[header])))
+        if header in _ARRAY_LENGTHS:
+            return self.unpack_array(self.read_struct(*_ARRAY_LENGTHS[header]))
+        if header in _MAP_LENGTHS:
+            return self.unpack_map(self.read_struct(*_MAP_LENGTHS[header]))
+        if header in _FIXEXT_LENGTHS:
+            length = _FIXEXT_LENGTHS[header]
+        elif header in _EXT_LENGTHS:
+            length = self.read_struct(*_EXT_LENGTHS[header])
+        else:
+            raise ValueError(f"Invalid MessagePack header 0x{header:02x}")
+        code = self.read_struct(">b", 1)
+        return self.ext_hook(code, bytes(self.read(length)))
+
+    def unpack_array(self, length: int) -> List[Any]:
+        return [self.unpack() for _ in range(length)]
+
+    def unpack_map(self, length: int) -> Dict[Any, Any]:
+        result = {}
+        for _ in range(length):
+            key = self.unpack()
+            result[key] = self.unpack()
+        return result
+
+
+_SIMPLE_VALUES = {0xC0: None, 0xC2: False, 0xC3: True}
+_NUMBER_FORMATS: Dict[int, Tuple[str, int]] = {
+    0xCA: (">f", 4),
+    0xCB: (">d", 8),
+    0xCC: (">B", 1),
+    0xCD: (">H", 2),
+    0xCE: (">I", 4),
+    0xCF: (">Q", 8),
+    0xD0: (">b", 1),
+    0xD1: (">h", 2),
+    0xD2: (">i", 4),
+    0xD3: (">q", 8),
+}
+_STR_LENGTHS = {0xD9: (">B", 1), 0xDA: (">H", 2), 0xDB: (">I", 4)}
+_BIN_LENGTHS = {0xC4: (">B", 1), 0xC5: (">H", 2), 0xC6: (">I", 4)}
+_ARRAY_LENGTHS = {0xDC: (">H", 2), 0xDD: (">I", 4)}
+_MAP_LENGTHS = {0xDE: (">H", 2), 0xDF: (">I", 4)}
+_EXT_LENGTHS = {0xC7: (">B", 1), 0xC8: (">H", 2), 0xC9: (">I", 4)}
+_FIXEXT_LENGTHS = {header: length for length, header in _FIXEXT_HEADERS.items()}
+
+
+class MsgpackBackend:
+    """
+    Pure python MessagePack codec, values unknown to the codec are passed to `default` hook.
+    """
+
+    def packb(self, value: Any, default: Callable[[Any], Any]) -> bytes:
+        packer = _Packer(default)
+        packer.pack(value)
+        return b"".join(packer.buffer)
+
+    def unpackb(self, data: MsgpackInput) -> Any:
+        unpacker = _Unpacker(data, decode_ext)
+        value = unpacker.unpack()
+        if unpacker.offset != len(unpacker.data):
+            raise ValueError("Extra data after MessagePack value")
+        return value
+
+
+if MSGPACK_SUPPORT:
+
+    class AcceleratedMsgpackBackend(MsgpackBackend):
+        def packb(self, value: Any, default: Callable[[Any], Any]) -> bytes:
+            def _default(item: Any) -> Any:
+                result = default(item)
+                if type(result) is ExtType:
+                    return msgpack.ExtType(result.code, result.data)
+                return result
+
+            return msgpack.packb(value, default=_default, use_bin_type=True)
+
+        def unpackb(self, data: MsgpackInput) -> Any:
+            return msgpack.unpackb(data, ext_hook=decode_ext, raw=False, strict_map_key=False)
+
+
+_BACKENDS: Dict[str, MsgpackBackend] = {"python": MsgpackBackend()}
+_DEFAULT_BACKEND = "python"
+
+if MSGPACK_SUPPORT:
+    _BACKENDS["msgpack"] = AcceleratedMsgpackBackend()
+    _DEFAULT_BACKEND = "msgpack"
+
+
+def get_backend(name: Optional[str] = None) -> MsgpackBackend:
+    if name is None:
+        name = _DEFAULT_BACKEND
+    if name not in _BACKENDS:
+        raise ValueError(f"unknown msgpack backend {name}, available backends: {', '.join(_BACKENDS)}")
+
+    return _BACKENDS[name]
@@ -0,0 +1,46 @@
+import re
+from typing import Any
+from typing import List
+from typing import Optional
+
+NUMPY_SUPPORT = True
+
+
+try:
+    import numpy
+except ImportError:
+    NUMPY_SUPPORT = False
+
+
+# whole column is checked with single regex pass, numpy parses only naive values in canonical form the same way
+# gata does (it also accepts offsets, leap seconds and year 0 which gata handles differently or rejects)
+_CANONICAL_DATE = r"(?!0000)[0-9]{4}-[0-9]{2}-[0-9]{2}"
+_CANONICAL_DATES = re.compile(f"(?:{_CANONICAL_DATE}\\n)*")
+_CANONICAL_DATETIMES = re.compile(f"(?:{_CANONICAL_DATE}[T ][0-9]{{2}}:[0-9]{{2}}:[0-5][0-9](?:\\.[0-9]{{1,6}})?\\n)*")
+
+
+def _is_canonical_column(pattern: Any, values: List[str]) -> bool:
+    return pattern.fullmatch("\n".join(values) + "\n") is not None
+
+
+if NUMPY_SUPPORT:
+
+    def parse_datetime_column(values: List[str]) -> Optional[List[Any]]:
+        """
+        Parses canonical naive datetime strings at once, None is returned when any of the values is not canonical
+        or is invalid.
+        """
+        if not _is_canonical_column(_CANONICAL_DATETIMES, values):
+            return None
+        try:
+            return numpy.array(values, dtype="datetime64[us]").tolist()
+        except ValueError:
+            return None
+
+    def parse_date_column(values: List[str]) -> Optional[List[Any]]:
+        if not _is_canonical_column(_CANONICAL_DATES, values):
+            return None
+        try:
+            return numpy.array(values, dtype="datetime64[D]").tolist()
+        except ValueError:
+            return None
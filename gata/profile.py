@@ -0,0 +1,15 @@
+from enum import Enum
+
+# Profile has to stay as separate module to deal with cyclomatic dependencies.
+
+__all__ = ["Profile"]
+
+
+class Profile(Enum):
+    """
+    Target of serialisation, values which the target accepts natively are left unconverted.
+    """
+
+    JSON = "json"
+    PYTHON = "python"
+    BSON = "bson"
@@ -0,0 +1,261 @@
+import hashlib
+import struct
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from gata import msgpack_support
+from .dataclasses import _dataclass_restore
+from .errors import DeserialisationError
+from .errors import FieldError
+from .errors import MaximumBoundError
+from .errors import MinimumBoundError
+from .errors import ValidationError
+from .mapping import BooleanMapping
+from .mapping import BytesMapping
+from .mapping import DateMapping
+from .mapping import DateTimeMapping
+from .mapping import DecimalMapping
+from .mapping import FloatMapping
+from .mapping import GataclassMapping
+from .mapping import IntegerMapping
+from .mapping import Ipv4AddressMapping
+from .mapping import Ipv6AddressMapping
+from .mapping import StringMapping
+from .mapping import TimeMapping
+from .mapping import TimedeltaMapping
+from .mapping import UUIDMapping
+from .mapping import non_optional_mapping
+from .schema import Field
+from .utils import is_gataclass
+
+__all__ = ["encode_record", "decode_record", "read_field"]
+
+# Record layout, all numbers are little endian:
+#
+#   magic (3 bytes) | schema fingerprint (8 bytes) | null bitmap (1 bit per field)
+#   | fixed width fields packed with single struct
+#   | offset table (uint32 per variable width field, relative to record start)
+#   | variable width fields, each prefixed with uint32 length
+
+MAGIC = b"GR\x01"
+FINGERPRINT_SIZE = 8
+RecordInput = Union[bytes, bytearray, memoryview]
+
+_LENGTH = struct.Struct("<I")
+
+
+class _Codec(NamedTuple):
+    format: str
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+    empty: Any = b""
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _int64(value: int) -> int:
+    # int fields accept any python int, but the fixed slot holds only signed 64 bit numbers
+    if value < _INT64_MIN:
+        raise MinimumBoundError(expected_minimum=_INT64_MIN)
+    if value > _INT64_MAX:
+        raise MaximumBoundError(expected_maximum=_INT64_MAX)
+
+    return value
+
+
+def _ext_codec(code: int, size: int) -> _Codec:
+    return _Codec(
+        f"{size}s",
+        lambda value: msgpack_support.encode_ext(value).data,
+        lambda data: msgpack_support.decode_ext(code, data),
+    )
+
+
+_FIXED_CODECS: Dict[type, _Codec] = {
+    BooleanMapping: _Codec("?", _identity, _identity, False),
+    IntegerMapping: _Codec("q", _int64, _identity, 0),
+    FloatMapping: _Codec("d", _identity, _identity, 0.0),
+    DateMapping: _Codec("i", date.toordinal, date.fromordinal, 0),
+    DateTimeMapping: _ext_codec(msgpack_support.EXT_DATETIME, 16),
+    TimeMapping: _ext_codec(msgpack_support.EXT_TIME, 12),
+    TimedeltaMapping: _ext_codec(msgpack_support.EXT_TIMEDELTA, 12),
+    UUIDMapping: _ext_codec(msgpack_support.EXT_UUID, 16),
+    Ipv4AddressMapping: _ext_codec(msgpack_support.EXT_IPV4, 4),
+    Ipv6AddressMapping: _ext_codec(msgpack_support.EXT_IPV6, 16),
+}
+
+_VARIABLE_CODECS: Dict[type, _Codec] = {
+    StringMapping: _Codec("", lambda value: value.encode("utf8"), lambda data: str(data, "utf8")),
+    BytesMapping: _Codec("", bytes, bytes),
+    DecimalMapping: _Codec("", lambda value: str(value).encode("ascii"), lambda data: Decimal(str(data, "ascii"))),
+}
+
+
+class _Layout:
+    def __init__(self, cls: Any):
+        self.cls = cls
+        self.fixed: List[Tuple[int, str, _Codec]] = []
+        self.variable: List[Tuple[int, str, _Codec]] = []
+        self.fields: Dict[str, Tuple[bool, int]] = {}
+
+        description = [cls.__qualname__]
+        for index, (name, field) in enumerate(cls.__gata_schema__):
+            description.append(f"{name}:{field._original_type!r}")
+            codec, fixed = _field_codec(field)
+            target = self.fixed if fixed else self.variable
+            self.fields[name] = (fixed, len(target))
+            target.append((index, name, codec))
+
+        self.fingerprint = hashlib.blake2b("\n".join(description).encode("utf8"), digest_size=FINGERPRINT_SIZE).digest()
+        self.bitmap_offset = len(MAGIC) + FINGERPRINT_SIZE
+        self.fixed_offset = self.bitmap_offset + (len(self.fields) + 7) // 8
+        self.fixed_struct = struct.Struct("<" + "".join(codec.format for _, _, codec in self.fixed))
+        self.fixed_field_offsets = []
+        fixed_format = "<"
+        for _, _, codec in self.fixed:
+            self.fixed_field_offsets.append(self.fixed_offset + struct.calcsize(fixed_format))
+            fixed_format += codec.format
+        self.offsets_offset = self.fixed_offset + self.fixed_struct.size
+        self.offsets_struct = struct.Struct(f"<{len(self.variable)}I")
+        self.variable_offset = self.offsets_offset + self.offsets_struct.size
+
+    def is_null(self, data: memoryview, index: int) -> bool:
+        return bool(data[self.bitmap_offset + (index >> 3)] & (1 << (index & 7)))
+
+    def check(self, data: memoryview) -> None:
+        if data[: len(MAGIC)] != MAGIC:
+            raise DeserialisationError("passed data is not a gata record")
+        if data[len(MAGIC) : self.bitmap_offset] != self.fingerprint:
+            raise DeserialisationError(f"record was encoded with different schema of {self.cls.__qualname__}")
+
+    def read_variable(self, data: memoryview, position: int) -> memoryview:
+        offset = _LENGTH.unpack_from(data, self.offsets_offset + position * _LENGTH.size)[0]
+        length = _LENGTH.unpack_from(data, offset)[0]
+        return data[offset + _LENGTH.size : offset + _LENGTH.size + length]
+
+
+def _field_codec(field: Field) -> Tuple[_Codec, bool]:
+    mapping = non_optional_mapping(field._type)
+    if field._serialiser is None and field._deserialiser is None:
+        if mapping.__class__ in _FIXED_CODECS:
+            return _FIXED_CODECS[mapping.__class__], True
+        if mapping.__class__ in _VARIABLE_CODECS:
+            return _VARIABLE_CODECS[mapping.__class__], False
+        if isinstance(mapping, GataclassMapping):
+            nested_cls = mapping.dataclass
+            return _Codec("", encode_record, lambda data: decode_record(nested_cls, data)), False
+
+    # remaining values are stored in their serialised form
+    return (
+        _Codec(
+            "",
+            lambda value: msgpack_support.get_backend().packb(field.serialise(value), msgpack_support.encode_ext),
+            lambda data: field.deserialise(msgpack_support.get_backend().unpackb(data)),
+        ),
+        False,
+    )
+
+
+def _layout(cls: Any) -> _Layout:
+    if "__gata_record_layout__" not in cls.__dict__:
+        if not is_gataclass(cls) or not hasattr(cls, "deserialise"):
+            raise TypeError(f"records can be used only with gata dataclasses, {cls!r} passed instead")
+        setattr(cls, "__gata_record_layout__", _Layout(cls))
+
+    return cls.__dict__["__gata_record_layout__"]
+
+
+def encode_record(obj: Any) -> bytes:
+    """
+    Encodes dataclass instance into binary record, record can be decoded only with the same version of the class.
+    """
+    layout = _layout(obj.__class__)
+    bitmap = bytearray(layout.fixed_offset - layout.bitmap_offset)
+
+    fixed_values = []
+    for index, name, codec in layout.fixed:
+        value = getattr(obj, name)
+        if value is None:
+            bitmap[index >> 3] |= 1 << (index & 7)
+            fixed_values.append(codec.empty)
+            continue
+        try:
+            fixed_values.append(codec.encode(value))
+        except ValidationError as error:
+            raise FieldError(name, error) from error
+
+    offsets = []
+    payloads = []
+    position = layout.variable_offset
+    for index, name, codec in layout.variable:
+        value = getattr(obj, name)
+        if value is None:
+            bitmap[index >> 3] |= 1 << (index & 7)
+            offsets.append(0)
+            continue
+        data = codec.encode(value)
+        offsets.append(position)
+        payloads.append(_LENGTH.pack(len(data)))
+        payloads.append(data)
+        position += _LENGTH.size + len(data)
+
+    return b"".join(
+        [
+            MAGIC,
+            layout.fingerprint,
+            bytes(bitmap),
+            layout.fixed_struct.pack(*fixed_values),
+            layout.offsets_struct.pack(*offsets),
+            *payloads,
+        ]
+    )
+
+
+def decode_record(cls: Type[Any], data: RecordInput) -> Any:
+    layout = _layout(cls)
+    view = memoryview(data)
+    layout.check(view)
+
+    values: Dict[str, Any] = {}
+    fixed_values = layout.fixed_struct.unpack_from(view, layout.fixed_offset)
+    for (index, name, codec), value in zip(layout.fixed, fixed_values):
+        values[name] = None if layout.is_null(view, index) else codec.decode(value)
+    for position, (index, name, codec) in enumerate(layout.variable):
+        values[name] = None if layout.is_null(view, index) else codec.decode(layout.read_variable(view, position))
+
+    return _dataclass_restore(cls, values, post_init=True)
+
+
+def read_field(cls: Type[Any], data: RecordInput, name: str) -> Any:
+    """
+    Decodes single field of the record without decoding the others.
+    """
+    layout = _layout(cls)
+    view = memoryview(data)
+    layout.check(view)
+    if name not in layout.fields:
+        raise KeyError(f"{cls.__qualname__} has no field {name!r}")
+
+    fixed, position = layout.fields[name]
+    index, _, codec = (layout.fixed if fixed else layout.variable)[position]
+    if layout.is_null(view, index):
+        return None
+    if fixed:
+        value = struct.unpack_from("<" + codec.format, view, layout.fixed_field_offsets[position])[0]
+        return codec.decode(value)
+
+    return codec.decode(layout.read_variable(view, position))
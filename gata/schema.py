@@ -10,8 +10,10 @@ from typing import Optional
 from typing import Tuple
 from typing import Union
 
+from .caching import CacheOption
 from .mapping import AnyTypeMapping
 from .mapping import Mapping
+from .mapping import TypedDictMapping
 from .stringformat import StringFormat
 from .utils import is_optional_type
 
@@ -49,6 +51,10 @@ class Field:
         deserialiser: Optional[Callable[[Any], Any]] = None,
         validator: Optional[Callable[[Any], None]] = None,
         items: Dict[str, Any] = {},
+        cache: CacheOption = None,
+        epoch: Union[bool, str, None] = None,
+        by_name: bool = False,
+        copy: bool = False,
     ):
         self._default = default
         self._default_factory = default_factory
@@ -64,6 +70,10 @@ class Field:
         self.format = string_format
         self.pattern = pattern
         self.items = items
+        self.cache = cache
+        self.epoch = epoch
+        self.by_name = by_name
+        self.copy = copy
 
         self._deserialiser = deserialiser
         self._serialiser = serialiser
@@ -102,11 +112,18 @@ class Field:
     def serialise(self, value, mapping: Optional[Dict[str, Union[Dict, str, bool]]] = None) -> Any:
         if self._serialiser:
             return self._serialiser(value, mapping)
+        if isinstance(mapping, dict) and mapping.get("$profile") in self._type.native_profiles:
+            return value
 
         return self._type.serialise(value, mapping)
 
     def deserialise(self, value) -> Any:
-        if isclass(self._original_type) and isinstance(value, self._original_type):
+        # typed dicts do not support instance checks
+        if (
+            isclass(self._original_type)
+            and self._type.__class__ is not TypedDictMapping
+            and isinstance(value, self._original_type)
+        ):
             return value
         if self._deserialiser:
             return self._deserialiser(value)
@@ -130,5 +147,4 @@ class Schema(Iterable):
         return key in self._fields
 
     def __iter__(self) -> Iterator[Tuple[str, Field]]:
-        for key, value in self._fields.items():
-            yield key, value
+        return iter(self._fields.items())
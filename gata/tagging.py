@@ -0,0 +1,48 @@
+from typing import Any
+
+from .errors import FieldError
+from .errors import TagBranchValidationError
+from .errors import TagMismatchValidationError
+from .errors import TagValidationError
+
+__all__ = ["tagged_class", "validate_tag"]
+
+
+def tagged_class(cls: Any, value: Any) -> Any:
+    """
+    Returns class registered for the tag found in passed mapping, the class itself is returned when it
+    is not polymorphic or when value carries no tag or class' own tag.
+    """
+    tags = getattr(cls, "__gata_tags__", None)
+    if not tags or not isinstance(value, dict):
+        return cls
+    name = cls.__gata_discriminator__
+    tag = value.get(name)
+    if tag is None or tag == cls.__gata_tag__:
+        return cls
+
+    try:
+        target = tags.get(tag)
+    except TypeError:
+        target = None
+    if target is None:
+        raise FieldError(name, TagValidationError(tag=tag))
+    if not issubclass(target, cls):
+        error = TagBranchValidationError(tag=tag, tagged_class=target.__qualname__, expected_class=cls.__qualname__)
+        raise FieldError(name, error)
+
+    return target
+
+
+def validate_tag(cls: Any, value: Any) -> None:
+    """
+    Checks that discriminator of passed mapping or instance matches own tag of tagged class, missing
+    discriminator is accepted as it defaults to the tag.
+    """
+    own_tag = getattr(cls, "__gata_tag__", None)
+    if own_tag is None:
+        return
+    name = cls.__gata_discriminator__
+    tag = value.get(name) if isinstance(value, dict) else getattr(value, name, None)
+    if tag is not None and tag != own_tag:
+        raise FieldError(name, TagMismatchValidationError(tag=tag, expected_tag=own_tag))
@@ -9,6 +9,7 @@ from enum import Enum
 from ipaddress import AddressValueError
 from ipaddress import IPv4Address
 from ipaddress import IPv6Address
+from itertools import islice
 from typing import Any
 from typing import Callable
 from typing import Collection
@@ -19,7 +20,6 @@ from typing import List
 from typing import Optional
 from typing import Pattern
 from typing import Set
-from typing import Sized
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
@@ -40,6 +40,10 @@ from .errors import MinimumLengthError
 from .errors import TypeValidationError
 from .errors import UniqueValidationError
 from .errors import ValidationError
+from .formats import is_email
+from .formats import is_hostname
+from .formats import is_uri
+from .formats import is_url
 from .iso_datetime import parse_iso_date_string
 from .iso_datetime import parse_iso_datetime_string
 from .iso_datetime import parse_iso_duration_string
@@ -142,12 +146,8 @@ def validate_iterable(value: Any, item_validator: Callable = None, unique: bool
     if not isinstance(value, Collection) or isinstance(value, str) or isinstance(value, dict):
         raise IterableValidationError()
 
-    if isinstance(value, Sized) and unique:
-        unique_items = set()
-        for item in value:
-            if item in unique_items:
-                raise UniqueValidationError()
-            unique_items.add(item)
+    if unique and len(set(value)) != len(value):
+        raise UniqueValidationError()
 
     if item_validator:
         return validate_iterable_items(value, item_validator)  # type: ignore
@@ -155,12 +155,29 @@ def validate_iterable(value: Any, item_validator: Callable = None, unique: bool
     return value
 
 
+def _changed_items(value: Iterable[Any], item_validator: Callable) -> Optional[List[Any]]:
+    """
+    Validates items and returns list of the results, None is returned when every item was validated as it is.
+    The list is allocated only when the first item changes, items preceding it are copied from the value.
+    """
+    validated_items = None
+    for index, item in enumerate(value):
+        validated_item = item_validator(item)
+        if validated_items is None:
+            if validated_item is item:
+                continue
+            validated_items = list(islice(value, index))
+        validated_items.append(validated_item)
+
+    return validated_items
+
+
 def validate_iterable_items(
     value: Union[list, set, frozenset], item_validator: Callable
 ) -> Union[list, set, frozenset]:
-    validated_items = []
-    for item in value:
-        validated_items.append(item_validator(item))
+    validated_items = _changed_items(value, item_validator)
+    if validated_items is None:
+        return value if isinstance(value, (list, set, frozenset)) else list(value)
 
     if isinstance(value, set):
         return set(validated_items)
@@ -181,12 +198,29 @@ def validate_list(value: Any, item_validator: Callable = None) -> List[Any]:
     return value  # type: ignore
 
 
-def validate_set(value: Any, item_validator: Callable = None) -> Set[Any]:
-    value = validate_iterable(value, item_validator, unique=True)
-    if not isinstance(value, set):
-        value = set(value)
+def _validate_unique_items(value: Any, item_validator: Optional[Callable], collection_type: Type[T]) -> T:
+    """
+    Validates, converts and collects items in a single pass, duplicates are detected by comparing size
+    of the collection with number of passed items.
+    """
+    if not isinstance(value, Collection) or isinstance(value, str) or isinstance(value, dict):
+        raise IterableValidationError()
+    if value.__class__ is collection_type:
+        # items of a set are unique already, so it is kept unless some of them change
+        changed_items = _changed_items(value, item_validator) if item_validator else None  # type: ignore
+        if changed_items is None:
+            return value
+        items = collection_type(changed_items)  # type: ignore
+    else:
+        items = collection_type(map(item_validator, value) if item_validator else value)  # type: ignore
+    if len(items) != len(value):  # type: ignore
+        raise UniqueValidationError()
 
-    return value
+    return items
+
+
+def validate_set(value: Any, item_validator: Callable = None) -> Set[Any]:
+    return _validate_unique_items(value, item_validator, set)  # type: ignore
 
 
 def validate_tuple(value: Any, item_validators: List[Callable] = None) -> Tuple[Any, ...]:
@@ -219,11 +253,7 @@ def validate_tuple(value: Any, item_validators: List[Callable] = None) -> Tuple[
 
 
 def validate_frozenset(value: Any, item_validator: Callable = None) -> FrozenSet[Any]:
-    value = validate_iterable(value, item_validator, unique=True)
-    if not isinstance(value, frozenset):
-        value = frozenset(value)
-
-    return value
+    return _validate_unique_items(value, item_validator, frozenset)  # type: ignore
 
 
 def validate_pattern(value: Any) -> Pattern[str]:
@@ -268,12 +298,12 @@ def validate_boolean(value: Any) -> bool:
     raise TypeValidationError(expected_type=bool)
 
 
-def validate_datetime(value: Any) -> datetime:
+def validate_datetime(value: Any, parse: Callable[[str], datetime] = parse_iso_datetime_string) -> datetime:
     if isinstance(value, datetime):
         return value
     value = str(value)
     try:
-        return parse_iso_datetime_string(value)
+        return parse(value)
     except ValueError:
         raise TypeValidationError(expected_type=datetime)
 
@@ -299,22 +329,22 @@ def validate_typed_dict(value: Any, validator_map: Dict[str, Callable[..., Any]]
     return value
 
 
-def validate_date(value: Any) -> date:
+def validate_date(value: Any, parse: Callable[[str], date] = parse_iso_date_string) -> date:
     if isinstance(value, date):
         return value
     value = str(value)
     try:
-        return parse_iso_date_string(value)
+        return parse(value)
     except ValueError:
         raise TypeValidationError(expected_type=date)
 
 
-def validate_time(value: Any) -> time:
+def validate_time(value: Any, parse: Callable[[str], time] = parse_iso_time_string) -> time:
     if isinstance(value, time):
         return value
     value = str(value)
     try:
-        return parse_iso_time_string(value)
+        return parse(value)
     except ValueError:
         raise TypeValidationError(expected_type=time)
 
@@ -328,6 +358,8 @@ def validate_duration(value: Any) -> timedelta:
         raise TypeValidationError(expected_type=timedelta)
 
 
+# regular expressions below define accepted formats, validators use equivalent linear-time matchers from
+# `gata.formats` as the expressions backtrack heavily on long malicious values
 # https://www.w3.org/TR/html5/forms.html#valid-e-mail-address
 EMAIL_REGEX = re.compile(
     r"^[a-zA-Z0-9.!#$%&'*+\/=?^_`{|}~-]+"
@@ -341,7 +373,7 @@ def validate_email(value: str) -> str:
     Keep in mind this validator willfully violates RFC 5322, the best way to invalidate email address is to send
     a message and receive confirmation from the recipient.
     """
-    if not EMAIL_REGEX.match(value):
+    if not is_email(value):
         raise FormatValidationError(expected_format=StringFormat.EMAIL)
     if ".." in value:
         raise FormatValidationError(expected_format=StringFormat.EMAIL)
@@ -360,7 +392,7 @@ HOSTNAME_REGEX = re.compile(r"^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?(?:\.[a-z0-9]
 
 
 def validate_hostname(value: str) -> str:
-    if not HOSTNAME_REGEX.match(value):
+    if not is_hostname(value):
         raise FormatValidationError(expected_format=StringFormat.HOSTNAME)
 
     return value
@@ -468,7 +500,7 @@ URI_REGEX = re.compile(r"^(?:[a-z][a-z0-9+-.]*:)(?:\\/?\\/)?[^\s]*$", re.I)
 
 def validate_uri(value: Any) -> str:
     value = validate_string(value)
-    if not URI_REGEX.match(value):
+    if not is_uri(value):
         raise FormatValidationError(expected_format=StringFormat.URI)
 
     return value
@@ -482,13 +514,15 @@ URL_REGEX = re.compile(
 
 def validate_url(value: Any) -> str:
     value = validate_string(value)
-    if not URL_REGEX.match(value):
+    if not is_url(value):
         raise FormatValidationError(expected_format=StringFormat.URL)
 
     return value
 
 
 def validate_uuid(value: Any) -> UUID:
+    if isinstance(value, UUID):
+        return value
     try:
         return UUID(value)
     except Exception:
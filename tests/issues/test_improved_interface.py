@@ -12,3 +12,16 @@ def test_improved_interface() -> None:
     song_repr = repr(song)
     assert song.serialise() == raw_song
     assert "test_improved_interface.<locals>.Song" in song_repr
+
+
+def test_improved_interface_with_lazy_fields() -> None:
+    class Song(Dataclass, frozen=True, lazy=True):
+        title: str
+        artist: str
+
+    raw_song = {"title": "test", "artist": "Test Artist"}
+
+    song = Song(**raw_song)
+    assert "artist" not in song.__dict__
+    assert song.artist == "Test Artist"
+    assert song.serialise() == raw_song
@@ -0,0 +1,102 @@
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Optional
+
+import pytest
+
+from gata import bulk
+from gata import dataclass
+from gata import deserialise_many
+from gata import field
+from gata import numpy_support
+from gata.errors import FieldError
+
+
+@dataclass
+class Event:
+    name: str
+    occurred_at: datetime
+    day: date
+    duration: Optional[timedelta] = None
+    label: str = field(default="")
+
+
+def create_items(count: int) -> list:
+    return [
+        {
+            "name": f"event {index}",
+            "occurred_at": f"2020-01-01T{index % 24:02d}:{index % 60:02d}:00",
+            "day": f"2020-01-{index % 28 + 1:02d}",
+            "duration": "PT1H" if index % 2 else None,
+            "label": "2020-01-01",
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [10, 200])
+def test_deserialise_many(count: int) -> None:
+    items = create_items(count)
+
+    result = deserialise_many(Event, items)
+
+    expected = [Event(**item) for item in items]
+    assert [(event.name, event.occurred_at, event.day) for event in result] == [
+        (event.name, event.occurred_at, event.day) for event in expected
+    ]
+    assert result[1].occurred_at == datetime(2020, 1, 1, 1, 1)
+    assert result[1].duration == timedelta(hours=1)
+    assert result[0].duration is None
+    assert result[0].label == "2020-01-01"
+    assert items[0]["occurred_at"] == "2020-01-01T00:00:00"
+
+
+def test_deserialise_many_numpy_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bulk, "NUMPY_THRESHOLD", 1)
+    items = create_items(3)
+    items[1]["occurred_at"] = "2020-01-01T10:00:00+02:00"
+    items[2]["occurred_at"] = "20200101T100000.5"
+
+    result = deserialise_many(Event, items)
+
+    assert result[0].occurred_at == datetime(2020, 1, 1)
+    assert result[1].occurred_at == datetime(2020, 1, 1, 10, tzinfo=timezone(timedelta(hours=2)))
+    assert result[2].occurred_at == datetime(2020, 1, 1, 10, 0, 0, 500000)
+
+
+@pytest.mark.parametrize("invalid_value", ["2020-02-30T00:00:00", "0000-01-01T00:00:00", "2020-01-01T23:59:60", "x"])
+def test_deserialise_many_reports_invalid_values(monkeypatch: pytest.MonkeyPatch, invalid_value: str) -> None:
+    monkeypatch.setattr(bulk, "NUMPY_THRESHOLD", 1)
+    items = create_items(3)
+    items[2]["occurred_at"] = invalid_value
+
+    with pytest.raises(FieldError) as error:
+        deserialise_many(Event, items)
+
+    assert error.value.context["field_name"] == "occurred_at"
+
+
+def test_deserialise_many_with_projection() -> None:
+    result = deserialise_many(Event, create_items(2), fields=["name", "day"])
+
+    assert result[1].day == date(2020, 1, 2)
+    assert result[1].occurred_at is None
+
+
+def test_deserialise_many_fails_for_non_dataclass() -> None:
+    with pytest.raises(TypeError):
+        deserialise_many(dict, [])
+
+
+@pytest.mark.skipif(not numpy_support.NUMPY_SUPPORT, reason="numpy is not installed")
+def test_parse_columns_with_numpy() -> None:
+    assert numpy_support.parse_datetime_column(["2020-01-01T10:00:00", "2020-01-01 10:00:00.5"]) == [
+        datetime(2020, 1, 1, 10),
+        datetime(2020, 1, 1, 10, 0, 0, 500000),
+    ]
+    assert numpy_support.parse_date_column(["2020-01-01"]) == [date(2020, 1, 1)]
+    assert numpy_support.parse_datetime_column(["2020-01-01T10:00:00Z"]) is None
+    assert numpy_support.parse_datetime_column(["2020-02-30T10:00:00"]) is None
+    assert numpy_support.parse_date_column(["0000-01-01"]) is None
@@ -0,0 +1,180 @@
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+from enum import Enum
+from ipaddress import IPv4Address
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from gata import caching
+from gata import dataclass
+from gata import field
+from gata.caching import CachedFunction
+from gata.caching import CachedValidator
+from gata.errors import FieldError
+from gata.errors import FormatValidationError
+from gata.stringformat import StringFormat
+from gata.iso_datetime import parse_iso_datetime_string
+from gata.validators import validate_email
+
+
+@pytest.fixture
+def global_caches() -> Iterator[None]:
+    caching.configure_caches()
+    yield
+    caching.configure_caches(0)
+
+
+def test_cached_function_counts_hits() -> None:
+    parse = CachedFunction(parse_iso_datetime_string, maxsize=2)
+
+    assert parse("2020-01-01T10:00:00") == datetime(2020, 1, 1, 10)
+    assert parse("2020-01-01T10:00:00") is parse("2020-01-01T10:00:00")
+
+    stats = parse.cache_info()
+    assert stats.hits == 2
+    assert stats.misses == 1
+    assert stats.currsize == 1
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_cached_function_is_bounded() -> None:
+    parse = CachedFunction(parse_iso_datetime_string, maxsize=2)
+
+    for hour in range(10, 20):
+        parse(f"2020-01-01T{hour}:00:00")
+
+    assert parse.cache_info().currsize == 2
+
+
+def test_disabled_cached_function() -> None:
+    parse = CachedFunction(parse_iso_datetime_string)
+
+    assert parse("2020-01-01T10:00:00") is not parse("2020-01-01T10:00:00")
+    assert parse.cache_info() == (0, 0, 0, 0)
+
+
+def test_cached_function_does_not_cache_failures() -> None:
+    parse = CachedFunction(parse_iso_datetime_string, maxsize=2)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse("invalid")
+
+    assert parse.cache_info().currsize == 0
+
+
+def test_format_cache_distinguishes_offsets() -> None:
+    format_datetime = caching.get_cache("format_datetime", True)
+    utc = datetime(2020, 1, 1, 10, tzinfo=timezone.utc)
+    local = datetime(2020, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    assert utc == local
+
+    assert format_datetime(utc) == "2020-01-01T10:00:00+00:00"
+    assert format_datetime(local) == "2020-01-01T12:00:00+02:00"
+
+
+def test_format_cache_skips_subclasses() -> None:
+    format_date = caching.get_cache("format_date", True)
+
+    assert format_date(datetime(2020, 1, 1, 10)) == "2020-01-01T10:00:00"
+    assert format_date(date(2020, 1, 1)) == "2020-01-01"
+    assert format_date.cache_info().misses == 1
+
+
+def test_get_unknown_cache() -> None:
+    with pytest.raises(ValueError):
+        caching.get_cache("parse_unknown")
+
+
+def test_field_cache() -> None:
+    @dataclass
+    class Event:
+        occurred_at: datetime = field(cache=16)
+        duration: timedelta = field(cache=True)
+        day: date
+
+    events = [Event.deserialise({"occurred_at": "2020-01-01T10:00:00Z", "duration": "PT1H", "day": "2020-01-01"})]
+    events += [Event(occurred_at="2020-01-01T10:00:00Z", duration="PT1H", day="2020-01-01") for _ in range(3)]
+    serialised = [event.serialise() for event in events]
+
+    schema = Event.__gata_schema__
+    assert schema["occurred_at"]._type.parser.cache_info() == (3, 1, 16, 1)
+    assert schema["occurred_at"]._type.formatter.cache_info().hits == 3
+    assert schema["duration"]._type.parser.cache_info().hits == 3
+    assert schema["day"]._type.parser.cache_info().maxsize == 0
+    assert serialised[0] == {"occurred_at": "2020-01-01T10:00:00+00:00", "duration": "PT1H", "day": "2020-01-01"}
+    assert all(item == serialised[0] for item in serialised)
+
+
+def test_global_caches(global_caches: None) -> None:
+    @dataclass
+    class Schedule:
+        start: time
+        days: List[date]
+        uncached: date = field(cache=False)
+
+    Schedule(start="10:00:00", days=["2020-01-01", "2020-01-01"], uncached="2020-01-01")
+    Schedule(start="10:00:00", days=["2020-01-02"], uncached="2020-01-01")
+
+    stats = caching.cache_stats()
+    assert stats["parse_time"].hits == 1
+    assert stats["parse_date"].hits == 1
+    assert stats["parse_date"].misses == 2
+
+    caching.clear_caches()
+    assert caching.cache_stats()["parse_date"].currsize == 0
+
+
+def test_cached_validator_caches_errors() -> None:
+    validate = CachedValidator(validate_email, maxsize=4)
+
+    errors = []
+    for _ in range(2):
+        assert validate("email@example.com") == "email@example.com"
+        with pytest.raises(FormatValidationError) as error:
+            validate("invalid")
+        errors.append(error.value)
+
+    assert errors[0] is not errors[1]
+    assert errors[1].context == {"expected_format": StringFormat.EMAIL}
+    assert validate.cache_info() == (2, 2, 4, 2)
+
+
+def test_cached_validator_distinguishes_types() -> None:
+    validate = CachedValidator(type, maxsize=4, value_types=(int, bool))
+
+    assert validate(1) is int
+    assert validate(True) is bool
+    assert validate(1.0) is float
+    assert validate.cache_info().misses == 2
+
+
+def test_field_validation_cache() -> None:
+    class Country(Enum):
+        PL = "pl"
+        DE = "de"
+
+    @dataclass
+    class Contact:
+        email: str = field(string_format=StringFormat.EMAIL, cache=8)
+        code: str = field(pattern="[A-Z]{2}", cache=True)
+        country: Country = field(cache=True)
+        address: IPv4Address = field(cache=True)
+        name: str = field(cache=True)
+
+    for _ in range(3):
+        Contact(email="email@example.com", code="PL", country="pl", address="1.1.1.1", name="Bob")
+        with pytest.raises(FieldError):
+            Contact(email="invalid", code="PL", country="pl", address="1.1.1.1", name="Bob")
+
+    schema = Contact.__gata_schema__
+    assert schema["email"]._type.validator.cache_info() == (4, 2, 8, 2)
+    assert schema["code"]._type.validator.cache_info().hits == 2
+    assert schema["country"]._type.validator.cache_info().hits == 2
+    assert schema["address"]._type.validator.cache_info().hits == 2
+    assert schema["name"]._type.validator.cache_info().hits == 0
@@ -0,0 +1,169 @@
+import io
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import pytest
+from typing_extensions import TypedDict
+
+from gata import dataclass
+from gata import read_csv
+from gata import write_csv
+from gata.errors import RowError
+
+
+class Genre(Enum):
+    ROCK = 1
+    BLUES = 2
+
+
+@dataclass
+class Label:
+    name: str
+    country: str
+
+
+@dataclass
+class Artist:
+    name: str
+    label: Label
+
+
+@dataclass
+class Song:
+    title: str
+    length: int
+
+
+@dataclass
+class Album:
+    name: str
+    artist: Artist
+    genre: Genre
+    released_at: datetime
+    price: Decimal
+    rating: float
+    available: bool
+    tags: List[str]
+    years: List[int]
+    songs: List[Song]
+    notes: Optional[str] = None
+
+
+CSV = (
+    "name,artist.name,artist.label.name,artist.label.country,genre,released_at,price,rating,available,tags,years,"
+    "songs,unknown\r\n"
+    'Led Zeppelin I,Led Zeppelin,Atlantic,US,1,1969-01-12T00:00:00,10.50,4.5,Yes,rock|blues,1968|1969,'
+    '"[{""title"": ""Good Times Bad Times"", ""length"": 166}]",ignored\r\n'
+    "Led Zeppelin II,Led Zeppelin,Atlantic,,2,1969-10-22T00:00:00,11,4,0,,1969,[],\r\n"
+)
+
+
+def test_read_csv() -> None:
+    albums = list(read_csv(Album, io.StringIO(CSV)))
+
+    assert len(albums) == 2
+    first, second = albums
+    assert first.artist.name == "Led Zeppelin"
+    assert first.artist.label.country == "US"
+    assert first.genre is Genre.ROCK
+    assert first.released_at == datetime(1969, 1, 12)
+    assert first.price == Decimal("10.50")
+    assert first.rating == 4.5
+    assert first.available is True
+    assert first.tags == ["rock", "blues"]
+    assert first.years == [1968, 1969]
+    assert first.songs[0].title == "Good Times Bad Times"
+    assert first.notes is None
+
+    assert second.artist.label.country == ""
+    assert second.genre is Genre.BLUES
+    assert second.rating == 4.0
+    assert second.available is False
+    assert second.tags == []
+    assert second.songs == []
+
+
+def test_write_csv_round_trip(tmp_path) -> None:
+    albums = list(read_csv(Album, io.StringIO(CSV)))
+    path = tmp_path / "albums.csv"
+
+    write_csv(albums, path)
+
+    assert path.read_text().splitlines()[0] == (
+        "name,artist.name,artist.label.name,artist.label.country,genre,released_at,price,rating,available,tags,years,"
+        "songs,notes"
+    )
+    assert list(read_csv(Album, path)) == albums
+
+
+def test_write_csv_round_trip_with_tuple_and_dict_fields() -> None:
+    class Credits(TypedDict):
+        producer: str
+        engineer: str
+
+    @dataclass
+    class Track:
+        title: str
+        position: Tuple[int, int]
+        charts: Dict[str, int]
+        credits: Credits
+
+    tracks = [
+        Track(
+            title="Whole Lotta Love",
+            position=(1, 1),
+            charts={"uk": 1, "us": 4},
+            credits={"producer": "Jimmy Page", "engineer": "Eddie Kramer"},
+        )
+    ]
+    buffer = io.StringIO()
+
+    write_csv(tracks, buffer)
+
+    assert list(read_csv(Track, io.StringIO(buffer.getvalue()))) == tracks
+
+
+def test_read_csv_with_custom_delimiters() -> None:
+    @dataclass
+    class Playlist:
+        name: str
+        positions: List[int]
+
+    output = io.StringIO()
+    write_csv([Playlist(name="Morning", positions=[1, 2, 3])], output, list_delimiter=",", delimiter=";")
+
+    assert output.getvalue() == "name;positions\r\nMorning;1,2,3\r\n"
+    assert list(read_csv(Playlist, io.StringIO(output.getvalue()), list_delimiter=",", delimiter=";")) == [
+        Playlist(name="Morning", positions=[1, 2, 3])
+    ]
+
+
+def test_read_csv_reports_invalid_rows() -> None:
+    rows = io.StringIO("title,length\r\nGood Times Bad Times,166\r\nDazed and Confused,long\r\n")
+    songs = read_csv(Song, rows)
+
+    assert next(songs).length == 166
+    with pytest.raises(RowError) as error:
+        next(songs)
+    assert error.value.context["line"] == 3
+    assert "length" in str(error.value)
+
+
+def test_write_csv_round_trip_with_missing_optional_dataclass() -> None:
+    @dataclass
+    class Release:
+        name: str
+        label: Optional[Label] = None
+
+    releases = [Release(name="Demo"), Release(name="Single", label={"name": "Atlantic", "country": ""})]
+    buffer = io.StringIO()
+
+    write_csv(releases, buffer)
+
+    assert buffer.getvalue().splitlines() == ["name,label.name,label.country", "Demo,,", "Single,Atlantic,"]
+    assert list(read_csv(Release, io.StringIO(buffer.getvalue()))) == releases
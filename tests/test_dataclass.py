@@ -1,11 +1,12 @@
 from datetime import timedelta
-from typing import List, Optional, Dict, Union, Any
+from typing import List, Optional, Dict, Tuple, Union, Any
 
 import pytest
 
-from gata import dataclass, field
+from gata import dataclass, diff, dumps, field, replace, validate_dataclass
 from gata.dataclasses import Dataclass
 from gata import Type
+from gata.schema import Field
 
 
 def test_define_dataclass() -> None:
@@ -319,3 +320,510 @@ def test_user_type() -> None:
         Person.validate({"age": 10, "favourite_color": "white", "name": "John"})
 
     assert dict(person) == {"age": 10, "favourite_color": "black", "name": "Bob"}
+
+
+def test_lazy_dataclass() -> None:
+    @dataclass()
+    class Song:
+        title: str
+        duration: timedelta
+
+    @dataclass(lazy=True)
+    class Album:
+        title: str
+        year: int = 1969
+        songs: List[Song]
+
+    raw_data = {
+        "title": "Test Album",
+        "songs": [{"title": "Song A", "duration": "PT3M20S"}],
+    }
+
+    album = Album(**raw_data)
+
+    assert "songs" not in album.__dict__
+    assert album.title == "Test Album"
+    assert album.year == 1969
+    assert "songs" not in album.__dict__
+    assert album.serialise() == {
+        "title": "Test Album",
+        "year": 1969,
+        "songs": [{"title": "Song A", "duration": "PT3M20S"}],
+    }
+
+    assert isinstance(album.songs[0], Song)
+    assert album.songs[0].duration == timedelta(minutes=3, seconds=20)
+    assert album.songs is album.__dict__["songs"]
+
+    album.title = "New Title"
+    assert album.serialise()["title"] == "New Title"
+
+
+def test_lazy_dataclass_validates_on_access() -> None:
+    @dataclass(lazy=True)
+    class Song:
+        title: str
+        duration: timedelta
+
+    song = Song(title="Song A", duration="3 minutes")
+
+    assert song.title == "Song A"
+    with pytest.raises(ValueError):
+        song.duration
+
+
+def test_lazy_dataclass_validates_on_serialise() -> None:
+    @dataclass(lazy=True)
+    class Song:
+        title: str
+        duration: timedelta
+
+    song = Song(title="Song A", duration="3 minutes")
+
+    with pytest.raises(ValueError):
+        song.serialise()
+    with pytest.raises(ValueError):
+        dumps(song)
+
+
+def test_lazy_dataclass_serialise_does_not_alias_input() -> None:
+    @dataclass(lazy=True)
+    class Album:
+        title: str
+        tags: List[str]
+
+    tags = ["rock", "blues"]
+    album = Album(title="Test Album", tags=tags)
+
+    serialised = album.serialise()
+    serialised["tags"].append("pop")
+
+    assert tags == ["rock", "blues"]
+    assert album.serialise() == {"title": "Test Album", "tags": ["rock", "blues"]}
+
+
+def test_lazy_frozen_dataclass() -> None:
+    @dataclass(frozen=True, lazy=True)
+    class Song:
+        title: str
+        duration: timedelta
+
+    song = Song(title="Song A", duration="PT2M")
+
+    assert song.duration == timedelta(minutes=2)
+    assert song.title == "Song A"
+    with pytest.raises(TypeError):
+        song.title = "Song B"
+
+
+def test_serialise_with_projection() -> None:
+    @dataclass()
+    class Artist:
+        name: str
+        country: str
+
+    @dataclass()
+    class Song:
+        title: str
+        duration: timedelta
+
+    @dataclass()
+    class Album:
+        title: str
+        artist: Artist
+        songs: List[Song]
+
+    album = Album(
+        title="Test Album",
+        artist=Artist(name="Test Artist", country="PL"),
+        songs=[Song(title="Song A", duration=timedelta(minutes=2))],
+    )
+
+    assert album.serialise(fields=["title", "artist.name", "songs.title"]) == {
+        "title": "Test Album",
+        "artist": {"name": "Test Artist"},
+        "songs": [{"title": "Song A"}],
+    }
+    assert album.serialise(exclude=["artist", "songs.duration"]) == {
+        "title": "Test Album",
+        "songs": [{"title": "Song A"}],
+    }
+    assert album.serialise(fields=["artist", "artist.name"], artist="performer") == {
+        "performer": {"name": "Test Artist", "country": "PL"},
+    }
+
+
+def test_serialise_item_mapping_serialises_single_field() -> None:
+    @dataclass()
+    class Song:
+        title: str
+        duration: timedelta
+
+    @dataclass()
+    class Album:
+        title: str
+        songs: List[Song]
+
+    album = Album(title="Test Album", songs=[Song(title="Song A", duration=timedelta(minutes=2))])
+    album.songs[0].duration = None  # would fail if serialised
+
+    assert album.serialise(songs={"$item": "title"}) == {"title": "Test Album", "songs": ["Song A"]}
+    assert album.serialise(songs={"$item": "name", "title": "name"}) == {"title": "Test Album", "songs": ["Song A"]}
+
+
+def test_deserialise_with_projection() -> None:
+    @dataclass()
+    class Artist:
+        name: str
+        country: str
+
+    @dataclass()
+    class Song:
+        title: str
+        duration: timedelta
+
+    @dataclass()
+    class Album:
+        title: str
+        year: int = 1969
+        artist: Artist
+        songs: List[Song]
+
+    raw_data = {
+        "title": "Test Album",
+        "year": 1970,
+        "artist": {"name": "Test Artist", "country": "PL"},
+        "songs": [{"title": "Song A", "duration": "invalid"}],
+    }
+
+    album = Album.deserialise(raw_data, fields=["title", "artist.name", "songs.title"])
+
+    assert album.title == "Test Album"
+    assert album.year == 1969
+    assert isinstance(album.artist, Artist)
+    assert album.artist.name == "Test Artist"
+    assert album.artist.country is None
+    assert album.songs[0].title == "Song A"
+    assert album.songs[0].duration is None
+
+    album = Album.deserialise(raw_data, exclude=["artist", "songs"])
+    assert album.artist is None
+    assert album.songs is None
+    assert album.year == 1970
+
+    with pytest.raises(ValueError):
+        Album.deserialise(raw_data, fields=["songs"])
+
+
+def test_deserialise_optional_nested_fields_with_projection() -> None:
+    @dataclass()
+    class Artist:
+        name: str
+        country: str
+
+    @dataclass()
+    class Song:
+        title: str
+        duration: timedelta
+
+    @dataclass()
+    class Album:
+        title: str
+        artist: Optional[Artist] = None
+        songs: Optional[List[Optional[Song]]] = None
+
+    raw_data = {
+        "title": "Test Album",
+        "artist": {"name": "Test Artist", "country": 1},
+        "songs": [{"title": "Song A", "duration": "invalid"}, None],
+    }
+
+    album = Album.deserialise(raw_data, fields=["title", "artist.name", "songs.title"])
+
+    assert album.artist.name == "Test Artist"
+    assert album.artist.country is None
+    assert album.songs[0].title == "Song A"
+    assert album.songs[0].duration is None
+    assert album.songs[1] is None
+    assert album.serialise(fields=["artist.name", "songs.title"]) == {
+        "artist": {"name": "Test Artist"},
+        "songs": [{"title": "Song A"}, None],
+    }
+    assert Album.deserialise({"title": "Test Album"}, fields=["title", "artist.name"]).artist is None
+
+
+def test_track_changes_revalidates_only_dirty_fields() -> None:
+    validated = []
+
+    def validate_title(value: Any) -> Any:
+        validated.append(value)
+        if not isinstance(value, str):
+            raise ValueError("title must be a string")
+        return value
+
+    @dataclass(track_changes=True)
+    class Song:
+        title: str = Field(validator=validate_title)
+        duration: timedelta
+        tags: List[str]
+
+    song = Song(title="Song A", duration="PT2M", tags=[])
+    assert validated == ["Song A"]
+
+    song.duration = timedelta(minutes=3)
+    validate_dataclass(song)
+    assert validated == ["Song A"]
+
+    song.title = 12
+    with pytest.raises(ValueError):
+        validate_dataclass(song)
+
+    song.title = "Song B"
+    validate_dataclass(song)
+    validate_dataclass(song)
+    assert validated == ["Song A", 12, "Song B"]
+
+    song.tags.append(1)  # in-place changes of mutable fields are always revalidated
+    with pytest.raises(ValueError):
+        validate_dataclass(song)
+
+
+def test_track_changes_reserialises_only_dirty_fields() -> None:
+    @dataclass(track_changes=True)
+    class Song:
+        title: str
+        duration: timedelta
+
+    song = Song(title="Song A", duration="PT2M")
+    assert song.serialise() == {"title": "Song A", "duration": "PT2M"}
+    assert song.__dict__["__gata_serialised__"] == {"title": "Song A", "duration": "PT2M"}
+
+    song.duration = timedelta(minutes=3)
+    assert "duration" not in song.__dict__["__gata_serialised__"]
+    assert song.serialise() == {"title": "Song A", "duration": "PT3M"}
+    assert song.serialise(duration="length") == {"title": "Song A", "length": "PT3M"}
+
+
+def test_track_changes_validates_lazy_fields() -> None:
+    @dataclass(lazy=True, track_changes=True)
+    class Song:
+        title: str
+        year: int
+
+    song = Song(title="Song A", year="abc")
+
+    with pytest.raises(ValueError):
+        validate_dataclass(song)
+
+    song = Song(title="Song A", year=1969)
+    validate_dataclass(song)
+    song.year = 1970
+    assert song.__dict__["__gata_dirty__"] == {"year"}
+
+
+def test_track_changes_serialised_output_can_be_modified() -> None:
+    @dataclass(frozen=True)
+    class Artist:
+        name: str
+
+    @dataclass(track_changes=True)
+    class Song:
+        title: str
+        artist: Artist
+        tags: Tuple[str, ...]
+
+    song = Song(title="Song A", artist={"name": "Artist A"}, tags=("rock",))
+    serialised = song.serialise()
+    serialised["artist"]["name"] = "X"
+    serialised["tags"].append("pop")
+
+    assert song.serialise() == {"title": "Song A", "artist": {"name": "Artist A"}, "tags": ["rock"]}
+    song.serialise()["artist"]["name"] = "Y"
+    assert song.serialise()["artist"] == {"name": "Artist A"}
+
+
+def test_replace_frozen_dataclass() -> None:
+    @dataclass(frozen=True)
+    class Song:
+        title: str
+        duration: timedelta
+        tags: List[str]
+
+    song = Song(title="Song A", duration="PT2M", tags=["rock"])
+    new_song = replace(song, duration="PT3M")
+
+    assert isinstance(new_song, Song)
+    assert new_song.duration == timedelta(minutes=3)
+    assert new_song.title == "Song A"
+    assert new_song.tags is song.tags
+    assert song.duration == timedelta(minutes=2)
+
+    with pytest.raises(TypeError):
+        new_song.title = "Song B"
+
+    with pytest.raises(ValueError):
+        replace(song, duration="3 minutes")
+
+    with pytest.raises(TypeError):
+        replace(song, artist="Test Artist")
+
+
+def test_replace_runs_post_init() -> None:
+    @dataclass
+    class Song:
+        title: str
+        slug: str = field(init=False)
+
+        def __post_init__(self) -> None:
+            self.slug = self.title.lower()
+
+    song = replace(Song(title="Song A"), title="Song B")
+
+    assert song.slug == "song b"
+    with pytest.raises(ValueError):
+        replace(song, slug="song-c")
+
+
+def test_replace_memoised_dataclass() -> None:
+    @dataclass(frozen=True, memoise=True)
+    class Song:
+        title: str
+        duration: timedelta
+
+    song = Song(title="Song A", duration="PT2M")
+    assert song.serialise() == {"title": "Song A", "duration": "PT2M"}
+
+    new_song = replace(song, duration="PT3M")
+
+    assert new_song.serialise() == {"title": "Song A", "duration": "PT3M"}
+    assert new_song.to_json() == '{"title":"Song A","duration":"PT3M"}'
+    assert song.serialise() == {"title": "Song A", "duration": "PT2M"}
+
+
+def test_diff_dataclasses() -> None:
+    @dataclass()
+    class Artist:
+        name: str
+        country: str
+
+    @dataclass()
+    class Song:
+        title: str
+        duration: timedelta
+
+    @dataclass()
+    class Album:
+        title: str
+        artist: Artist
+        songs: List[Song]
+        plays: int = field(default=0, compare=False)
+
+    album = Album(
+        title="Test Album",
+        artist=Artist(name="Test Artist", country="PL"),
+        songs=[Song(title="Song A", duration="PT2M"), Song(title="Song B", duration="PT3M")],
+    )
+    changed_album = replace(
+        album,
+        artist=replace(album.artist, country="UK"),
+        songs=[album.songs[0], replace(album.songs[1], duration="PT4M")],
+        plays=10,
+    )
+
+    assert diff(album, album) == {}
+    assert diff(album, changed_album) == {
+        "artist.country": ("PL", "UK"),
+        "songs.1.duration": (timedelta(minutes=3), timedelta(minutes=4)),
+    }
+    assert diff(album, changed_album, serialise=True) == {
+        "artist": {"country": "UK"},
+        "songs": [{"title": "Song A", "duration": "PT2M"}, {"title": "Song B", "duration": "PT4M"}],
+    }
+
+    with pytest.raises(TypeError):
+        diff(album, album.artist)
+
+
+def test_memoised_serialisation_of_frozen_dataclass() -> None:
+    @dataclass(frozen=True, memoise=True)
+    class Artist:
+        name: str
+
+    @dataclass(frozen=True, memoise=True)
+    class Song:
+        title: str
+        artists: List[Artist]
+        duration: timedelta
+
+    song = Song(title="Song A", artists=[Artist(name="Test Artist")], duration="PT2M")
+    serialised = song.serialise()
+
+    assert serialised == {"title": "Song A", "artists": [{"name": "Test Artist"}], "duration": "PT2M"}
+    assert song.__dict__["__gata_memo__"] == serialised
+    assert song.artists[0].__dict__["__gata_memo__"] == {"name": "Test Artist"}
+
+    serialised["artists"].append({"name": "Other Artist"})
+    assert song.serialise() == {"title": "Song A", "artists": [{"name": "Test Artist"}], "duration": "PT2M"}
+    assert song.serialise(title="name") == {"name": "Song A", "artists": [{"name": "Test Artist"}], "duration": "PT2M"}
+    assert dict(song) == song.serialise()
+
+    with pytest.raises(ValueError):
+
+        @dataclass(memoise=True)
+        class NotFrozenSong:
+            title: str
+
+
+def test_serialise_with_profile() -> None:
+    from datetime import date, datetime
+    from decimal import Decimal
+    from enum import Enum
+    from uuid import UUID
+
+    class Genre(Enum):
+        ROCK = "rock"
+
+    @dataclass
+    class Song:
+        title: str
+        recorded_at: datetime
+        genre: Genre
+
+    @dataclass
+    class Album:
+        id: UUID
+        released_on: date
+        price: Decimal
+        songs: List[Song]
+        sessions: List[datetime]
+
+    album = Album(
+        id="cff801a5-5db7-4287-9414-64ba51a9a730",
+        released_on="1969-01-12",
+        price="10.50",
+        songs=[{"title": "Dazed and Confused", "recorded_at": "1968-10-01T10:00:00", "genre": "rock"}],
+        sessions=["1968-10-01T10:00:00"],
+    )
+
+    python_serialised = album.serialise(profile="python")
+    assert python_serialised == {
+        "id": UUID("cff801a5-5db7-4287-9414-64ba51a9a730"),
+        "released_on": date(1969, 1, 12),
+        "price": Decimal("10.50"),
+        "songs": [{"title": "Dazed and Confused", "recorded_at": datetime(1968, 10, 1, 10), "genre": Genre.ROCK}],
+        "sessions": [datetime(1968, 10, 1, 10)],
+    }
+
+    bson_serialised = album.serialise(profile="bson", songs={"title": "name"})
+    assert bson_serialised["id"] == "cff801a5-5db7-4287-9414-64ba51a9a730"
+    assert bson_serialised["released_on"] == "1969-01-12"
+    assert bson_serialised["songs"] == [
+        {"name": "Dazed and Confused", "recorded_at": datetime(1968, 10, 1, 10), "genre": "rock"}
+    ]
+    assert bson_serialised["sessions"] == [datetime(1968, 10, 1, 10)]
+
+    assert album.serialise(profile="json") == album.serialise()
+    assert album.serialise()["songs"][0]["recorded_at"] == "1968-10-01T10:00:00"
+
+    with pytest.raises(ValueError):
+        album.serialise(profile="yaml")
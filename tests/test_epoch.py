@@ -0,0 +1,125 @@
+import io
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import List
+
+import pytest
+
+from gata import dataclass
+from gata import field
+from gata import read_csv
+from gata import write_csv
+from gata.epoch import datetime_to_epoch
+from gata.epoch import epoch_to_datetime
+from gata.errors import FieldError
+from gata.mapping import DateTimeMapping
+
+OCCURRED_AT = datetime(2020, 1, 1, 10, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+@dataclass
+class Measurement:
+    occurred_at: datetime = field(epoch="ms")
+    day: date = field(epoch=True)
+    duration: timedelta = field(epoch=True)
+    samples: List[datetime] = field(items={"epoch": "s"}, default_factory=list)
+
+
+@pytest.mark.parametrize(
+    "unit,expected",
+    [("s", 1577874615), ("ms", 1577874615123), ("us", 1577874615123456), ("ns", 1577874615123456000)],
+)
+def test_datetime_to_epoch(unit: str, expected: int) -> None:
+    assert datetime_to_epoch(OCCURRED_AT, unit) == expected
+    assert datetime_to_epoch(OCCURRED_AT.replace(tzinfo=None), unit) == expected
+    assert datetime_to_epoch(OCCURRED_AT.astimezone(timezone(timedelta(hours=2))), unit) == expected
+
+
+@pytest.mark.parametrize(
+    "value,unit,expected",
+    [
+        (1577874615, "s", OCCURRED_AT.replace(microsecond=0)),
+        (1577874615.5, "s", OCCURRED_AT.replace(microsecond=500000)),
+        (1577874615123, "ms", OCCURRED_AT.replace(microsecond=123000)),
+        (1577874615123456, "us", OCCURRED_AT),
+        (1577874615123456789, "ns", OCCURRED_AT),
+        (-1000, "ms", datetime(1969, 12, 31, 23, 59, 59, tzinfo=timezone.utc)),
+    ],
+)
+def test_epoch_to_datetime(value: int, unit: str, expected: datetime) -> None:
+    result = epoch_to_datetime(value, unit)
+
+    assert result == expected
+    assert result.tzinfo is timezone.utc
+
+
+def test_unsupported_epoch_unit() -> None:
+    with pytest.raises(ValueError):
+        DateTimeMapping(epoch="minutes")
+
+
+def test_serialise_epoch_fields() -> None:
+    measurement = Measurement(
+        occurred_at=OCCURRED_AT, day=date(2020, 1, 1), duration=timedelta(seconds=1, microseconds=5), samples=[]
+    )
+    measurement.samples.append(OCCURRED_AT)
+
+    assert measurement.serialise() == {
+        "occurred_at": 1577874615123,
+        "day": 737425,
+        "duration": 1000005,
+        "samples": [1577874615],
+    }
+
+
+def test_validate_epoch_fields() -> None:
+    measurement = Measurement(occurred_at=1577874615123, day=737425, duration=1000005, samples=[1577874615])
+
+    assert measurement.occurred_at == OCCURRED_AT.replace(microsecond=123000)
+    assert measurement.day == date(2020, 1, 1)
+    assert measurement.duration == timedelta(seconds=1, microseconds=5)
+    assert measurement.samples == [OCCURRED_AT.replace(microsecond=0)]
+
+
+def test_epoch_fields_accept_iso_strings() -> None:
+    measurement = Measurement(occurred_at="2020-01-01T10:30:15Z", day="2020-01-01", duration="PT1S")
+
+    assert measurement.serialise() == {
+        "occurred_at": 1577874615000,
+        "day": 737425,
+        "duration": 1000000,
+        "samples": [],
+    }
+
+
+@pytest.mark.parametrize("field_name,value", [("occurred_at", True), ("day", 1.5), ("day", 0), ("duration", "1000")])
+def test_invalid_epoch_values(field_name: str, value: object) -> None:
+    data = {"occurred_at": 0, "day": 737425, "duration": 0, field_name: value}
+
+    with pytest.raises(FieldError):
+        Measurement(**data)
+
+
+def test_deserialise_epoch_fields() -> None:
+    measurement = Measurement(
+        occurred_at=OCCURRED_AT.replace(microsecond=123000), day=date(2020, 1, 1), duration=timedelta(seconds=1)
+    )
+
+    assert Measurement.deserialise(measurement.serialise()) == measurement
+    assert Measurement.from_json(measurement.to_json()) == measurement
+    assert Measurement.from_msgpack(measurement.to_msgpack()) == measurement
+
+
+def test_epoch_fields_in_csv() -> None:
+    measurement = Measurement(
+        occurred_at=OCCURRED_AT.replace(microsecond=123000), day=date(2020, 1, 1), duration=timedelta(seconds=1)
+    )
+    stream = io.StringIO()
+
+    write_csv([measurement], stream)
+    stream.seek(0)
+
+    assert stream.getvalue().splitlines()[1] == "1577874615123,737425,1000000,"
+    assert list(read_csv(Measurement, stream)) == [measurement]
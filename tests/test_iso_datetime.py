@@ -1,8 +1,10 @@
-from datetime import time, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 
 import pytest
 
 from gata.iso_datetime import (
+    parse_iso_date_string,
+    parse_iso_datetime_string,
     parse_iso_duration_string,
     parse_iso_time_string,
     timedelta_to_iso_string,
@@ -25,6 +27,102 @@ def test_parse_iso_time_string(given, expected) -> None:
     assert parse_iso_time_string(given) == expected
 
 
+PLUS_TWO = timezone(timedelta(hours=2))
+MINUS_FIVE_THIRTY = timezone(-timedelta(hours=5, minutes=30))
+
+
+@pytest.mark.parametrize(
+    "given,expected",
+    [
+        ("2016-09-18T17:34:02", datetime(2016, 9, 18, 17, 34, 2)),
+        ("2016-09-18 17:34:02", datetime(2016, 9, 18, 17, 34, 2)),
+        ("2016-09-18t17:34:02", datetime(2016, 9, 18, 17, 34, 2)),
+        ("2016-09-1817:34:02", datetime(2016, 9, 18, 17, 34, 2)),
+        ("20160918T173402", datetime(2016, 9, 18, 17, 34, 2)),
+        ("20160918173402Z", datetime(2016, 9, 18, 17, 34, 2, tzinfo=timezone.utc)),
+        ("2016-09-18T17:34:02Z", datetime(2016, 9, 18, 17, 34, 2, tzinfo=timezone.utc)),
+        ("2016-09-18T17:34:02z", datetime(2016, 9, 18, 17, 34, 2, tzinfo=timezone.utc)),
+        ("2016-09-18T17:34:02+00:00", datetime(2016, 9, 18, 17, 34, 2, tzinfo=timezone.utc)),
+        ("2016-09-18T17:34:02+02:00", datetime(2016, 9, 18, 17, 34, 2, tzinfo=PLUS_TWO)),
+        ("2016-09-18T17:34:02-05:30", datetime(2016, 9, 18, 17, 34, 2, tzinfo=MINUS_FIVE_THIRTY)),
+        ("2016-09-18T17:34:02.1", datetime(2016, 9, 18, 17, 34, 2, 100000)),
+        ("2016-09-18T17:34:02.12", datetime(2016, 9, 18, 17, 34, 2, 120000)),
+        ("2016-09-18T17:34:02.124Z", datetime(2016, 9, 18, 17, 34, 2, 124000, tzinfo=timezone.utc)),
+        ("2016-09-18T17:34:02.1245", datetime(2016, 9, 18, 17, 34, 2, 124500)),
+        ("2016-09-18T17:34:02.000001+02:00", datetime(2016, 9, 18, 17, 34, 2, 1, tzinfo=PLUS_TWO)),
+        ("2016-09-18T17:34:02.123456789", datetime(2016, 9, 18, 17, 34, 2, 123456)),
+        ("20160918T173402.5-05:30", datetime(2016, 9, 18, 17, 34, 2, 500000, tzinfo=MINUS_FIVE_THIRTY)),
+    ],
+)
+def test_parse_iso_datetime_string(given: str, expected: datetime) -> None:
+    result = parse_iso_datetime_string(given)
+
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "given",
+    [
+        "",
+        "2016-09-18",
+        "2016-13-18T17:34:02",
+        "2016-02-30T17:34:02",
+        "2016-09-18T24:00:00",
+        "2016-09-18T17:34:02.",
+        "2016-09-18T17:34:02+0200",
+        "2016-09-18T17:34:02+24:00",
+        "2016-09-18T17:34:02\n",
+        "2016-09-18x17:34:02",
+        "2016-09-18T23:59:60",
+    ],
+)
+def test_parse_invalid_iso_datetime_string(given: str) -> None:
+    with pytest.raises(ValueError):
+        parse_iso_datetime_string(given)
+
+
+def test_parse_iso_datetime_string_reuses_timezones() -> None:
+    first = parse_iso_datetime_string("2016-09-18T17:34:02+02:00")
+    second = parse_iso_datetime_string("20160918T173402.5+02:00")
+
+    assert first.tzinfo is second.tzinfo
+
+
+@pytest.mark.parametrize(
+    "given,expected",
+    [
+        ("17:34:02.1", time(17, 34, 2, 100000)),
+        ("17:34:02.124", time(17, 34, 2, 124000)),
+        ("17:34:02.000124", time(17, 34, 2, 124)),
+        ("173402.1234567", time(17, 34, 2, 123456)),
+        ("17:34:02.5-05:30", time(17, 34, 2, 500000, tzinfo=MINUS_FIVE_THIRTY)),
+    ],
+)
+def test_parse_iso_time_string_with_fraction(given: str, expected: time) -> None:
+    result = parse_iso_time_string(given)
+
+    assert result == expected
+    assert result.tzinfo == expected.tzinfo
+
+
+@pytest.mark.parametrize("given", ["", "17:34", "17:34:02.", "23:59:60", "17:34:02+0200"])
+def test_parse_invalid_iso_time_string(given: str) -> None:
+    with pytest.raises(ValueError):
+        parse_iso_time_string(given)
+
+
+@pytest.mark.parametrize("given", ["2016-09-18", "20160918"])
+def test_parse_iso_date_string(given: str) -> None:
+    assert parse_iso_date_string(given) == date(2016, 9, 18)
+
+
+@pytest.mark.parametrize("given", ["", "2016-9-18", "2016-02-30", "2016-09-18\n", "2016-09-18T00:00:00"])
+def test_parse_invalid_iso_date_string(given: str) -> None:
+    with pytest.raises(ValueError):
+        parse_iso_date_string(given)
+
+
 def test_parse_simple_duration_strings() -> None:
     one_week = parse_iso_duration_string("P1W")
     assert one_week == timedelta(weeks=1)
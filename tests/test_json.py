@@ -0,0 +1,260 @@
+import dataclasses
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+
+from gata import Dataclass
+from gata import dataclass
+from gata import deserialise_many
+from gata import dump
+from gata import dumps
+from gata import json_support
+from gata.errors import FieldError
+from gata.errors import TypeValidationError
+
+BACKENDS = ["json"] + (["orjson"] if json_support.ORJSON_SUPPORT else [])
+
+
+class Genre(Enum):
+    ROCK = "rock"
+    BLUES = "blues"
+
+
+@dataclass
+class Artist:
+    name: str
+    born: Optional[int] = None
+
+
+@dataclass
+class Song:
+    title: str
+    length: Decimal
+
+
+@dataclass
+class Album:
+    name: str
+    artist: Artist
+    genre: Genre
+    released_at: datetime
+    songs: List[Song]
+    tags: List[str]
+    extra: Dict[str, Any]
+    rating: float = 0.0
+
+
+def create_album() -> Album:
+    return Album(
+        name="Led Zeppelin I",
+        artist={"name": "Led Zeppelin", "born": 1968},
+        genre="rock",
+        released_at="1969-01-12T00:00:00",
+        songs=[{"title": "Good Times Bad Times", "length": "2.46"}, {"title": "Dazed and Confused", "length": "6.28"}],
+        tags=["rock", "blues"],
+        extra={"label": "Atlantic"},
+        rating=4.5,
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_matches_serialised_form(backend: str) -> None:
+    album = create_album()
+
+    result = dumps(album, backend=backend)
+
+    assert isinstance(result, str)
+    assert json.loads(result) == album.serialise()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_binary(backend: str) -> None:
+    album = create_album()
+
+    result = album.to_json(binary=True, backend=backend)
+
+    assert isinstance(result, bytes)
+    assert json.loads(result) == album.serialise()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_optional_fields(backend: str) -> None:
+    @dataclass
+    class Release:
+        released_at: Optional[datetime]
+        artist: Optional[Artist] = None
+
+    release = Release(released_at="1969-01-12T00:00:00", artist={"name": "Led Zeppelin"})
+
+    assert release.released_at == datetime(1969, 1, 12)
+    assert json.loads(dumps(release, backend=backend)) == {
+        "released_at": "1969-01-12T00:00:00",
+        "artist": {"name": "Led Zeppelin", "born": None},
+    }
+    assert json.loads(dumps(Release(released_at=None), backend=backend)) == {"released_at": None, "artist": None}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_list_of_dataclasses(backend: str) -> None:
+    songs = [Song(title="Communication Breakdown", length="2.30"), Song(title="How Many More Times", length="8.28")]
+
+    result = dumps({"songs": songs}, backend=backend)
+
+    assert json.loads(result) == {"songs": [song.serialise() for song in songs]}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dump_into_file(backend: str) -> None:
+    album = create_album()
+    text_file = io.StringIO()
+    binary_file = io.BytesIO()
+
+    dump(album, text_file, backend=backend)
+    dump(album, binary_file, backend=backend)
+
+    assert json.loads(text_file.getvalue()) == album.serialise()
+    assert json.loads(binary_file.getvalue()) == album.serialise()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_uses_custom_serialise(backend: str) -> None:
+    class Secret(Dataclass):
+        login: str
+        password: str
+
+        def serialise(self, *args, **kwargs) -> Dict[str, Any]:
+            return {"login": self.login}
+
+    assert json.loads(dumps(Secret(login="bob", password="secret"), backend=backend)) == {"login": "bob"}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_python_dataclass(backend: str) -> None:
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: int
+        created_at: datetime
+
+    point = Point(x=1, y=2, created_at=datetime(2020, 1, 1))
+
+    assert json.loads(dumps(point, backend=backend)) == {"x": 1, "y": 2, "created_at": "2020-01-01T00:00:00"}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_memoised_dataclass(backend: str) -> None:
+    @dataclass(frozen=True, memoise=True)
+    class Track:
+        title: str
+        released_at: datetime
+
+    track = Track(title="Black Dog", released_at="1971-11-08T00:00:00")
+
+    assert json.loads(track.to_json(backend=backend)) == {"title": "Black Dog", "released_at": "1971-11-08T00:00:00"}
+    assert track.to_json(backend=backend) == track.to_json(backend=backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_non_str_keys_and_big_integers(backend: str) -> None:
+    @dataclass
+    class Chart:
+        positions: Dict[int, str]
+        listeners: int
+
+    chart = Chart(positions={1: "Whole Lotta Love", 2: "Black Dog"}, listeners=2 ** 70)
+
+    expected = '{"positions":{"1":"Whole Lotta Love","2":"Black Dog"},"listeners":%d}' % 2 ** 70
+    assert chart.to_json(backend=backend) == expected
+    assert dumps({"plays": [2 ** 64]}, backend=backend) == '{"plays":[%d]}' % 2 ** 64
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_fails_for_unsupported_values(backend: str) -> None:
+    with pytest.raises(TypeError):
+        dumps({"value": object()}, backend=backend)
+
+
+def test_dumps_fails_for_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        dumps(create_album(), backend="unknown")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("data_type", [str, bytes, bytearray, memoryview])
+def test_from_json(backend: str, data_type: Any) -> None:
+    album = create_album()
+    data = album.to_json(binary=data_type is not str)
+
+    result = Album.from_json(data_type(data), backend=backend)
+
+    assert isinstance(result, Album)
+    assert result == album
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_from_json_with_projection(backend: str) -> None:
+    album = create_album()
+
+    result = Album.from_json(album.to_json(backend=backend), fields=["name", "artist.name"], backend=backend)
+
+    assert result.name == "Led Zeppelin I"
+    assert result.artist.name == "Led Zeppelin"
+    assert result.artist.born is None
+    assert result.songs is None
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_from_json_on_dataclass_base(backend: str) -> None:
+    class Point(Dataclass, frozen=True):
+        x: int
+        y: int
+
+    point = Point.from_json(b'{"x": 1, "y": 2}', backend=backend)
+
+    assert point.x == 1
+    assert point.y == 2
+    with pytest.raises(TypeError):
+        point.x = 2
+
+
+@dataclass
+class Person:
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name.upper()
+
+
+class Band(Dataclass):
+    name: str
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name.upper())
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_from_json_uses_custom_init(backend: str) -> None:
+    assert Person.from_json('{"name": "bob"}', backend=backend) == Person(name="bob")
+    assert Person.from_json('{"name": "bob"}', backend=backend).name == "BOB"
+    assert Band.from_json('{"name": "cream"}', backend=backend).name == "CREAM"
+    assert [person.name for person in deserialise_many(Person, [{"name": "bob"}])] == ["BOB"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_from_json_fails_for_invalid_input(backend: str) -> None:
+    with pytest.raises(ValueError):
+        Album.from_json("{invalid", backend=backend)
+
+    with pytest.raises(TypeValidationError):
+        Album.from_json("[]", backend=backend)
+
+    with pytest.raises(FieldError):
+        Song.from_json('{"title": "Black Dog", "length": "invalid"}', backend=backend)
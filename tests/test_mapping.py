@@ -1,13 +1,16 @@
 import base64
+from enum import Enum, Flag
 from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from ipaddress import IPv4Address, IPv6Address
 import re
-from typing import List, Pattern, Tuple
+from typing import Dict, FrozenSet, List, Mapping, Optional, Pattern, Set, Tuple, Union
 from uuid import UUID
 
 import pytest
+from typing_extensions import Literal, TypedDict
 
-from gata.dataclasses import field, build_schema
+from gata.dataclasses import dataclass, field, build_schema
 from gata import mapping
 
 
@@ -262,6 +265,42 @@ def test_schema_typed_list_type_with_items() -> None:
         schema["property"].validate([1, 2, 5])
 
 
+def test_list_type_keeps_unchanged_lists() -> None:
+    class TestList:
+        numbers: List[int]
+        days: List[date]
+        copied: List[int] = field(copy=True)
+
+    schema = build_schema(TestList)
+    numbers = list(range(1000))
+    days = [date(2020, 1, 1), date(2020, 1, 2)]
+
+    assert schema["numbers"].validate(numbers) is numbers
+    assert schema["numbers"].deserialise(numbers) is numbers
+    assert schema["days"].validate(days) is days
+    assert schema["days"].validate([date(2020, 1, 1), "2020-01-02"]) == days
+    assert schema["days"].deserialise(["2020-01-01", "2020-01-02"]) == days
+    assert schema["copied"].validate(numbers) is not numbers
+    assert schema["copied"].validate(numbers) == numbers
+    assert schema["copied"].deserialise(numbers) is not numbers
+
+    with pytest.raises(ValueError):
+        schema["numbers"].validate([1, 2, "3"])
+
+
+def test_set_type_keeps_unchanged_sets() -> None:
+    test = mapping.SetMapping(items=[mapping.StringMapping()])
+    days = mapping.SetMapping(items=[mapping.DateMapping()])
+    tags = {"a", "b"}
+    dates = {date(2020, 1, 1)}
+
+    assert test.validate(tags) is tags
+    assert test.deserialise(tags) is tags
+    assert days.validate(dates) is dates
+    assert days.validate({"2020-01-01"}) == dates
+    assert mapping.SetMapping(items=[mapping.StringMapping()], copy=True).validate(tags) is not tags
+
+
 def test_boolean_type() -> None:
     test = mapping.BooleanMapping()
 
@@ -363,3 +402,236 @@ def test_tuple_type() -> None:
     with pytest.raises(ValueError):
         schema["property"].validate((1, 2, 5, "a"))
 
+
+def test_typed_tuple_type() -> None:
+    class TestTuple:
+        span: Tuple[date, date]
+        days: Tuple[date, ...]
+
+    schema = build_schema(TestTuple)
+    span = (date(2020, 1, 1), date(2020, 1, 2))
+
+    assert schema["span"].validate(("2020-01-01", "2020-01-02")) == span
+    assert schema["span"].validate(["2020-01-01", "2020-01-02"]) == span
+    assert schema["span"].serialise(span) == ["2020-01-01", "2020-01-02"]
+    assert schema["span"].deserialise(["2020-01-01", "2020-01-02"]) == span
+    assert schema["days"].validate(("2020-01-01", "2020-01-02", "2020-01-03"))[2] == date(2020, 1, 3)
+    assert schema["days"].validate(()) == ()
+
+    for value in [("2020-01-01",), ("2020-01-01", "2020-01-02", "2020-01-03"), ("2020-01-01", "a")]:
+        with pytest.raises(ValueError):
+            schema["span"].validate(value)
+
+
+def test_typed_set_types() -> None:
+    class TestSets:
+        tags: Set[str]
+        days: FrozenSet[date]
+
+    schema = build_schema(TestSets)
+    days = frozenset([date(2020, 1, 1), date(2020, 1, 2)])
+
+    assert isinstance(schema["days"]._type, mapping.FrozenSetMapping)
+    assert schema["tags"].validate(["a", "b"]) == {"a", "b"}
+    assert schema["days"].validate(["2020-01-01", date(2020, 1, 2)]) == days
+    assert sorted(schema["days"].serialise(days)) == ["2020-01-01", "2020-01-02"]
+    assert schema["days"].deserialise(["2020-01-01", "2020-01-02"]) == days
+
+    for value in [["a", "a"], ["a", 1], "a"]:
+        with pytest.raises(ValueError):
+            schema["tags"].validate(value)
+    with pytest.raises(ValueError):
+        schema["days"].validate(["2020-01-01", date(2020, 1, 1)])
+
+
+def test_dict_type() -> None:
+    class TestDict:
+        scores: Dict[str, int] = field(items={"minimum": 0})
+        days: Dict[date, timedelta]
+        labels: Mapping[str, str]
+
+    schema = build_schema(TestDict)
+    assert isinstance(schema["scores"]._type, mapping.DictMapping)
+    assert isinstance(schema["labels"]._type, mapping.DictMapping)
+
+    assert schema["scores"].validate({"a": 1}) == {"a": 1}
+    assert schema["days"].validate({"2020-01-01": "PT1H"}) == {date(2020, 1, 1): timedelta(hours=1)}
+    assert schema["days"].serialise({date(2020, 1, 1): timedelta(hours=1)}) == {"2020-01-01": "PT1H"}
+    assert schema["days"].deserialise({"2020-01-01": "PT1H"}) == {date(2020, 1, 1): timedelta(hours=1)}
+
+    for value in [{"a": -1}, {1: 1}, ["a"]]:
+        with pytest.raises(ValueError):
+            schema["scores"].validate(value)
+
+
+def test_dict_type_keeps_dicts_of_identity_types() -> None:
+    test = mapping.DictMapping(items=[mapping.StringMapping(), mapping.StringMapping()])
+    value = {str(index): str(index) for index in range(1000)}
+
+    assert test.validate(value) is value
+    assert test.serialise(value) is value
+    assert test.deserialise(value) is value
+
+    with pytest.raises(ValueError):
+        test.validate({**value, "a": 1})
+
+
+def test_typed_dict_type() -> None:
+    class Song(TypedDict, total=False):
+        title: str
+        released: date
+
+    class Album(TypedDict):
+        name: str
+        songs: List[Song]
+
+    class TestTypedDict:
+        album: Album
+
+    schema = build_schema(TestTypedDict)
+    song = {"title": "Song", "extra": 1}
+
+    assert isinstance(schema["album"]._type, mapping.TypedDictMapping)
+    assert schema["album"].validate({"name": "Album", "songs": [song]})["songs"][0] is song
+    assert schema["album"].validate({"name": "Album", "songs": [{"released": "2020-01-01"}]}) == {
+        "name": "Album",
+        "songs": [{"released": date(2020, 1, 1)}],
+    }
+    assert schema["album"].serialise({"name": "Album", "songs": [{"released": date(2020, 1, 1)}]}) == {
+        "name": "Album",
+        "songs": [{"released": "2020-01-01"}],
+    }
+    assert schema["album"].deserialise({"name": "Album", "songs": [{"released": "2020-01-01"}]}) == {
+        "name": "Album",
+        "songs": [{"released": date(2020, 1, 1)}],
+    }
+
+    for value in [{"name": "Album"}, {"name": 1, "songs": []}, {"name": "Album", "songs": [{"title": 1}]}, []]:
+        with pytest.raises(ValueError):
+            schema["album"].validate(value)
+
+
+def test_union_type() -> None:
+    test = mapping.UnionMapping(items=[mapping.UUIDMapping(), mapping.StringMapping(), mapping.DateTimeMapping()])
+    uuid = UUID("1f3f5e2b-4a3c-4d52-9d5c-5e4f8e2a1b3c")
+    moment = datetime(2020, 1, 1, 10)
+
+    assert test.validate(str(uuid)) == str(uuid)
+    assert test.validate(uuid) is uuid
+    assert test.validate(moment) is moment
+    assert test.dispatch[datetime][0] is test.items[2]
+    assert test.serialise(uuid) == str(uuid)
+    assert test.serialise(moment) == "2020-01-01T10:00:00"
+    assert test.serialise("text") == "text"
+
+    with pytest.raises(ValueError):
+        test.validate(1)
+
+
+def test_optional_containers_deserialise_items() -> None:
+    @dataclass(validate=False)
+    class Song:
+        title: str
+        released_at: datetime
+
+    class TestOptional:
+        songs: Optional[List[Song]]
+        plays: Optional[Dict[str, datetime]]
+
+    schema = build_schema(TestOptional)
+
+    songs = schema["songs"].deserialise([{"title": "Song A", "released_at": "2020-01-01T10:00:00"}])
+    plays = schema["plays"].deserialise({"Song A": "2020-01-01T10:00:00"})
+
+    assert isinstance(songs[0], Song)
+    assert songs[0].released_at == datetime(2020, 1, 1, 10)
+    assert plays == {"Song A": datetime(2020, 1, 1, 10)}
+
+
+def test_optional_type() -> None:
+    class TestOptional:
+        moment: Optional[datetime]
+        amount: Optional[int] = field(minimum=1)
+        parts: Union[int, float, None]
+
+    schema = build_schema(TestOptional)
+
+    assert schema["moment"].validate("2020-01-01T10:00:00") == datetime(2020, 1, 1, 10)
+    assert schema["moment"].validate(None) is None
+    assert schema["moment"].serialise(datetime(2020, 1, 1, 10)) == "2020-01-01T10:00:00"
+    assert schema["moment"].serialise(None) is None
+    assert schema["moment"].deserialise("2020-01-01T10:00:00") == datetime(2020, 1, 1, 10)
+    assert schema["moment"].deserialise(None) is None
+    assert schema["amount"].validate(2) == 2
+    assert schema["parts"].validate(1.5) == 1.5
+
+    with pytest.raises(ValueError):
+        schema["amount"].validate(0)
+
+
+def test_enum_type() -> None:
+    class Status(Enum):
+        ACTIVE = "active"
+        BLOCKED = "blocked"
+        ENABLED = "active"
+
+    test = mapping.EnumTypeMapping(enum_type=Status)
+
+    assert test.validate("active") is Status.ACTIVE
+    assert test.validate(Status.BLOCKED) is Status.BLOCKED
+    assert test.deserialise("blocked") is Status.BLOCKED
+    assert test.serialise(Status.ENABLED) == "active"
+
+    for value in ["ACTIVE", "enabled", ["active"]]:
+        with pytest.raises(ValueError):
+            test.validate(value)
+
+    by_name = mapping.EnumTypeMapping(enum_type=Status, by_name=True)
+    assert by_name.validate("Blocked") is Status.BLOCKED
+    assert by_name.validate("enabled") is Status.ACTIVE
+    assert by_name.deserialise("BLOCKED") is Status.BLOCKED
+
+
+def test_enum_type_falls_back_to_enum_class() -> None:
+    class Permission(Flag):
+        READ = 1
+        WRITE = 2
+
+    test = mapping.EnumTypeMapping(enum_type=Permission)
+
+    assert test.validate(3) is Permission.READ | Permission.WRITE
+    with pytest.raises(ValueError):
+        test.validate(8)
+
+
+def test_literal_type() -> None:
+    class TestLiteral:
+        kind: Literal["a", "b", 3]
+
+    schema = build_schema(TestLiteral)
+
+    assert isinstance(schema["kind"]._type, mapping.LiteralMapping)
+    assert schema["kind"].validate("a") == "a"
+    assert schema["kind"].validate(3) == 3
+
+    for value in ["c", None, ["a"]]:
+        with pytest.raises(ValueError, match="literals"):
+            schema["kind"].validate(value)
+
+
+def test_literal_type_does_not_coerce_numbers() -> None:
+    class TestLiteral:
+        flag: Literal[1, True]
+        ratio: Literal[0.5]
+
+    schema = build_schema(TestLiteral)
+
+    assert schema["flag"].validate(1) == 1
+    assert schema["flag"].validate(True) is True
+    assert schema["ratio"].validate(0.5) == 0.5
+
+    for value in [1.0, False, 0]:
+        with pytest.raises(ValueError, match="literals"):
+            schema["flag"].validate(value)
+    with pytest.raises(ValueError, match="literals"):
+        schema["ratio"].validate(Decimal("0.5"))
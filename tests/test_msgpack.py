@@ -0,0 +1,138 @@
+import ipaddress
+import json
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+from decimal import Decimal
+from typing import Any
+from typing import List
+from typing import Optional
+from uuid import UUID
+
+import pytest
+
+from gata import Dataclass
+from gata import dataclass
+from gata import msgpack_support
+from gata.errors import TypeValidationError
+
+BACKENDS = ["python"] + (["msgpack"] if msgpack_support.MSGPACK_SUPPORT else [])
+
+
+@dataclass
+class Event:
+    id: UUID
+    created_at: datetime
+    scheduled_on: date
+    starts_at: time
+    duration: timedelta
+    price: Decimal
+    payload: bytes
+    source: ipaddress.IPv4Address
+    target: ipaddress.IPv6Address
+
+
+@dataclass
+class Batch:
+    name: str
+    events: List[Event]
+    processed_at: Optional[datetime] = None
+
+
+def create_event() -> Event:
+    return Event(
+        id="cff801a5-5db7-4287-9414-64ba51a9a730",
+        created_at=datetime(2020, 10, 20, 10, 15, 30, 123456, tzinfo=timezone(timedelta(hours=2))),
+        scheduled_on="2020-10-21",
+        starts_at="12:30:00",
+        duration="PT1H30M",
+        price="10.50",
+        payload=b"\x00\x01\x02" * 100,
+        source="192.168.0.1",
+        target="::1",
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_msgpack_round_trip(backend: str) -> None:
+    batch = Batch(name="batch", events=[create_event(), create_event()], processed_at=datetime(2020, 10, 20))
+
+    data = batch.to_msgpack(backend=backend)
+    result = Batch.from_msgpack(data, backend=backend)
+
+    assert isinstance(data, bytes)
+    assert result == batch
+    assert result.events[0].created_at == batch.events[0].created_at
+    assert result.events[0].created_at.utcoffset() == timedelta(hours=2)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_msgpack_is_smaller_than_json(backend: str) -> None:
+    event = create_event()
+
+    assert len(event.to_msgpack(backend=backend)) < len(json.dumps(event.serialise()))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        -33,
+        2 ** 40,
+        -(2 ** 40),
+        1.5,
+        "a" * 40,
+        "a" * 70000,
+        b"a" * 300,
+        [1, [2, 3]],
+        {"a": {"b": list(range(20))}},
+        datetime(1900, 1, 1, 0, 0, 0, 1),
+        date(2020, 1, 1),
+        time(10, 20, 30, 40, tzinfo=timezone.utc),
+        timedelta(days=-3, seconds=5, microseconds=7),
+        Decimal("-1.000"),
+        UUID("cff801a5-5db7-4287-9414-64ba51a9a730"),
+        ipaddress.IPv4Address("10.0.0.1"),
+        ipaddress.IPv6Address("2001:db8::1"),
+    ],
+)
+def test_python_codec_round_trip(value: Any) -> None:
+    backend = msgpack_support.get_backend("python")
+
+    result = backend.unpackb(backend.packb(value, msgpack_support.encode_ext))
+
+    assert result == value
+    assert type(result) is type(value)
+
+
+def test_python_codec_packs_spec_compliant_output() -> None:
+    backend = msgpack_support.get_backend("python")
+
+    assert backend.packb({"a": [1, -1, None, True]}, msgpack_support.encode_ext) == b"\x81\xa1a\x94\x01\xff\xc0\xc3"
+    assert backend.packb(UUID(int=1), msgpack_support.encode_ext) == b"\xd8\x05" + UUID(int=1).bytes
+
+
+def test_from_msgpack_on_dataclass_base() -> None:
+    class Point(Dataclass):
+        x: int
+        created_at: datetime
+
+    point = Point(x=1, created_at="2020-10-20T10:00:00")
+
+    assert Point.from_msgpack(memoryview(point.to_msgpack())) == point
+
+
+def test_from_msgpack_fails_for_invalid_input() -> None:
+    backend = msgpack_support.get_backend("python")
+
+    with pytest.raises(TypeValidationError):
+        Batch.from_msgpack(backend.packb([1], msgpack_support.encode_ext), backend="python")
+
+    with pytest.raises(ValueError):
+        Batch.from_msgpack(b"\x81\xa1", backend="python")
+
+    with pytest.raises(TypeError):
+        backend.packb(object(), msgpack_support.encode_ext)
@@ -0,0 +1,139 @@
+import copy
+import pickle
+from datetime import datetime
+from typing import Any
+from typing import List
+from typing import Optional
+
+import pytest
+
+from gata import Dataclass
+from gata import dataclass
+
+
+@dataclass
+class Artist:
+    name: str
+    born: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Song:
+    title: str
+    released_at: datetime
+    artists: List[Artist]
+
+
+@dataclass(track_changes=True)
+class Playlist:
+    name: str
+    songs: List[Song]
+
+
+class Recording(Dataclass, frozen=True):
+    title: str
+    audio: bytes
+    # bytes fields validate bytearrays into bytes, writable buffer is kept in untyped field
+    cover: Any = None
+
+
+def create_song() -> Song:
+    return Song(
+        title="Black Dog", released_at="1971-11-08T00:00:00", artists=[{"name": "Led Zeppelin", "born": 1968}]
+    )
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_dataclass(protocol: int) -> None:
+    song = create_song()
+
+    result = pickle.loads(pickle.dumps(song, protocol=protocol))
+
+    assert isinstance(result, Song)
+    assert result == song
+    assert result.artists[0].name == "Led Zeppelin"
+    with pytest.raises(TypeError):
+        result.title = "Rock and Roll"
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_dataclass_base(protocol: int) -> None:
+    recording = Recording(title="Black Dog", audio=b"\x00\x01" * 1024, cover=bytearray(b"\xff"))
+
+    result = pickle.loads(pickle.dumps(recording, protocol=protocol))
+
+    assert isinstance(result, Recording)
+    assert result.audio == recording.audio
+    assert isinstance(result.audio, bytes)
+    assert isinstance(result.cover, bytearray)
+    assert result.cover == recording.cover
+
+
+def test_pickle_tracked_dataclass() -> None:
+    playlist = Playlist(name="Best of", songs=[create_song()])
+
+    result = pickle.loads(pickle.dumps(playlist))
+    assert result.__dict__["__gata_dirty__"] == set()
+
+    result.name = "Worst of"
+    assert result.__dict__["__gata_dirty__"] == {"name"}
+    assert result.serialise()["name"] == "Worst of"
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="out-of-band buffers require pickle protocol 5")
+def test_pickle_out_of_band_buffers() -> None:
+    recording = Recording(title="Black Dog", audio=b"\x00\x01" * 1024, cover=bytearray(b"\xff" * 16))
+    buffers: list = []
+
+    data = pickle.dumps(recording, protocol=5, buffer_callback=buffers.append)
+    result = pickle.loads(data, buffers=buffers)
+
+    assert len(buffers) == 2
+    assert len(data) < len(recording.audio)
+    assert result.audio == recording.audio
+    assert isinstance(result.audio, bytes)
+    assert isinstance(result.cover, bytearray)
+    assert result.cover == recording.cover
+
+
+def test_copy_dataclass() -> None:
+    song = create_song()
+
+    shallow = copy.copy(song)
+    deep = copy.deepcopy(song)
+
+    assert shallow == song
+    assert shallow.artists is song.artists
+    assert deep == song
+    assert deep.artists is not song.artists
+
+
+@dataclass
+class Counter:
+    n: int = 0
+
+    def __post_init__(self) -> None:
+        self.n += 1
+
+
+@dataclass
+class CachedArtist:
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._cache = {"upper": name.upper()}
+
+
+@pytest.mark.parametrize(
+    "restore",
+    [lambda value: pickle.loads(pickle.dumps(value)), copy.copy, copy.deepcopy],
+    ids=["pickle", "copy", "deepcopy"],
+)
+def test_restore_keeps_post_initialised_state(restore: Any) -> None:
+    counter = Counter()
+    artist = CachedArtist("Led Zeppelin")
+
+    assert counter.n == 1
+    assert restore(counter).n == 1
+    assert restore(artist)._cache == {"upper": "LED ZEPPELIN"}
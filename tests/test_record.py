@@ -0,0 +1,126 @@
+import ipaddress
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Dict
+from typing import List
+from typing import Optional
+from uuid import UUID
+
+import pytest
+
+from gata import dataclass
+from gata.errors import DeserialisationError
+from gata.errors import FieldError
+from gata.record import decode_record
+from gata.record import encode_record
+from gata.record import read_field
+
+
+class Genre(Enum):
+    ROCK = "rock"
+
+
+@dataclass
+class Artist:
+    name: str
+    born_on: Optional[date] = None
+
+
+@dataclass(frozen=True)
+class Album:
+    id: UUID
+    name: str
+    artist: Artist
+    genre: Genre
+    released_at: datetime
+    recorded_at: time
+    length: timedelta
+    price: Decimal
+    rating: float
+    copies: int
+    available: bool
+    cover: bytes
+    server: ipaddress.IPv4Address
+    mirror: ipaddress.IPv6Address
+    tags: List[str]
+    extra: Dict[str, int]
+    notes: Optional[str] = None
+    rank: Optional[int] = None
+
+
+def create_album() -> Album:
+    return Album(
+        id="cff801a5-5db7-4287-9414-64ba51a9a730",
+        name="Led Zeppelin I",
+        artist={"name": "Led Zeppelin", "born_on": date(1968, 9, 7)},
+        genre="rock",
+        released_at=datetime(1969, 1, 12, 10, 30, tzinfo=timezone.utc),
+        recorded_at="10:30:00",
+        length="PT44M",
+        price="10.50",
+        rating=4.5,
+        copies=10_000_000,
+        available=True,
+        cover=b"\x89PNG" * 10,
+        server="10.0.0.1",
+        mirror="::1",
+        tags=["rock", "blues"],
+        extra={"discs": 1},
+    )
+
+
+def test_record_round_trip() -> None:
+    album = create_album()
+
+    record = encode_record(album)
+    result = decode_record(Album, record)
+
+    assert isinstance(record, bytes)
+    assert result == album
+    assert result.notes is None
+    assert result.rank is None
+    with pytest.raises(TypeError):
+        result.name = "Led Zeppelin II"
+
+
+def test_read_single_field() -> None:
+    album = create_album()
+    record = memoryview(encode_record(album))
+
+    assert read_field(Album, record, "name") == "Led Zeppelin I"
+    assert read_field(Album, record, "copies") == 10_000_000
+    assert read_field(Album, record, "released_at") == album.released_at
+    assert read_field(Album, record, "artist") == album.artist
+    assert read_field(Album, record, "genre") is Genre.ROCK
+    assert read_field(Album, record, "notes") is None
+    assert read_field(Album, record, "rank") is None
+
+    with pytest.raises(KeyError):
+        read_field(Album, record, "unknown")
+
+
+def test_record_is_rejected_by_different_schema() -> None:
+    record = encode_record(Artist(name="Led Zeppelin"))
+
+    with pytest.raises(DeserialisationError):
+        decode_record(Album, record)
+
+    with pytest.raises(DeserialisationError):
+        decode_record(Artist, b"invalid record")
+
+
+@pytest.mark.parametrize("value", [2 ** 63, -(2 ** 63) - 1])
+def test_record_rejects_integers_out_of_int64_range(value: int) -> None:
+    @dataclass
+    class Counter:
+        count: int
+
+    assert decode_record(Counter, encode_record(Counter(count=2 ** 63 - 1))).count == 2 ** 63 - 1
+    with pytest.raises(FieldError) as error:
+        encode_record(Counter(count=value))
+    assert error.value.context["field_name"] == "count"
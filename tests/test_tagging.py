@@ -0,0 +1,135 @@
+from datetime import datetime
+from typing import List
+from typing import Optional
+
+import pytest
+
+from gata import Dataclass
+from gata import dataclass
+from gata import validate_dataclass
+from gata.errors import FieldError
+
+
+@dataclass(discriminator="type")
+class Event:
+    type: str
+    occurred_at: datetime
+
+
+@dataclass(tag="user.created")
+class UserCreated(Event):
+    user_id: int
+
+
+@dataclass(tag="user.deleted")
+class UserDeleted(Event):
+    user_id: int
+    reason: Optional[str] = None
+
+
+@dataclass
+class Batch:
+    events: List[Event]
+    last: Optional[Event] = None
+
+
+class Shape(Dataclass, discriminator="kind"):
+    kind: str
+
+
+class Circle(Shape, tag="circle"):
+    radius: float
+
+
+def test_subclass_extends_schema() -> None:
+    assert [name for name, _ in UserDeleted.__gata_schema__] == ["type", "occurred_at", "user_id", "reason"]
+    assert [name for name, _ in Event.__gata_schema__] == ["type", "occurred_at"]
+
+
+def test_subclass_defaults_to_its_tag() -> None:
+    event = UserCreated(occurred_at="2020-01-01T10:00:00", user_id=1)
+
+    assert event.type == "user.created"
+    assert event.serialise() == {"type": "user.created", "occurred_at": "2020-01-01T10:00:00", "user_id": 1}
+    assert Event.__gata_schema__["type"] is not UserCreated.__gata_schema__["type"]
+
+
+def test_deserialise_selects_tagged_class() -> None:
+    event = Event.deserialise({"type": "user.deleted", "occurred_at": "2020-01-01T10:00:00", "user_id": 1})
+
+    assert isinstance(event, UserDeleted)
+    assert event.occurred_at == datetime(2020, 1, 1, 10)
+    assert Event.__gata_tags__ == {"user.created": UserCreated, "user.deleted": UserDeleted}
+    payload = '{"type": "user.created", "occurred_at": "2020-01-01T10:00:00", "user_id": 2}'
+    assert isinstance(Event.from_json(payload), UserCreated)
+
+
+def test_tagged_fields() -> None:
+    batch = Batch(
+        events=[
+            {"type": "user.created", "occurred_at": "2020-01-01T10:00:00", "user_id": 1},
+            {"type": "user.deleted", "occurred_at": "2020-01-01T11:00:00", "user_id": 1, "reason": "spam"},
+        ],
+        last={"type": "user.created", "occurred_at": "2020-01-01T12:00:00", "user_id": 2},
+    )
+
+    assert [type(event) for event in batch.events] == [UserCreated, UserDeleted]
+    assert isinstance(batch.last, UserCreated)
+    assert batch.serialise()["events"][1]["reason"] == "spam"
+
+
+def test_unknown_tag() -> None:
+    with pytest.raises(FieldError) as error:
+        Event.deserialise({"type": "user.updated", "occurred_at": "2020-01-01T10:00:00"})
+    assert error.value.context == {"field_name": "type", "tag": "user.updated"}
+
+    # tags of other branches are not accepted
+    with pytest.raises(FieldError) as error:
+        UserCreated.deserialise({"type": "user.deleted", "occurred_at": "2020-01-01T10:00:00", "user_id": 1})
+    assert error.value.caused_by.code == "tag_branch_error"
+    assert "`user.deleted` is type tag of `UserDeleted`, which does not extend `UserCreated`" in str(error.value)
+
+
+def test_tag_mismatch() -> None:
+    with pytest.raises(FieldError) as error:
+        UserCreated(type="user.deleted", occurred_at="2020-01-01T10:00:00", user_id=1)
+    assert error.value.caused_by.code == "tag_mismatch_error"
+    assert error.value.context == {"field_name": "type", "tag": "user.deleted", "expected_tag": "user.created"}
+
+    with pytest.raises(FieldError):
+        Circle.from_json('{"kind": "square", "radius": 1.0}')
+    with pytest.raises(FieldError):
+        UserCreated.validate({"type": "user.deleted", "occurred_at": "2020-01-01T10:00:00", "user_id": 1})
+
+    event = UserCreated(occurred_at="2020-01-01T10:00:00", user_id=1)
+    event.type = "user.deleted"
+    with pytest.raises(FieldError):
+        validate_dataclass(event)
+
+
+def test_invalid_declarations() -> None:
+    with pytest.raises(ValueError):
+
+        @dataclass(discriminator="kind")
+        class Message:
+            type: str
+
+    with pytest.raises(ValueError):
+
+        @dataclass(tag="user.created")
+        class Duplicate(Event):
+            pass
+
+    with pytest.raises(ValueError):
+
+        @dataclass(tag="orphan")
+        class Orphan:
+            type: str
+
+
+def test_dataclass_base_class() -> None:
+    shape = Shape.deserialise({"kind": "circle", "radius": 2.0})
+
+    assert isinstance(shape, Circle)
+    assert shape.radius == 2.0
+    assert Circle(radius=1.0).kind == "circle"
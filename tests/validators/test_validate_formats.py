@@ -0,0 +1,116 @@
+import random
+import time
+
+import pytest
+
+from gata import formats
+from gata.validators import EMAIL_REGEX
+from gata.validators import HOSTNAME_REGEX
+from gata.validators import URI_REGEX
+from gata.validators import URL_REGEX
+
+MATCHERS = [
+    pytest.param(formats.is_email, EMAIL_REGEX, id="email"),
+    pytest.param(formats.is_hostname, HOSTNAME_REGEX, id="hostname"),
+    pytest.param(formats.is_uri, URI_REGEX, id="uri"),
+    pytest.param(formats.is_url, URL_REGEX, id="url"),
+]
+
+SCHEMES = ["http://", "HTTPS://", "ftp://", "httpſ://", "hxxp://", "mailto:", "a+b.c-d:", "1a:", ""]
+USERS = ["", "user@", "user:password@", "a@b@", "@", "us er@", "user:@"]
+HOSTS = [
+    "example.com",
+    "sub.exa-mple.co.uk",
+    "ex--ample.com",
+    "-example.com",
+    "example-.com",
+    "a_b.ſK",
+    "İı.com",
+    "münchen.de",
+    "x.é",
+    "x.y1",
+    "host",
+    "1.2.3.4",
+    "223.255.255.254",
+    "224.1.1.1",
+    "1.1.1.255",
+    "0.1.1.1",
+    "1.001.1.1",
+    "1.256.1.1",
+    "١.٢.٣.٤",
+    "10.0.0.1",
+    "127.0.0.1",
+    "169.254.1.1",
+    "192.168.1.1",
+    "172.16.0.1",
+    "172.31.0.1",
+    "172.32.0.1",
+    "172.160.0.1",
+    "exa　mple.com",
+]
+TAILS = ["", ":80", ":8", ":65535", ":123456", ":٨٠", "/", "/a b", "/path?q=1#x", "\n", "/x\n", "\n\n", " ", ":80/p"]
+
+
+def _corpus():
+    for scheme in SCHEMES:
+        for user in USERS:
+            for host in HOSTS:
+                for tail in TAILS:
+                    yield scheme + user + host + tail
+
+
+def _random_values(count):
+    generator = random.Random(20)
+    alphabet = list("aZ09-._@:/+ \n\t") + ["İ", "ı", "ſ", "K", "٣", "１", "　", "é", "\U0001f600"]
+    fragments = SCHEMES + USERS + HOSTS + TAILS
+    for _ in range(count):
+        parts = []
+        for _ in range(generator.randint(0, 4)):
+            if generator.random() < 0.5:
+                parts.append(generator.choice(fragments))
+            else:
+                parts.append("".join(generator.choice(alphabet) for _ in range(generator.randint(1, 4))))
+        yield "".join(parts)
+
+
+@pytest.mark.parametrize("matcher, regex", MATCHERS)
+def test_matcher_accepts_the_same_values_as_regex(matcher, regex):
+    for value in _corpus():
+        assert matcher(value) is bool(regex.match(value)), value
+
+
+@pytest.mark.parametrize("matcher, regex", MATCHERS)
+def test_matcher_accepts_the_same_random_values_as_regex(matcher, regex):
+    for value in _random_values(5000):
+        assert matcher(value) is bool(regex.match(value)), value
+
+
+@pytest.mark.parametrize("label", ["a" * 62 + "b", "a" * 63 + "b", "a" + "-" * 61 + "b", "a" + "-" * 62 + "b"])
+@pytest.mark.parametrize("matcher, regex", MATCHERS[:2])
+def test_matcher_limits_label_length_like_regex(matcher, regex, label):
+    for value in [f"{label}.com", f"email@{label}.com", f"email@example.{label}"]:
+        assert matcher(value) is bool(regex.match(value)), value
+
+
+@pytest.mark.parametrize("matcher", [formats.is_email, formats.is_hostname, formats.is_uri, formats.is_url])
+def test_matcher_rejects_non_string_values(matcher):
+    with pytest.raises(TypeError):
+        matcher(b"example.com")
+
+
+@pytest.mark.parametrize(
+    "matcher, value",
+    [
+        (formats.is_email, "a@" + "a-" * 20000 + "!"),
+        (formats.is_hostname, "a" + "-a" * 20000 + "!"),
+        (formats.is_uri, "a" * 40000 + " "),
+        (formats.is_url, "http://" + "a@" * 20000),
+        (formats.is_url, "http://" + "a-" * 20000 + "!"),
+        (formats.is_url, "http://" + "a." * 20000 + "!"),
+        (formats.is_url, "http://" + "@:" * 20000),
+    ],
+)
+def test_matcher_runs_in_linear_time(matcher, value):
+    start = time.perf_counter()
+    assert not matcher(value)
+    assert time.perf_counter() - start < 0.5
@@ -14,6 +14,9 @@ def test_validate_frozenset():
     with pytest.raises(ValueError):
         validate_frozenset("a")
 
+    with pytest.raises(ValueError):
+        validate_frozenset([1, 2, 1])
+
     assert validate_frozenset({1, 2, 3}, validate_integer)
 
     assert validate_frozenset([1, 2, 3]) == frozenset([1, 2, 3])
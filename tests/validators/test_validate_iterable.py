@@ -1,6 +1,6 @@
 import pytest
 
-from gata.validators import validate_iterable
+from gata.validators import validate_integer, validate_iterable, validate_iterable_items, validate_string
 
 
 def test_valid_array():
@@ -13,3 +13,12 @@ def test_valid_array():
 
     with pytest.raises(ValueError):
         validate_iterable("a")
+
+
+def test_validate_iterable_items_keeps_unchanged_values():
+    value = [1, 2, 3]
+
+    assert validate_iterable_items(value, validate_integer) is value
+    assert validate_iterable_items(value, str) == ["1", "2", "3"]
+    assert validate_iterable_items({"a", "b"}, validate_string) == {"a", "b"}
+    assert validate_iterable_items((1, 2), validate_integer) == [1, 2]
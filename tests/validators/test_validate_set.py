@@ -14,6 +14,9 @@ def test_validate_set():
     with pytest.raises(ValueError):
         validate_set("a")
 
+    with pytest.raises(ValueError):
+        validate_set([1, 2, 1])
+
     assert validate_set({1, 2, 3}, validate_integer)
 
     assert validate_set([1, 2, 3]) == {1, 2, 3}
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 import pytest
 
 from gata.errors import ValidationError
@@ -17,6 +19,7 @@ from gata.validators import validate_uuid
         "479908f7-4004-4671-9608-6a6672028db3",
         "5b92ff61-c940-4771-8a35-7dab65d43f29",
         "bb2e4878-4bb2-440d-90ef-ba2724c1e8c2",
+        UUID("bb2e4878-4bb2-440d-90ef-ba2724c1e8c2"),
     ),
 )
 def test_valid_values(value: str):